@@ -0,0 +1,120 @@
+"""Kıyaslamalar için tohumlu sentetik çalışma geçmişi üreteci.
+
+Geçmiş bugünden (veya --end gününden) geriye doğru --years yıl boyunca üretilir.
+Günlük seans sayısı ortalaması --per-day olan bir dağılımdan çekilir:
+
+- hafta sonları daha az çalışılır, günlerin bir kısmı (tatil) tamamen boştur,
+- seanslar sabah başlar; sığıyorsa pomodoro ve mola süreleriyle art arda dizilir,
+  günde binlerce seans gibi sığmayan yoğunluklarda gün içine rastgele dağıtılır,
+- seansların çoğu tamamlanmış 25 dakikalık çalışmadır, bir kısmı yarıda kesilir.
+
+Aynı tohum ve parametreler her zaman aynı geçmişi üretir. Satırlar
+DatabaseManager.import_sessions ile tek işlemde eklenir.
+
+Kullanım:
+    python benchmarks/history.py --years 5 --per-day 12 --seed 1 --output scratch.db
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core.database import DatabaseManager, to_epoch
+
+# Hafta günü (Pazartesi=0) başına çalışma yoğunluğu çarpanı
+WEEKDAY_FACTORS = (1.0, 1.0, 1.0, 1.0, 0.9, 0.5, 0.3)
+DAY_OFF_PROBABILITY = 0.08
+# Günün çalışılabilen kısmı: 08:00-24:00 (saniye)
+DAY_START = 8 * 3600
+DAY_WINDOW = 16 * 3600
+
+WORK_DURATION = 25 * 60
+SHORT_BREAK = 5 * 60
+LONG_BREAK = 15 * 60
+INCOMPLETE_PROBABILITY = 0.1
+
+
+def _session_count(rng, weekday, per_day):
+    """Günün seans sayısı; hafta sonu ve tatiller daha az."""
+    if rng.random() < DAY_OFF_PROBABILITY:
+        return 0
+    mean = per_day * WEEKDAY_FACTORS[weekday]
+    count = int(round(rng.gauss(mean, mean * 0.3)))
+    return max(0, min(count, DAY_WINDOW))
+
+
+def _start_offsets(rng, count):
+    """Seansların gün başından itibaren başlangıç saniyeleri (artan sırada)."""
+    # Seans ve ardından gelen en uzun molanın kapladığı süre
+    slot = WORK_DURATION + LONG_BREAK + 120
+    if count * slot <= DAY_WINDOW:
+        # Seyrek gün: sabah bir saatte başla, seansları molalarla diz.
+        offset = DAY_START + rng.randrange(0, max(1, min(3 * 3600, DAY_WINDOW - count * slot)))
+        offsets = []
+        for index in range(count):
+            offsets.append(offset)
+            offset += WORK_DURATION + (LONG_BREAK if index % 4 == 3 else SHORT_BREAK)
+            offset += rng.randrange(0, 120)
+        return offsets
+    # Yoğun gün: seanslar çakışabilir, başlangıçlar yine de tekildir.
+    return sorted(DAY_START + offset for offset in rng.sample(range(DAY_WINDOW), count))
+
+
+def iter_history(years, per_day, seed=0, end_date=None):
+    """import_sessions demetlerini (start, end, utc_offset, süre, tamamlandı, tür) üret."""
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    day = end_date - timedelta(days=int(round(years * 365.25)) - 1)
+    while day <= end_date:
+        count = _session_count(rng, day.weekday(), per_day)
+        if count:
+            # Gün başının epoch değeri bir kez hesaplanır; gün içi yaz saati
+            # geçişleri kıyaslama için önemsizdir.
+            midnight, utc_offset = to_epoch(datetime(day.year, day.month, day.day))
+            for offset in _start_offsets(rng, count):
+                start = midnight + offset
+                if rng.random() < INCOMPLETE_PROBABILITY:
+                    duration = rng.randrange(60, WORK_DURATION)
+                    yield start, start + duration, utc_offset, duration, 0, 'work'
+                else:
+                    yield start, start + WORK_DURATION, utc_offset, WORK_DURATION, 1, 'work'
+        day += timedelta(days=1)
+
+
+def generate_history(db_manager, years, per_day, seed=0, end_date=None):
+    """Veritabanını sentetik geçmişle doldur; eklenen seans sayısını döndür."""
+    inserted, _ = db_manager.import_sessions(iter_history(years, per_day, seed, end_date))
+    return inserted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik çalışma geçmişi üret")
+    parser.add_argument("--years", type=float, default=5, help="Geçmişin uzunluğu (yıl)")
+    parser.add_argument("--per-day", type=float, default=12, help="Günlük ortalama seans sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--end", type=date.fromisoformat, help="Son gün (YYYY-AA-GG, varsayılan: bugün)")
+    parser.add_argument("--output", required=True, help="Oluşturulacak veritabanı dosyası")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.output):
+        print(f"{args.output} zaten var; üzerine yazılmaz.", file=sys.stderr)
+        return 1
+
+    db_manager = DatabaseManager(os.path.abspath(args.output))
+    db_manager.setup_database()
+    started = time.perf_counter()
+    try:
+        count = generate_history(db_manager, args.years, args.per_day, args.seed, args.end)
+    finally:
+        db_manager.close()
+    print(f"{count} seans {time.perf_counter() - started:.1f} sn içinde üretildi.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
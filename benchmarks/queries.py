@@ -0,0 +1,271 @@
+"""Sorgu ve çizim sürelerinin geçmiş büyüklüğüyle nasıl değiştiğini ölçen kıyaslama.
+
+Her --years/--per-day birleşimi için geçici bir veritabanı benchmarks/history.py
+ile tohumlu sentetik geçmişle doldurulur ve şu senaryolar ekransız (offscreen)
+Qt platformunda ölçülür:
+
+- get_statistics: 7 gün, 30 gün, 1 yıl ve tüm geçmiş; tüm geçmiş ayrıca hafta,
+  ay ve yıl ayrıntısıyla
+- get_sessions_by_date: rastgele bir gün
+- update_calendar: rastgele bir ay; ay önbelleği boşken (cold) ve doluyken
+  (cached), ay özeti ve gün listesi gösterilene kadar
+- collect_statistics: İstatistikler sekmesinin sorgu ve hesaplama kısmı
+- plot_graph: her grafik çizicisi için _plot_graph ve ardından eşzamanlı çizim
+
+Sorgu önbelleği kapalıdır (cache_size=0); her ölçüm veritabanına gider. Süreler
+milisaniye cinsinden yüzdelikler olarak JSON'a yazılır.
+
+Kullanım:
+    python benchmarks/queries.py --years 1 5 20 --per-day 12 1000 --iterations 30 --output queries.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("POMODORO_DISABLE_SOUND", "1")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from PyQt6.QtCore import QDate, QEventLoop, QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from core.daily_totals import DailyTotals
+from core.database import DatabaseManager
+from ui.calendar_widget import CalendarWidget
+from ui.charts import CHART_RENDERERS
+from ui.statistics_widget import VIEW_DAILY, VIEW_ROLLING_7, StatisticsWidget
+
+from history import generate_history
+from startup import git_revision
+
+# get_statistics senaryoları: (ad, gün sayısı; None = tüm geçmiş, ayrıntı düzeyi)
+STATISTICS_RANGES = [
+    ("7d", 7, 'day'),
+    ("30d", 30, 'day'),
+    ("1y", 365, 'day'),
+    ("all", None, 'day'),
+    ("all", None, 'week'),
+    ("all", None, 'month'),
+    ("all", None, 'year'),
+]
+# İstatistikler sekmesi senaryoları: (ad, gün sayısı; None = tüm geçmiş, görünüm)
+CHART_CASES = [
+    ("30d-daily", 30, VIEW_DAILY),
+    ("1y-daily", 365, VIEW_DAILY),
+    ("1y-rolling7", 365, VIEW_ROLLING_7),
+    ("all-daily", None, VIEW_DAILY),
+]
+PERCENTILES = (50, 90, 99)
+
+
+def summarize(samples):
+    """Örneklerin yüzdelik, en küçük, en büyük ve ortalama değerleri (ms)."""
+    ordered = sorted(samples)
+    summary = {}
+    for p in PERCENTILES:
+        # En yakın sıra yöntemi
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        summary[f"p{p}_ms"] = ordered[rank - 1]
+    summary["min_ms"] = ordered[0]
+    summary["max_ms"] = ordered[-1]
+    summary["mean_ms"] = sum(ordered) / len(ordered)
+    summary["samples"] = len(ordered)
+    return summary
+
+
+def timed(fn):
+    """fn'i çalıştır; geçen süreyi milisaniye olarak döndür."""
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def drain(app):
+    """Arka plan işlerinin bitmesini bekle ve sonuçlarını teslim et."""
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def wait_for(app, loader, *keys):
+    """Yükleyicinin verilen anahtarlardaki sonuçları teslim edilene kadar bekle."""
+    while any(loader.is_pending(key) for key in keys):
+        app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+
+
+def random_day(rng, first_day, last_day):
+    return first_day + timedelta(days=rng.randrange((last_day - first_day).days + 1))
+
+
+def date_range(rng, first_day, last_day, days):
+    """Geçmiş içinde rastgele bitişli days günlük aralık; None ise tüm geçmiş."""
+    if days is None or days > (last_day - first_day).days:
+        return first_day, last_day
+    end = random_day(rng, first_day + timedelta(days=days - 1), last_day)
+    return end - timedelta(days=days - 1), end
+
+
+def bench_queries(db_manager, rng, iterations, first_day, last_day):
+    samples = {}
+    for _ in range(iterations):
+        for name, days, granularity in STATISTICS_RANGES:
+            start, end = date_range(rng, first_day, last_day, days)
+            samples.setdefault(f"get_statistics[{name}/{granularity}]", []).append(
+                timed(lambda: db_manager.get_statistics(start, end, granularity)))
+
+        day = random_day(rng, first_day, last_day)
+        samples.setdefault("get_sessions_by_date", []).append(
+            timed(lambda: db_manager.get_sessions_by_date(day)))
+    return samples
+
+
+def bench_calendar(app, db_manager, rng, iterations, first_day, last_day):
+    widget = CalendarWidget(db_manager, DailyTotals(db_manager))
+    widget.resize(800, 600)
+    widget.show()
+    drain(app)
+
+    def update():
+        widget.update_calendar()
+        wait_for(app, widget._loader, "month", "day")
+
+    samples = {}
+    for _ in range(iterations):
+        day = random_day(rng, first_day, last_day)
+        # Sayfa değişimi kendi yüklemesini başlatmasın; ölçülen yalnızca update_calendar.
+        widget.calendar.blockSignals(True)
+        widget.calendar.setCurrentPage(day.year, day.month)
+        widget.calendar.setSelectedDate(QDate(day.year, day.month, day.day))
+        widget.calendar.blockSignals(False)
+
+        widget._month_cache.clear()
+        samples.setdefault("update_calendar[cold]", []).append(timed(update))
+        # Komşu ayların önceden yüklenmesi bir sonraki ölçüme karışmasın.
+        drain(app)
+        samples.setdefault("update_calendar[cached]", []).append(timed(update))
+        drain(app)
+
+    widget.close()
+    widget.deleteLater()
+    drain(app)
+    return samples
+
+
+def bench_statistics(app, db_manager, rng, iterations, first_day, last_day):
+    widget = StatisticsWidget(db_manager)
+    widget.resize(900, 600)
+    widget.show()
+    drain(app)
+
+    samples = {}
+    charts = []
+    for name, days, view in CHART_CASES:
+        widget.view_combo.setCurrentIndex(view)
+        drain(app)
+        for _ in range(iterations):
+            start, end = date_range(rng, first_day, last_day, days)
+            samples.setdefault(f"collect_statistics[{name}]", []).append(
+                timed(lambda: charts.append((name, view, widget._collect_statistics(start, end, view)))))
+    charts = [(name, view, result[1]) for name, view, result in charts if result is not None]
+
+    for renderer in CHART_RENDERERS:
+        db_manager.update_settings({'chart_renderer': renderer})
+        widget.apply_settings()
+        drain(app)
+        if widget.renderer_name != renderer:
+            # Çizici kullanılamıyor (ör. matplotlib kurulu değil).
+            continue
+        for name, view, chart in charts:
+            widget.view_combo.blockSignals(True)
+            widget.view_combo.setCurrentIndex(view)
+            widget.view_combo.blockSignals(False)
+
+            def plot():
+                widget._plot_graph(chart)
+                widget.canvas.repaint()
+            samples.setdefault(f"plot_graph[{renderer}/{name}]", []).append(timed(plot))
+
+    widget.close()
+    widget.deleteLater()
+    drain(app)
+    return samples
+
+
+def run_history(app, years, per_day, iterations, seed):
+    """Bir geçmiş büyüklüğü için veritabanını üret ve tüm senaryoları ölç."""
+    with tempfile.TemporaryDirectory() as scratch:
+        db_manager = DatabaseManager(os.path.join(scratch, "pomodoro.db"), cache_size=0)
+        db_manager.setup_database()
+
+        last_day = date.today()
+        first_day = last_day - timedelta(days=int(round(years * 365.25)) - 1)
+        started = time.perf_counter()
+        sessions = generate_history(db_manager, years, per_day, seed, last_day)
+        generate_ms = (time.perf_counter() - started) * 1000.0
+
+        rng = random.Random(seed)
+        samples = {}
+        try:
+            samples.update(bench_queries(db_manager, rng, iterations, first_day, last_day))
+            samples.update(bench_calendar(app, db_manager, rng, iterations, first_day, last_day))
+            samples.update(bench_statistics(app, db_manager, rng, iterations, first_day, last_day))
+        finally:
+            db_manager.close()
+
+    return {
+        "years": years,
+        "per_day": per_day,
+        "sessions": sessions,
+        "generate_ms": generate_ms,
+        "scenarios": {name: summarize(values) for name, values in samples.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sorgu ve çizim süresi kıyaslaması")
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5],
+                        help="Ölçülecek geçmiş uzunlukları (yıl)")
+    parser.add_argument("--per-day", type=float, nargs="+", default=[12],
+                        help="Ölçülecek günlük ortalama seans sayıları")
+    parser.add_argument("--iterations", type=int, default=30, help="Senaryo başına ölçüm sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--output", help="JSON çıktısının yazılacağı dosya (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+
+    histories = []
+    for years in args.years:
+        for per_day in args.per_day:
+            print(f"{years} yıl, günde {per_day} seans ölçülüyor...", file=sys.stderr)
+            histories.append(run_history(app, years, per_day, args.iterations, args.seed))
+
+    report = {
+        "benchmark": "queries",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "histories": histories,
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
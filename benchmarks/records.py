@@ -0,0 +1,156 @@
+"""Sorgu sonucu biçimlerinin satır başına bellek ve dolaşma maliyetini ölçen kıyaslama.
+
+Sentetik geçmişle doldurulan geçici bir veritabanında aynı sorgular üç biçimde
+okunur: sqlite3.Row listesi, kayıt listesi (core.records) ve sütunlu sonuç
+(StatisticsColumns). Her biçim için şunlar ölçülür:
+
+- fetch: sorgu ve sonucun oluşturulması
+- iterate: tüm satırlarda süre alanının toplanması
+- bytes_per_row: sonucun tracemalloc ile ölçülen satır başına bellek kullanımı
+
+Kayıt sınıfları sqlite3.Row'a göre özellikle dolaşmada hızlıdır; satır başına
+bellekte ise belirgin bir kazanç beklenmemelidir. Kısa satırlarda (istatistikler)
+StatRecord, Python sürümüne göre sqlite3.Row'dan daha fazla yer tutabilir.
+Satır başına belleği asıl düşüren sütunlu sonuçtur; uzun aralıkları okuyan
+istatistik sekmesi ve takvim bu biçimi kullanır.
+
+Kullanım:
+    python benchmarks/records.py --years 20 --per-day 12 --runs 5 --output records.json
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core.database import DatabaseManager
+from core.records import SESSION_FIELDS, StatisticsColumns, session_record, stat_record
+
+from history import generate_history
+from startup import git_revision
+
+SESSIONS_QUERY = f"SELECT {', '.join(SESSION_FIELDS)} FROM work_sessions ORDER BY start_time"
+STATISTICS_QUERY = ("SELECT day AS work_date, total_duration, session_count "
+                    "FROM daily_totals ORDER BY day")
+
+
+def fetch_rows(conn, query, row_factory):
+    cursor = conn.cursor()
+    cursor.row_factory = row_factory
+    return cursor.execute(query).fetchall()
+
+
+def fetch_columns(conn):
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return StatisticsColumns.from_rows(cursor.execute(STATISTICS_QUERY).fetchall())
+
+
+# (sonuç adı, yükleyici, süre toplayıcı)
+CASES = [
+    ("sessions/sqlite3.Row",
+     lambda conn: fetch_rows(conn, SESSIONS_QUERY, sqlite3.Row),
+     lambda rows: sum(row['duration'] for row in rows)),
+    ("sessions/SessionRecord",
+     lambda conn: fetch_rows(conn, SESSIONS_QUERY, session_record),
+     lambda rows: sum(row.duration for row in rows)),
+    ("statistics/sqlite3.Row",
+     lambda conn: fetch_rows(conn, STATISTICS_QUERY, sqlite3.Row),
+     lambda rows: sum(row['total_duration'] for row in rows)),
+    ("statistics/StatRecord",
+     lambda conn: fetch_rows(conn, STATISTICS_QUERY, stat_record),
+     lambda rows: sum(row.total_duration for row in rows)),
+    ("statistics/StatisticsColumns",
+     fetch_columns,
+     lambda columns: sum(columns.total_duration)),
+]
+
+
+def measure_memory(conn, load):
+    """Sonucun satır sayısını ve satır başına ayrılan belleği döndür."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = load(conn)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return len(result), (after - before) / max(1, len(result))
+
+
+def summarize(samples):
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sorgu sonucu biçimleri kıyaslaması")
+    parser.add_argument("--years", type=float, default=20, help="Geçmişin uzunluğu (yıl)")
+    parser.add_argument("--per-day", type=float, default=12, help="Günlük ortalama seans sayısı")
+    parser.add_argument("--runs", type=int, default=5, help="Ölçüm sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--output", help="JSON çıktısının yazılacağı dosya (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        db_manager = DatabaseManager(os.path.join(scratch, "pomodoro.db"))
+        db_manager.setup_database()
+        generate_history(db_manager, args.years, args.per_day, args.seed)
+
+        try:
+            with db_manager.connections.reader() as conn:
+                for name, load, total in CASES:
+                    rows, bytes_per_row = measure_memory(conn, load)
+                    fetch_samples = []
+                    iterate_samples = []
+                    for _ in range(args.runs):
+                        started = time.perf_counter()
+                        result = load(conn)
+                        fetched = time.perf_counter()
+                        total(result)
+                        iterate_samples.append((time.perf_counter() - fetched) * 1000.0)
+                        fetch_samples.append((fetched - started) * 1000.0)
+                        del result
+                    results[name] = {
+                        "rows": rows,
+                        "bytes_per_row": bytes_per_row,
+                        "fetch": summarize(fetch_samples),
+                        "iterate": summarize(iterate_samples),
+                    }
+        finally:
+            db_manager.close()
+
+    report = {
+        "benchmark": "records",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "years": args.years,
+        "per_day": args.per_day,
+        "runs": args.runs,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""Uygulamanın açılış süresini ölçen kıyaslama aracı.
+
+Uygulama ekransız (offscreen) Qt platformunda ayrı bir süreçte ``-X importtime``
+ile, main.main() üzerinden gerçek açılış yoluyla çalıştırılır; veritabanı
+kopyası POMODORO_STORAGE ile verilir. Her çalıştırmada şu aşamaların süreç başlangıcından itibaren
+geçen süresi kaydedilir:
+
+- imports: PyQt6 ve uygulama modüllerinin içe aktarılması
+- qapplication: QApplication oluşturulması
+- database: deponun açılması (open_store ve setup_database)
+- main_window: MainWindow oluşturulması
+- first_window: pencerenin ilk kez çizilmesi (time-to-first-window)
+- interactive: ilk çizimden sonra olay döngüsünün boşa düşmesi (time-to-interactive)
+- statistics_tab: (--open-statistics ile) İstatistikler sekmesinin hazır olması
+
+Kullanım:
+    python benchmarks/startup.py --runs 5 --output startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alt süreçte çalışan ölçüm betiği. Aşama zamanları JSON olarak stdout'a yazılır.
+CHILD_SCRIPT = r'''
+import json, sys, time
+marks = {"process_start": float(sys.argv[1])}
+open_statistics = sys.argv[2] == "1"
+sys.argv = sys.argv[:1]
+def mark(name):
+    marks[name] = time.time()
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+import main
+mark("imports")
+
+def on_stage(name, value):
+    mark(name)
+    if name == "main_window":
+        watch(value)
+
+def watch(window):
+    app = main.QApplication.instance()
+
+    def finish():
+        # Pencere kapanırken depo da kapatılır.
+        window.close()
+        app.quit()
+
+    def on_statistics_ready(widget):
+        # Widget kendi istatistiklerini arka planda yükler; sonuç gelince bitir.
+        def poll():
+            if widget.loading_label.isVisible():
+                QTimer.singleShot(1, poll)
+            else:
+                mark("statistics_tab")
+                finish()
+        poll()
+
+    def on_interactive():
+        mark("interactive")
+        if open_statistics:
+            window.statistics_tab.loaded.connect(on_statistics_ready)
+            window.tab_widget.setCurrentIndex(2)
+        else:
+            finish()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "first_window" not in marks:
+                mark("first_window")
+                QTimer.singleShot(0, on_interactive)
+            return False
+
+    window.first_paint = FirstPaint()
+    window.installEventFilter(window.first_paint)
+
+try:
+    main.main(on_stage=on_stage)
+except SystemExit:
+    pass
+print("STARTUP_MARKS " + json.dumps(marks))
+'''
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr_text):
+    """-X importtime çıktısını modül başına (self_us, cumulative_us, derinlik) listesine çevir."""
+    modules = []
+    for line in stderr_text.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({
+            "module": name,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": (len(indent) - 1) // 2,
+        })
+    return modules
+
+
+def group_by_package(modules):
+    """Modüllerin kendi sürelerini kök pakete göre topla (milisaniye)."""
+    totals = {}
+    for module in modules:
+        package = module["module"].split(".")[0]
+        totals[package] = totals.get(package, 0) + module["self_us"]
+    return {package: us / 1000.0 for package, us in totals.items()}
+
+
+def run_once(db_path, open_statistics):
+    """Uygulamayı bir kez başlat; aşama sürelerini ve import kayıtlarını döndür."""
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["POMODORO_DISABLE_SOUND"] = "1"
+    env["POMODORO_STORAGE"] = "sqlite:" + db_path
+
+    started = time.time()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT,
+         repr(started), "1" if open_statistics else "0"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    marks = None
+    for line in result.stdout.splitlines():
+        if line.startswith("STARTUP_MARKS "):
+            marks = json.loads(line[len("STARTUP_MARKS "):])
+    if marks is None:
+        raise RuntimeError("Alt süreç ölçüm sonucu üretmedi:\n" + result.stderr[-2000:])
+
+    process_start = marks.pop("process_start")
+    phases = {name: (value - process_start) * 1000.0 for name, value in marks.items()}
+    return phases, parse_importtime(result.stderr)
+
+
+def summarize(samples):
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "samples_ms": samples,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Açılış süresi kıyaslaması")
+    parser.add_argument("--runs", type=int, default=5, help="Çalıştırma sayısı")
+    parser.add_argument("--db", default=os.path.join(REPO_ROOT, "data", "pomodoro.db"),
+                        help="Kopyası kullanılacak veritabanı")
+    parser.add_argument("--open-statistics", action="store_true",
+                        help="İstatistikler sekmesinin açılışını da ölç")
+    parser.add_argument("--top", type=int, default=25, help="Listelenecek en yavaş paket/modül sayısı")
+    parser.add_argument("--output", help="JSON çıktısının yazılacağı dosya (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    phase_samples = {}
+    package_samples = {}
+    module_samples = {}
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for _ in range(args.runs):
+            # Her çalıştırma özgün veritabanının taze bir kopyasıyla başlar.
+            db_path = os.path.join(scratch, "pomodoro.db")
+            if os.path.exists(args.db):
+                shutil.copyfile(args.db, db_path)
+            elif os.path.exists(db_path):
+                os.remove(db_path)
+
+            phases, modules = run_once(db_path, args.open_statistics)
+            for name, value in phases.items():
+                phase_samples.setdefault(name, []).append(value)
+            for package, value in group_by_package(modules).items():
+                package_samples.setdefault(package, []).append(value)
+            for module in modules:
+                module_samples.setdefault(module["module"], []).append(module["cumulative_us"] / 1000.0)
+
+    packages = {name: statistics.median(values) for name, values in package_samples.items()}
+    top_modules = sorted(
+        ({"module": name, "cumulative_ms": statistics.median(values)}
+         for name, values in module_samples.items()),
+        key=lambda item: item["cumulative_ms"], reverse=True
+    )[:args.top]
+
+    report = {
+        "benchmark": "startup",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "phases": {name: summarize(values) for name, values in phase_samples.items()},
+        "imports": {
+            "by_package_self_ms": dict(
+                sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]
+            ),
+            "top_modules": top_modules,
+        },
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+"""Depo arka uçlarının uyumluluk denetimi ve kıyaslaması.
+
+Aynı denetimler ve ölçümler her arka uçta (sqlite, memory, log; bkz.
+core.storage) çalıştırılır:
+
+- uyumluluk: kaydetme, silme, toplu ekleme (yinelenen atlama ve bütünlük),
+  CSV/JSON Lines dışa/içe aktarma,
+  günlük/kova toplamları, iter_sessions süzgeçleri, ayarlar, önbellek
+  geçersizleştirme ve kalıcı depolarda yeniden açılış
+- tutarlılık: aynı sentetik geçmiş her depoya eklenir; seanslar, tüm ayrıntı
+  düzeylerindeki istatistikler ve ayarlar ilk arka ucunkiyle karşılaştırılır
+- kıyaslama: tek tek kaydetme hızı, toplu ekleme, yeniden açılış ve sorgu
+  süreleri (önbellek kapalı)
+
+Denetimlerden biri başarısız olursa çıkış kodu 1'dir.
+
+Kullanım:
+    python benchmarks/storage.py --years 5 --per-day 12 --writes 20000 --output storage.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core.database import day_from_key
+from core.periods import GRANULARITIES
+from core.storage import STORAGE_BACKENDS, open_store
+from core.transfer import EXPORT_FORMATS, export_sessions, import_sessions
+
+from history import generate_history, iter_history
+from startup import git_revision
+
+# Uyumluluk denetimlerinin kullandığı gün
+CHECK_DAY = date(2024, 3, 5)
+
+
+def make_store(backend, directory, name="store", cache_size=64, write_behind=False):
+    """Arka ucun deposunu dizinde oluşturup hazırla."""
+    extension = {'sqlite': '.db', 'log': '.log'}.get(backend, '')
+    store = open_store(backend, os.path.join(directory, name + extension),
+                       write_behind=write_behind, cache_size=cache_size)
+    store.setup_database()
+    return store
+
+
+def at(hour, minute=0, day=CHECK_DAY):
+    return datetime(day.year, day.month, day.day, hour, minute)
+
+
+def save_day(store):
+    """Denetim gününe üç seans kaydet: tamamlanan, yarım kalan çalışma ve mola."""
+    store.save_session(at(9), at(9, 25), 1500)
+    store.save_session(at(10), at(10, 12), 720, is_completed=False)
+    store.save_session(at(10, 30), at(10, 35), 300, session_type="short_break")
+
+
+def expect(actual, expected, what):
+    if actual != expected:
+        raise AssertionError(f"{what}: beklenen {expected!r}, bulunan {actual!r}")
+
+
+# Uyumluluk denetimleri; her biri boş bir depo alır ve AssertionError yükseltir.
+
+def check_save_and_read(store, directory):
+    save_day(store)
+    sessions = store.get_sessions_by_date(CHECK_DAY)
+    expect([(s.duration, s.is_completed, s.session_type) for s in sessions],
+           [(1500, 1, 'work'), (720, 0, 'work'), (300, 1, 'short_break')], "günün seansları")
+    expect(sessions[0].day, CHECK_DAY.toordinal(), "gün anahtarı")
+    expect(sessions[0].end_time - sessions[0].start_time, 1500, "bitiş zamanı")
+    expect(len({s.id for s in sessions}), 3, "tekil kimlikler")
+    expect(store.get_sessions_by_date(CHECK_DAY + timedelta(days=1)), [], "boş gün")
+    expect([tuple(row) for row in store.get_statistics(CHECK_DAY, CHECK_DAY)],
+           [(CHECK_DAY.toordinal(), 1500, 1)], "günlük toplam")
+
+
+def check_statistics(store, directory):
+    end = date(2024, 12, 31)
+    generate_history(store, 2, 12, seed=3, end_date=end)
+    start = end - timedelta(days=400)
+    days = store.get_statistics(start, end)
+    expect(all(day.session_count > 0 for day in days), True, "boş gün satırı yok")
+    for granularity in GRANULARITIES:
+        rows = store.get_statistics(start, end, granularity)
+        expect(sum(row.total_duration for row in rows), sum(day.total_duration for day in days),
+               f"{granularity} toplam süresi")
+        expect(sum(row.session_count for row in rows), sum(day.session_count for day in days),
+               f"{granularity} seans sayısı")
+        columns = store.get_statistics(start, end, granularity, columnar=True)
+        expect(list(zip(*(getattr(columns, field) for field in ('work_date', 'total_duration',
+                                                                'session_count')))),
+               [tuple(row) for row in rows], f"{granularity} sütunlu sonuç")
+    expect(store.get_statistics(end, start), [], "ters aralık")
+
+
+def check_iter_sessions(store, directory):
+    save_day(store)
+    store.save_session(at(9, day=CHECK_DAY + timedelta(days=2)),
+                       at(9, 25, day=CHECK_DAY + timedelta(days=2)), 1500)
+    store.save_session(at(9, day=CHECK_DAY - timedelta(days=2)),
+                       at(9, 25, day=CHECK_DAY - timedelta(days=2)), 1500)
+    everything = list(store.iter_sessions())
+    expect(len(everything), 5, "tüm seanslar")
+    expect([s.start_time for s in everything], sorted(s.start_time for s in everything),
+           "başlangıç sırası")
+    expect(len(list(store.iter_sessions(CHECK_DAY, CHECK_DAY))), 3, "tek gün")
+    expect(len(list(store.iter_sessions(start_date=CHECK_DAY))), 4, "yalnızca başlangıç")
+    expect(len(list(store.iter_sessions(end_date=CHECK_DAY))), 4, "yalnızca bitiş")
+    expect(len(list(store.iter_sessions(session_type='short_break'))), 1, "tür süzgeci")
+    chunks = list(store.iter_session_chunks(chunk_size=2))
+    expect([len(chunk) for chunk in chunks], [2, 2, 1], "parça boyları")
+    try:
+        list(store.iter_session_chunks(chunk_size=0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("chunk_size=0 ValueError yükseltmedi")
+
+
+def check_delete(store, directory):
+    save_day(store)
+    work, incomplete, _ = store.get_sessions_by_date(CHECK_DAY)
+    expect(store.delete_session(incomplete.id), True, "yarım seansın silinmesi")
+    expect([tuple(row) for row in store.get_statistics(CHECK_DAY, CHECK_DAY)],
+           [(CHECK_DAY.toordinal(), 1500, 1)], "silmeden sonra toplam")
+    expect(store.delete_session(work.id), True, "çalışma seansının silinmesi")
+    expect(store.get_statistics(CHECK_DAY, CHECK_DAY), [], "son seanstan sonra toplam")
+    expect(store.get_statistics(CHECK_DAY, CHECK_DAY, 'month'), [], "son seanstan sonra ay")
+    expect(store.delete_session(work.id), False, "olmayan seans")
+    expect(len(store.get_sessions_by_date(CHECK_DAY)), 1, "kalan seanslar")
+
+
+def check_import(store, directory):
+    rows = list(iter_history(0.1, 6, seed=5, end_date=CHECK_DAY))
+    inserted, skipped = store.import_sessions(rows + rows[:10])
+    expect((inserted, skipped), (len(rows), 10), "ilk ekleme")
+    expect(store.import_sessions(rows), (0, len(rows)), "yinelenen ekleme")
+    expect(sum(1 for _ in store.iter_sessions()), len(rows), "seans sayısı")
+    completed = sum(duration for _, _, _, duration, is_completed, session_type in rows
+                    if is_completed and session_type == 'work')
+    totals = store.get_statistics(CHECK_DAY - timedelta(days=60), CHECK_DAY)
+    expect(sum(row.total_duration for row in totals), completed, "eklenen toplam süre")
+    expect(store.rebuild_daily_totals(), len(totals), "yeniden oluşturulan gün sayısı")
+    expect(store.get_statistics(CHECK_DAY - timedelta(days=60), CHECK_DAY), totals,
+           "yeniden oluşturma sonrası toplamlar")
+
+
+def check_import_atomic(store, directory):
+    save_day(store)
+    before = list(store.iter_sessions())
+    version = store.data_version
+
+    def broken():
+        yield from iter_history(0.05, 6, seed=7, end_date=CHECK_DAY - timedelta(days=1))
+        raise ValueError("bozuk satır")
+
+    try:
+        store.import_sessions(broken())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("hata yükselmedi")
+    expect(list(store.iter_sessions()), before, "başarısız eklemeden sonra seanslar")
+    expect(store.data_version, version, "başarısız eklemeden sonra sürüm")
+
+
+def check_transfer(store, directory):
+    save_day(store)
+    sessions = [session[1:] for session in store.iter_sessions()]
+    for fmt in EXPORT_FORMATS:
+        output = io.StringIO()
+        expect(export_sessions(store, output, fmt), len(sessions), f"{fmt} dışa aktarılan")
+        # Dosya sonundaki boş satırlar hata vermeden atlanır.
+        target = make_store('memory', directory)
+        expect(import_sessions(target, io.StringIO(output.getvalue() + "\n \n"), fmt),
+               (len(sessions), 0), f"{fmt} içe aktarma")
+        expect([session[1:] for session in target.iter_sessions()], sessions, f"{fmt} seansları")
+    expect(import_sessions(store, io.StringIO("start_time,duration\n\n"), 'csv'), (0, 0),
+           "yalnızca başlık ve boş satır")
+
+
+def check_settings(store, directory):
+    settings = store.get_settings()
+    expect({key: settings[key] for key in ('id', 'work_duration', 'short_break_duration',
+                                          'long_break_duration', 'sessions_before_long_break')},
+           {'id': 1, 'work_duration': 25, 'short_break_duration': 5, 'long_break_duration': 15,
+            'sessions_before_long_break': 4}, "varsayılan ayarlar")
+    store.update_settings({'id': 1, 'work_duration': 50, 'chart_renderer': 'qtcharts'})
+    settings = store.get_settings()
+    expect((settings['id'], settings['work_duration'], settings['chart_renderer']),
+           (1, 50, 'qtcharts'), "güncellenen ayarlar")
+
+
+def check_cache_invalidation(store, directory):
+    save_day(store)
+    first = store.get_statistics(CHECK_DAY, CHECK_DAY)
+    version = store.data_version
+    store.save_session(at(11), at(11, 25), 1500)
+    expect(store.data_version > version, True, "yazmadan sonra sürüm")
+    expect([tuple(row) for row in store.get_statistics(CHECK_DAY, CHECK_DAY)],
+           [(CHECK_DAY.toordinal(), 3000, 2)], "yazmadan sonra önbellek")
+    expect(first, [(CHECK_DAY.toordinal(), 1500, 1)], "önceki sonuç değişmez")
+
+
+def check_reopen(store, directory):
+    save_day(store)
+    store.update_settings({'work_duration': 40})
+    store.delete_session(store.get_sessions_by_date(CHECK_DAY)[1].id)
+    sessions = list(store.iter_sessions())
+    totals = store.get_statistics(CHECK_DAY, CHECK_DAY)
+    store.close()
+
+    reopened = make_store(store_backend(store), directory)
+    try:
+        expect(list(reopened.iter_sessions()), sessions, "yeniden açılışta seanslar")
+        expect(reopened.get_statistics(CHECK_DAY, CHECK_DAY), totals, "yeniden açılışta toplamlar")
+        expect(reopened.get_settings()['work_duration'], 40, "yeniden açılışta ayarlar")
+        reopened.save_session(at(12), at(12, 25), 1500)
+        expect(len({s.id for s in reopened.iter_sessions()}), len(sessions) + 1,
+               "yeniden açılıştan sonra tekil kimlik")
+        if hasattr(reopened, 'compact'):
+            reopened.compact()
+            reopened.close()
+            compacted = make_store('log', directory)
+            expect(list(compacted.iter_sessions()), list(reopened.iter_sessions()),
+                   "sıkıştırmadan sonra seanslar")
+            compacted.close()
+    finally:
+        reopened.close()
+
+
+def store_backend(store):
+    return {'DatabaseManager': 'sqlite', 'MemoryStore': 'memory',
+            'LogStore': 'log'}[type(store).__name__]
+
+
+CHECKS = [
+    ("save_and_read", check_save_and_read, None),
+    ("statistics", check_statistics, None),
+    ("iter_sessions", check_iter_sessions, None),
+    ("delete", check_delete, None),
+    ("import", check_import, None),
+    ("import_atomic", check_import_atomic, None),
+    ("transfer", check_transfer, None),
+    ("settings", check_settings, None),
+    ("cache_invalidation", check_cache_invalidation, None),
+    ("reopen", check_reopen, ('sqlite', 'log')),
+]
+
+
+def run_checks(backend):
+    """Arka ucun uyumluluk denetimlerini çalıştır; ad -> 'ok' ya da hata iletisi."""
+    results = {}
+    for name, check, backends in CHECKS:
+        if backends is not None and backend not in backends:
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            store = make_store(backend, directory)
+            try:
+                check(store, directory)
+                results[name] = "ok"
+            except Exception as e:
+                results[name] = f"{type(e).__name__}: {e}"
+            finally:
+                store.close()
+    return results
+
+
+def snapshot(store, start, end):
+    """Deponun karşılaştırılan tüm sorgu sonuçları."""
+    result = {
+        'sessions': [tuple(session) for session in store.iter_sessions()],
+        'settings': store.get_settings(),
+    }
+    for granularity in GRANULARITIES:
+        result[granularity] = [tuple(row) for row in store.get_statistics(start, end, granularity)]
+    return result
+
+
+def compare_backends(backends, years, per_day, seed):
+    """Aynı geçmişi her depoya ekleyip sonuçları ilk arka uçla karşılaştır."""
+    end = date(2024, 12, 31)
+    start = end - timedelta(days=int(years * 365.25))
+    reference = None
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in backends:
+            store = make_store(backend, directory)
+            try:
+                generate_history(store, years, per_day, seed, end_date=end)
+                # Silme de karşılaştırılsın diye son ayın ilk seansı silinir.
+                recent = next(store.iter_sessions(start_date=end - timedelta(days=30)))
+                store.delete_session(recent.id)
+                expect(store.get_sessions_by_date(day_from_key(recent.day))[:1] != [recent], True,
+                       "silinen seans")
+                current = snapshot(store, start + timedelta(days=3), end - timedelta(days=3))
+            finally:
+                store.close()
+            if reference is None:
+                reference = current
+                results[backend] = "referans"
+                continue
+            differences = [key for key in reference if reference[key] != current[key]]
+            results[backend] = "aynı" if not differences else f"farklı: {', '.join(differences)}"
+    return results
+
+
+def summarize(samples):
+    return {
+        "p50_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+    }
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def bench_backend(backend, args):
+    """Arka ucun yazma, ekleme, açılış ve sorgu sürelerini ölç."""
+    rng = random.Random(args.seed)
+    end = date.today()
+    first = end - timedelta(days=int(args.years * 365.25) - 1)
+    result = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Tek tek kaydetme; SQLite uygulamadaki gibi arka plan yazıcısıyla.
+        store = make_store(backend, directory, "writes", cache_size=0, write_behind=True)
+        moment = datetime(2000, 1, 1, 9)
+        started = time.perf_counter()
+        for index in range(args.writes):
+            start = moment + timedelta(minutes=30 * index)
+            store.save_session(start, start + timedelta(minutes=25), 1500)
+        store.flush()
+        elapsed = time.perf_counter() - started
+        store.close()
+        result["save_session"] = {"count": args.writes, "per_second": args.writes / elapsed}
+
+        store = make_store(backend, directory, "history", cache_size=0)
+        started = time.perf_counter()
+        count = generate_history(store, args.years, args.per_day, args.seed, end_date=end)
+        elapsed = time.perf_counter() - started
+        result["import_sessions"] = {"count": count, "per_second": count / elapsed}
+        store.close()
+
+        if backend != 'memory':
+            samples = []
+            for _ in range(3):
+                started = time.perf_counter()
+                store = make_store(backend, directory, "history", cache_size=0)
+                samples.append((time.perf_counter() - started) * 1000.0)
+                store.close()
+            result["reopen"] = summarize(samples)
+            store = make_store(backend, directory, "history", cache_size=0)
+
+        try:
+            span = (end - first).days
+            scenarios = {
+                "get_statistics/30d": lambda: store.get_statistics(end - timedelta(days=29), end),
+                "get_statistics/all/day": lambda: store.get_statistics(first, end),
+                "get_statistics/all/month": lambda: store.get_statistics(first, end, 'month'),
+                "get_sessions_by_date": lambda: store.get_sessions_by_date(
+                    first + timedelta(days=rng.randrange(span + 1))),
+                "iter_sessions/all": lambda: sum(1 for _ in store.iter_sessions()),
+            }
+            for name, scenario in scenarios.items():
+                result[name] = summarize([timed(scenario) for _ in range(args.iterations)])
+        finally:
+            store.close()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Depo arka uçları uyumluluk denetimi ve kıyaslaması")
+    parser.add_argument("--backends", nargs="+", choices=STORAGE_BACKENDS, default=list(STORAGE_BACKENDS),
+                        help="Denetlenecek arka uçlar")
+    parser.add_argument("--years", type=float, default=5, help="Geçmişin uzunluğu (yıl)")
+    parser.add_argument("--per-day", type=float, default=12, help="Günlük ortalama seans sayısı")
+    parser.add_argument("--writes", type=int, default=20000, help="Tek tek kaydedilecek seans sayısı")
+    parser.add_argument("--iterations", type=int, default=20, help="Sorgu başına ölçüm sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--checks-only", action="store_true", help="Yalnızca denetimleri çalıştır")
+    parser.add_argument("--output", help="JSON çıktısının yazılacağı dosya (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    conformance = {backend: run_checks(backend) for backend in args.backends}
+    consistency = compare_backends(args.backends, min(args.years, 2), args.per_day, args.seed)
+    failed = [
+        f"{backend}/{name}: {message}"
+        for backend, checks in conformance.items()
+        for name, message in checks.items() if message != "ok"
+    ] + [
+        f"{backend}: {message}" for backend, message in consistency.items()
+        if message.startswith("farklı")
+    ]
+
+    report = {
+        "benchmark": "storage",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "years": args.years,
+        "per_day": args.per_day,
+        "conformance": conformance,
+        "consistency": consistency,
+    }
+    if not args.checks_only:
+        report["results"] = {}
+        for backend in args.backends:
+            print(f"{backend} ölçülüyor...", file=sys.stderr)
+            report["results"][backend] = bench_backend(backend, args)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for failure in failed:
+        print(f"Başarısız: {failure}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
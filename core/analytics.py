@@ -0,0 +1,103 @@
+"""Uzun dönem istatistikleri için NumPy tabanlı hesaplamalar.
+
+Günlük toplamlar, eksik günler sıfırla doldurulmuş dizilere yüklenir ve tüm
+türetilmiş seriler (kayan ortalamalar, haftalık değişim, hafta günü
+ortalamaları, yüzdelikler) döngüsüz vektör işlemleriyle hesaplanır.
+"""
+from datetime import timedelta
+
+import numpy as np
+
+from core.database import day_key
+from core.records import StatisticsColumns
+
+WEEKDAY_NAMES = ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"]
+
+
+class DailySeries:
+    """Bir tarih aralığının günlük çalışma süresi ve seans sayısı dizileri."""
+
+    def __init__(self, start_date, durations, counts):
+        self.start_date = start_date
+        self.durations = durations  # saniye, float64
+        self.counts = counts        # seans sayısı, int64
+
+    @classmethod
+    def from_statistics(cls, statistics, start_date, end_date):
+        """get_statistics kayıtlarından sıfırla doldurulmuş seri oluştur."""
+        return cls.from_columns(StatisticsColumns.from_rows(statistics), start_date, end_date)
+
+    @classmethod
+    def from_columns(cls, columns, start_date, end_date):
+        """get_statistics(..., columnar=True) sütunlarından seri oluştur."""
+        start_key = day_key(start_date)
+        length = max(0, day_key(end_date) - start_key + 1)
+
+        durations = np.zeros(length, dtype=np.float64)
+        counts = np.zeros(length, dtype=np.int64)
+
+        if len(columns):
+            # array('q') dizileri kopyalanmadan okunur.
+            offsets = np.frombuffer(columns.work_date, dtype=np.int64) - start_key
+            inside = (offsets >= 0) & (offsets < length)
+            durations[offsets[inside]] = np.frombuffer(columns.total_duration, dtype=np.int64)[inside]
+            counts[offsets[inside]] = np.frombuffer(columns.session_count, dtype=np.int64)[inside]
+
+        return cls(start_date, durations, counts)
+
+    def __len__(self):
+        return len(self.durations)
+
+    def date_at(self, offset):
+        """Dizideki konumun tarihini döndür."""
+        return self.start_date + timedelta(days=int(offset))
+
+    def weekdays(self):
+        """Her günün hafta günü (0 = Pazartesi)."""
+        return (self.start_date.weekday() + np.arange(len(self))) % 7
+
+    def slice_from(self, offset):
+        """Baştaki offset günü atılmış yeni seri döndür."""
+        return DailySeries(self.date_at(offset), self.durations[offset:], self.counts[offset:])
+
+
+def rolling_sum(values, window):
+    """Son window günün toplamı; ilk günlerde eldeki günler toplanır."""
+    cumulative = np.cumsum(values, dtype=np.float64)
+    result = cumulative.copy()
+    result[window:] = cumulative[window:] - cumulative[:-window]
+    return result
+
+
+def rolling_mean(values, window):
+    """Son window günün ortalaması; ilk günlerde eldeki günlerin ortalaması."""
+    sums = rolling_sum(values, window)
+    available = np.minimum(np.arange(1, len(values) + 1), window)
+    return sums / available
+
+
+def week_over_week(values):
+    """Her gün için son 7 günün toplamı ile önceki 7 günün toplamı farkı.
+
+    İlk 7 günde karşılaştırılacak hafta olmadığından değer NaN'dır.
+    """
+    weekly = rolling_sum(values, 7)
+    deltas = np.full(len(values), np.nan)
+    deltas[7:] = weekly[7:] - weekly[:-7]
+    return deltas
+
+
+def weekday_means(values, weekdays):
+    """Hafta günlerine göre ortalama (7 elemanlı; hiç günü olmayanlar 0)."""
+    totals = np.bincount(weekdays, weights=values, minlength=7)
+    day_counts = np.bincount(weekdays, minlength=7)
+    return np.divide(totals, day_counts, out=np.zeros(7), where=day_counts > 0)
+
+
+def percentiles(values, quantiles=(50, 75, 90), worked_only=True):
+    """Günlük değerlerin yüzdelikleri; worked_only ise boş günler hariç."""
+    if worked_only:
+        values = values[values > 0]
+    if len(values) == 0:
+        return {q: 0.0 for q in quantiles}
+    return dict(zip(quantiles, np.percentile(values, quantiles)))
@@ -0,0 +1,143 @@
+"""Sayacın zaman kaynağı.
+
+SystemClock gerçek monotonik saati, duvar saatini ve Qt zamanlayıcılarını
+kullanır. VirtualClock ise elle ilerletilen sanal zamandır: zamanlayıcılar bir
+öncelik kuyruğunda tutulur ve sıradaki olay anına atlanarak çalıştırılır.
+Böylece saatler süren pomodoro döngüleri ekransız ve beklemesiz çalıştırılabilir.
+"""
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+
+from PyQt6.QtCore import QTimer, Qt
+
+
+class SystemClock:
+    """Gerçek saat."""
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def now(self):
+        return datetime.now()
+
+    def create_timer(self, callback, parent=None):
+        """Tek atımlık zamanlayıcı oluştur."""
+        return _QtTimer(callback, parent)
+
+
+class _QtTimer:
+    """QTimer üzerinde tek atımlık zamanlayıcı."""
+
+    def __init__(self, callback, parent):
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(callback)
+
+    def start(self, delay_ms, precise=False):
+        if precise:
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        else:
+            self._timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._timer.start(delay_ms)
+
+    def stop(self):
+        self._timer.stop()
+
+    def is_active(self):
+        return self._timer.isActive()
+
+
+class VirtualClock:
+    """Elle ilerletilen sanal saat.
+
+    monotonic() sıfırdan başlar; now() başlangıç duvar saatine sanal süreyi
+    ekler. Olaylar yalnızca run_next(), advance() veya run_until() ile çalışır.
+    """
+
+    def __init__(self, start=None):
+        self.start = start or datetime.now().replace(microsecond=0)
+        self._time = 0.0
+        self._queue = []  # (zaman, sıra, geri çağrı)
+        self._sequence = itertools.count()
+        self.fired_events = 0
+
+    def monotonic(self):
+        return self._time
+
+    def now(self):
+        return self.start + timedelta(seconds=self._time)
+
+    def create_timer(self, callback, parent=None):
+        """Tek atımlık sanal zamanlayıcı oluştur."""
+        return _VirtualTimer(self, callback)
+
+    def call_at(self, when, callback):
+        """callback'i sanal when anında çalıştır."""
+        heapq.heappush(self._queue, (max(when, self._time), next(self._sequence), callback))
+
+    def call_later(self, delay, callback):
+        """callback'i delay saniye sonra çalıştır."""
+        self.call_at(self._time + delay, callback)
+
+    def pending(self):
+        """Bekleyen olay sayısı (iptal edilmiş zamanlayıcılar dahil)."""
+        return len(self._queue)
+
+    def next_event_time(self):
+        """Sıradaki olayın sanal anı; olay yoksa None."""
+        return self._queue[0][0] if self._queue else None
+
+    def run_next(self):
+        """Sıradaki olayın anına atla ve olayı çalıştır; olay yoksa False döndür."""
+        if not self._queue:
+            return False
+        when, _, callback = heapq.heappop(self._queue)
+        self._time = when
+        self.fired_events += 1
+        callback()
+        return True
+
+    def run_until(self, when):
+        """when anına kadarki tüm olayları çalıştır ve saati when'e getir."""
+        while self._queue and self._queue[0][0] <= when:
+            self.run_next()
+        self._time = max(self._time, when)
+
+    def advance(self, seconds):
+        """Saati seconds kadar ilerlet."""
+        self.run_until(self._time + seconds)
+
+
+class _VirtualTimer:
+    """VirtualClock üzerinde tek atımlık zamanlayıcı.
+
+    Yeniden kurma veya durdurma eski kuyruk kaydını silmez; kayıt kuşak
+    numarasıyla eşleşmediği için tetiklendiğinde yok sayılır.
+    """
+
+    def __init__(self, clock, callback):
+        self._clock = clock
+        self._callback = callback
+        self._generation = 0
+        self._active = False
+
+    def start(self, delay_ms, precise=False):
+        self._generation += 1
+        self._active = True
+        generation = self._generation
+        self._clock.call_later(delay_ms / 1000.0, lambda: self._fire(generation))
+
+    def stop(self):
+        self._generation += 1
+        self._active = False
+
+    def is_active(self):
+        return self._active
+
+    def _fire(self, generation):
+        if generation != self._generation:
+            return
+        self._active = False
+        self._callback()
@@ -0,0 +1,124 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class ConnectionManager:
+    """SQLite bağlantılarını iş parçacıkları arasında güvenle paylaştıran yönetici.
+
+    Tek bir yazıcı bağlantısı kilit altında kullanılır. Okumalar için en fazla
+    ``max_readers`` adet salt okunur bağlantı bir havuzda tutulur ve her iş
+    parçacığına kullanım süresince ödünç verilir. WAL kipinde okuyucular
+    yazıcıyı beklemeden son commit edilmiş veriyi görür.
+    """
+
+    def __init__(self, db_path, max_readers=4, timeout=5.0):
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.timeout = timeout
+
+        self._writer_conn = None
+        self._writer_lock = threading.RLock()
+
+        self._pool_lock = threading.Condition()
+        self._idle_readers = []
+        self._reader_count = 0
+        self._closed = False
+
+        # Aynı iş parçacığındaki iç içe reader() çağrıları aynı bağlantıyı kullanır.
+        self._local = threading.local()
+
+    def _open(self, read_only=False):
+        if read_only:
+            uri = Path(self.db_path).absolute().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=self.timeout, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def writer_connection(self):
+        """Yazıcı bağlantısını döndür (kilit almadan; yalnızca kurulum için)."""
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("Bağlantı yöneticisi kapatıldı.")
+            if self._writer_conn is None:
+                self._writer_conn = self._open()
+            return self._writer_conn
+
+    @contextmanager
+    def writer(self):
+        """Yazıcı bağlantısını kilit altında kullan."""
+        with self._writer_lock:
+            yield self.writer_connection()
+
+    @contextmanager
+    def reader(self):
+        """Salt okunur bir bağlantıyı bu iş parçacığına ödünç ver."""
+        borrowed = getattr(self._local, "conn", None)
+        if borrowed is not None:
+            self._local.depth += 1
+            try:
+                yield borrowed
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire_reader()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._release_reader(conn)
+
+    def _acquire_reader(self):
+        with self._pool_lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Bağlantı yöneticisi kapatıldı.")
+                if self._idle_readers:
+                    return self._idle_readers.pop()
+                if self._reader_count < self.max_readers:
+                    self._reader_count += 1
+                    break
+                if not self._pool_lock.wait(self.timeout):
+                    raise TimeoutError("Boşta okuma bağlantısı bulunamadı.")
+
+        try:
+            return self._open(read_only=True)
+        except Exception:
+            with self._pool_lock:
+                self._reader_count -= 1
+                self._pool_lock.notify()
+            raise
+
+    def _release_reader(self, conn):
+        with self._pool_lock:
+            if self._closed:
+                conn.close()
+                self._reader_count -= 1
+            else:
+                self._idle_readers.append(conn)
+            self._pool_lock.notify_all()
+
+    def close(self):
+        """Tüm bağlantıları kapat; ödünç verilmiş okuyucuların dönmesini bekle."""
+        with self._pool_lock:
+            self._closed = True
+            for conn in self._idle_readers:
+                conn.close()
+                self._reader_count -= 1
+            self._idle_readers.clear()
+
+            while self._reader_count > 0:
+                if not self._pool_lock.wait(self.timeout):
+                    break
+
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
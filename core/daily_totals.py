@@ -0,0 +1,113 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from datetime import date, datetime, timedelta
+
+from core.database import day_key, to_epoch, local_day_key, counts_toward_totals
+from core.records import SessionRecord
+
+
+class DailyTotals(QObject):
+    """Bugünkü toplam çalışma süresini bellekte tutan servis.
+
+    Toplam açılışta özet tablodan bir kez okunur; sonra her kaydedilen seansla
+    bellekte güncellenir. Seanslar, veritabanındaki günlük toplamlarda olduğu
+    gibi başladıkları güne sayılır. Gece yarısı sayaç sıfırlanır.
+    """
+
+    # Bugünkü toplam değişti (saniye)
+    changed = pyqtSignal(int)
+    # Bir seans kaydedildi: seans bilgisi, yazmadan önceki ve sonraki data_version
+    session_recorded = pyqtSignal(object, int, int)
+
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+
+        self.day = None
+        self.total = 0
+
+        # Gece yarısında günü değiştirmek için tek atımlık zamanlayıcı
+        self._midnight_timer = QTimer(self)
+        self._midnight_timer.setSingleShot(True)
+        self._midnight_timer.timeout.connect(self._on_midnight)
+
+        self.load()
+
+    def load(self):
+        """Bugünün toplamını veritabanından oku."""
+        today = date.today()
+        self.day = day_key(today)
+        try:
+            statistics = self.db_manager.get_statistics(today, today)
+            self.total = sum(stat.total_duration for stat in statistics)
+        except Exception as e:
+            print(f"Bugünkü toplam okunurken hata: {e}")
+            self.total = 0
+
+        self._schedule_midnight()
+        self.changed.emit(self.total)
+
+    def today_total(self):
+        """Bugünkü toplam çalışma süresi (saniye)."""
+        self._roll_over()
+        return self.total
+
+    def record_session(self, start_time, end_time, duration, is_completed=True, session_type="work"):
+        """Seansı veritabanına kaydet ve bellekteki toplamı güncelle."""
+        previous_version = self.db_manager.data_version
+        self.db_manager.save_session(
+            start_time=start_time,
+            end_time=end_time,
+            duration=duration,
+            is_completed=is_completed,
+            session_type=session_type
+        )
+        version = self.db_manager.data_version
+
+        # Kimlik yazma arka planda olabileceğinden bilinmez.
+        start_ts, utc_offset = to_epoch(start_time)
+        session = SessionRecord(
+            id=None,
+            start_time=start_ts,
+            end_time=to_epoch(end_time)[0] if end_time is not None else None,
+            utc_offset=utc_offset,
+            duration=duration,
+            is_completed=int(bool(is_completed)),
+            session_type=session_type,
+            day=local_day_key(start_ts, utc_offset),
+        )
+
+        # Gün değiştiyse önce sayacı sıfırla; gece yarısını aşan seans
+        # başladığı güne sayıldığından bugünün toplamına eklenmez.
+        self._roll_over()
+        if counts_toward_totals(session_type, is_completed) and session.day == self.day:
+            self.total += duration
+            self.changed.emit(self.total)
+
+        self.session_recorded.emit(session, previous_version, version)
+
+    def _roll_over(self):
+        """Gün değiştiyse sayacı yeni güne taşı."""
+        today = day_key(date.today())
+        if today == self.day:
+            return False
+        # Yeni günün ilk anları; bu uygulama dışında kayıt yapılmadığından
+        # toplam sıfırdan başlar.
+        self.day = today
+        self.total = 0
+        self._schedule_midnight()
+        self.changed.emit(self.total)
+        return True
+
+    def _on_midnight(self):
+        if not self._roll_over():
+            # Zamanlayıcı erken uyandıysa yeniden kur.
+            self._schedule_midnight()
+
+    def _schedule_midnight(self):
+        """Zamanlayıcıyı bir sonraki yerel gece yarısına kur."""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # Yaz saati geçişlerinde bile gün değişmiş olsun diye bir saniye pay bırakılır.
+        milliseconds = int((midnight - now).total_seconds() * 1000) + 1000
+        self._midnight_timer.start(milliseconds)
@@ -1,22 +1,302 @@
-import sqlite3
 import os
-from datetime import datetime
+from datetime import datetime, date, timedelta
 
-class DatabaseManager:
-    def __init__(self, db_path="data/pomodoro.db"):
+from core import instrumentation
+from core.connection_pool import ConnectionManager
+from core.periods import (GRANULARITIES, bucket_key, bucket_key_from_day, bucket_start,
+                          bucket_end, next_bucket_key)
+from core.records import SESSION_FIELDS, StatisticsColumns, session_record, stat_record
+from core.storage import SESSION_CHUNK_SIZE, SessionStore
+from core.write_behind import WriteBehindWriter
+
+# Unix epoch'un (1970-01-01) proleptik Gregoryen sıra numarası.
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(dt):
+    """datetime değerini (UTC epoch saniyesi, UTC farkı saniyesi) çiftine çevir.
+
+    Saat dilimi bilgisi olmayan değerler yerel saat kabul edilir.
+    """
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    offset = int(dt.utcoffset().total_seconds())
+    return int(dt.timestamp()), offset
+
+
+def from_epoch(timestamp, utc_offset):
+    """Epoch değerini kaydedildiği andaki yerel saat olarak (naive) döndür."""
+    return _EPOCH + timedelta(seconds=timestamp + utc_offset)
+
+
+def local_day_key(timestamp, utc_offset):
+    """Epoch değerinin yerel gün anahtarını döndür."""
+    return (timestamp + utc_offset) // 86400 + EPOCH_ORDINAL
+
+
+def day_key(value):
+    """Tarih değerinin gün anahtarını (tarih sıra numarası) döndür."""
+    return value.toordinal()
+
+
+def day_from_key(key):
+    """Gün anahtarını date nesnesine çevir."""
+    return date.fromordinal(key)
+
+
+def session_start(session):
+    """Seans kaydının başlangıç zamanını yerel datetime olarak döndür."""
+    return from_epoch(session.start_time, session.utc_offset)
+
+
+def session_end(session):
+    """Seans kaydının bitiş zamanını yerel datetime olarak döndür."""
+    if session.end_time is None:
+        return None
+    return from_epoch(session.end_time, session.utc_offset)
+
+
+def _migrate_day_column(cursor):
+    """Seanslara yerel gün anahtarı ekle ve mevcut kayıtları doldur."""
+    cursor.execute('ALTER TABLE work_sessions ADD COLUMN day TEXT')
+    cursor.execute('UPDATE work_sessions SET day = date(start_time)')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_work_sessions_day '
+        'ON work_sessions (day, session_type, is_completed)'
+    )
+
+
+def _parse_legacy_time(value):
+    """Eski ISO metin zaman damgasını epoch çiftine çevir."""
+    if value is None:
+        return None, None
+    return to_epoch(datetime.fromisoformat(value))
+
+
+def _vacuum_after(migration):
+    """Göçü, tüm göçler bittikten sonra VACUUM gerektiren göç olarak işaretle."""
+    migration.needs_vacuum = True
+    return migration
+
+
+@_vacuum_after
+def _migrate_integer_timestamps(cursor):
+    """Zaman damgalarını tamsayı epoch değerlerine, gün anahtarını sıra numarasına çevir.
+    
+    Metin kayıtlardan boşalan sayfalar sonraki VACUUM ile geri kazanılır.
+    """
+    cursor.execute('DROP INDEX IF EXISTS idx_work_sessions_day')
+    cursor.execute('ALTER TABLE work_sessions RENAME TO work_sessions_legacy')
+    cursor.execute('''
+    CREATE TABLE work_sessions (
+        id INTEGER PRIMARY KEY,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER,
+        utc_offset INTEGER NOT NULL DEFAULT 0,
+        duration INTEGER,
+        is_completed INTEGER DEFAULT 0,
+        session_type TEXT DEFAULT 'work',
+        day INTEGER NOT NULL
+    )
+    ''')
+    
+    rows = cursor.execute(
+        'SELECT id, start_time, end_time, duration, is_completed, session_type '
+        'FROM work_sessions_legacy'
+    ).fetchall()
+    
+    converted = []
+    for row_id, start_text, end_text, duration, is_completed, session_type in rows:
+        start_ts, offset = _parse_legacy_time(start_text)
+        end_ts, _ = _parse_legacy_time(end_text)
+        day = local_day_key(start_ts, offset)
+        converted.append((row_id, start_ts, end_ts, offset, duration,
+                          int(bool(is_completed)), session_type, day))
+    
+    cursor.executemany(
+        'INSERT INTO work_sessions (id, start_time, end_time, utc_offset, duration, '
+        'is_completed, session_type, day) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        converted
+    )
+    cursor.execute('DROP TABLE work_sessions_legacy')
+    cursor.execute(
+        'CREATE INDEX idx_work_sessions_day '
+        'ON work_sessions (day, session_type, is_completed)'
+    )
+
+
+_REBUILD_DAILY_TOTALS_SQL = '''
+INSERT INTO daily_totals (day, total_duration, session_count)
+SELECT day, SUM(duration), COUNT(*)
+FROM work_sessions
+WHERE session_type = 'work' AND is_completed = 1
+GROUP BY day
+'''
+
+
+def _migrate_daily_totals(cursor):
+    """Günlük toplamlar özet tablosunu oluştur ve mevcut seanslardan doldur."""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS daily_totals (
+        day INTEGER PRIMARY KEY,
+        total_duration INTEGER NOT NULL DEFAULT 0,
+        session_count INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+    cursor.execute(_REBUILD_DAILY_TOTALS_SQL)
+
+
+def _migrate_chart_renderer_setting(cursor):
+    """Ayarlara istatistik grafiği çizicisi seçimini ekle."""
+    cursor.execute("ALTER TABLE settings ADD COLUMN chart_renderer TEXT DEFAULT 'matplotlib'")
+
+
+# Günlük toplamların üzerine kurulan kaba ayrıntı düzeyleri
+PERIOD_GRANULARITIES = tuple(g for g in GRANULARITIES if g != 'day')
+
+
+def _period_rows(daily):
+    """(gün, süre, sayı) satırlarını hafta/ay/yıl kovalarına topla."""
+    totals = {}
+    for day, total_duration, session_count in daily:
+        for granularity in PERIOD_GRANULARITIES:
+            key = (granularity, bucket_key_from_day(granularity, day))
+            previous = totals.get(key, (0, 0))
+            totals[key] = (previous[0] + total_duration, previous[1] + session_count)
+    return [(granularity, bucket, duration, count)
+            for (granularity, bucket), (duration, count) in totals.items()]
+
+
+def _rebuild_period_totals(cursor):
+    """Hafta/ay/yıl toplamlarını günlük toplamlardan yeniden oluştur."""
+    cursor.execute('DELETE FROM period_totals')
+    daily = cursor.execute('SELECT day, total_duration, session_count FROM daily_totals').fetchall()
+    cursor.executemany(
+        'INSERT INTO period_totals (granularity, bucket, total_duration, session_count) VALUES (?, ?, ?, ?)',
+        _period_rows(daily)
+    )
+
+
+def _add_totals(cursor, daily):
+    """(gün, süre, sayı) satırlarını günlük ve dönemsel toplamlara topluca ekle."""
+    cursor.executemany(
+        '''
+        INSERT INTO daily_totals (day, total_duration, session_count) VALUES (?, ?, ?)
+        ON CONFLICT(day) DO UPDATE SET
+            total_duration = total_duration + excluded.total_duration,
+            session_count = session_count + excluded.session_count
+        ''',
+        daily
+    )
+    cursor.executemany(
+        '''
+        INSERT INTO period_totals (granularity, bucket, total_duration, session_count) VALUES (?, ?, ?, ?)
+        ON CONFLICT(granularity, bucket) DO UPDATE SET
+            total_duration = total_duration + excluded.total_duration,
+            session_count = session_count + excluded.session_count
+        ''',
+        _period_rows(daily)
+    )
+
+
+def _migrate_period_totals(cursor):
+    """Hafta, ay ve yıl kovaları için özet tabloyu oluştur ve doldur."""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS period_totals (
+        granularity TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        total_duration INTEGER NOT NULL DEFAULT 0,
+        session_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (granularity, bucket)
+    ) WITHOUT ROWID
+    ''')
+    _rebuild_period_totals(cursor)
+
+
+def _apply_daily_total(cursor, day, duration_delta, count_delta):
+    """Bir günün ve içinde bulunduğu hafta/ay/yılın özet satırlarını güncelle."""
+    cursor.execute(
+        '''
+        INSERT INTO daily_totals (day, total_duration, session_count) VALUES (?, ?, ?)
+        ON CONFLICT(day) DO UPDATE SET
+            total_duration = total_duration + excluded.total_duration,
+            session_count = session_count + excluded.session_count
+        ''',
+        (day, duration_delta, count_delta)
+    )
+    if count_delta < 0:
+        cursor.execute('DELETE FROM daily_totals WHERE day = ? AND session_count <= 0', (day,))
+    
+    for granularity in PERIOD_GRANULARITIES:
+        bucket = bucket_key_from_day(granularity, day)
+        cursor.execute(
+            '''
+            INSERT INTO period_totals (granularity, bucket, total_duration, session_count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(granularity, bucket) DO UPDATE SET
+                total_duration = total_duration + excluded.total_duration,
+                session_count = session_count + excluded.session_count
+            ''',
+            (granularity, bucket, duration_delta, count_delta)
+        )
+        if count_delta < 0:
+            cursor.execute(
+                'DELETE FROM period_totals WHERE granularity = ? AND bucket = ? AND session_count <= 0',
+                (granularity, bucket)
+            )
+
+
+def _migrate_start_time_index(cursor):
+    """İçe aktarmada yinelenen seans denetimi için başlangıç zamanı indeksi."""
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_work_sessions_start ON work_sessions (start_time)'
+    )
+
+
+def counts_toward_totals(session_type, is_completed):
+    """Seans günlük toplamlara dahil ediliyor mu?"""
+    return session_type == 'work' and bool(is_completed)
+
+
+# Sıralı şema göçleri. Liste indeksi + 1, göçten sonraki user_version değeridir.
+MIGRATIONS = [
+    _migrate_day_column,
+    _migrate_integer_timestamps,
+    _migrate_daily_totals,
+    _migrate_chart_renderer_setting,
+    _migrate_period_totals,
+    _migrate_start_time_index,
+]
+
+
+class DatabaseManager(SessionStore):
+    """SQLite deposu."""
+    
+    def __init__(self, db_path="data/pomodoro.db", write_behind=False, max_readers=4, cache_size=64):
+        super().__init__(cache_size=cache_size)
         
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         self.db_path = db_path
-        self.conn = None
+        self.max_readers = max_readers
+        
+        # Tek yazıcı bağlantısı ve iş parçacıklarına ödünç verilen okuma havuzu.
+        # Arka plan iş parçacıkları sorgu için connections.reader() kullanabilir.
+        self.connections = ConnectionManager(db_path, max_readers=max_readers)
+        
+        # write_behind=True ise yazmalar arka plandaki yazıcıda toplu commit edilir.
+        self.write_behind = write_behind
+        self._writer = None
     
     def get_connection(self):
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
-        return self.conn
+        """Yazıcı bağlantısını döndür (kurulum ve göçler için)."""
+        return self.connections.writer_connection()
     
     def setup_database(self):
         conn = self.get_connection()
+        # Okuma havuzunun yazıcıyı beklemeden çalışabilmesi için WAL kipi.
+        conn.execute('PRAGMA journal_mode=WAL')
         cursor = conn.cursor()
         
         # Çalışma seansları tablosu.
@@ -47,56 +327,350 @@ class DatabaseManager:
         cursor.execute('INSERT OR IGNORE INTO settings (id) VALUES (1)')
         
         conn.commit()
+        
+        self._run_migrations()
+        
+        if self.write_behind:
+            self._start_writer()
     
-    def save_session(self, start_time, end_time, duration, is_completed=True, session_type="work"):
+    def _start_writer(self):
+        """Arka plan yazıcısını başlat."""
+        # WAL kipinde NORMAL, uygulama çökmelerine karşı yine de güvenlidir.
+        self.get_connection().execute('PRAGMA synchronous=NORMAL')
+        
+        self._writer = WriteBehindWriter(self.connections.writer)
+        self._writer.start()
+    
+    def _write(self, op, wait=False):
+        """Yazma işlemini çalıştır.
+        
+        Arka plan yazıcısı etkinse işlem kuyruğa alınır; wait=True ise sonucu
+        beklenir. Aksi halde işlem doğrudan çalıştırılıp commit edilir.
+        """
+        if self._writer is not None:
+            # Okumalar kuyruğu boşalttıktan sonra sorgulandığından sürüm hemen artırılabilir.
+            future = self._writer.submit(op)
+            self._bump_version()
+            return future.result() if wait else None
+        
+        with self.connections.writer() as conn:
+            cursor = conn.cursor()
+            try:
+                result = op(cursor)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            # Sürüm commit'ten sonra artırılır; yeni sürümle okunan her sonuç yazmayı içerir.
+            self._bump_version()
+            return result
+    
+    def _reader(self):
+        """Okuma bağlantısı ödünç al; bekleyen yazmaların görünmesini sağla."""
+        if self._writer is not None:
+            self._writer.flush()
+        return self.connections.reader()
+    
+    def flush(self):
+        """Kuyrukta bekleyen yazmaları diske yaz."""
+        if self._writer is not None:
+            self._writer.flush()
+    
+    def _run_migrations(self):
+        """Eksik şema göçlerini sırayla uygula."""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO work_sessions (start_time, end_time, duration, is_completed, session_type) VALUES (?, ?, ?, ?, ?)',
-            (start_time, end_time, duration, is_completed, session_type)
-        )
-        conn.commit()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        
+        needs_vacuum = False
+        
+        for index in range(version, len(MIGRATIONS)):
+            # Her göç kendi işleminde çalışır; hata olursa geri alınır.
+            cursor = conn.cursor()
+            cursor.execute('BEGIN')
+            migration = MIGRATIONS[index]
+            try:
+                migration(cursor)
+                cursor.execute(f'PRAGMA user_version = {index + 1}')
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            # VACUUM yalnızca _vacuum_after ile işaretlenen göçlerden sonra çalışır.
+            needs_vacuum = needs_vacuum or getattr(migration, 'needs_vacuum', False)
+        
+        if needs_vacuum:
+            conn.execute('VACUUM')
+    
+    @instrumentation.timed('db.save_session')
+    def save_session(self, start_time, end_time, duration, is_completed=True, session_type="work"):
+        start_ts, utc_offset = to_epoch(start_time)
+        end_ts = to_epoch(end_time)[0] if end_time is not None else None
+        day = local_day_key(start_ts, utc_offset)
+        
+        def op(cursor):
+            cursor.execute(
+                'INSERT INTO work_sessions (start_time, end_time, utc_offset, duration, is_completed, session_type, day) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (start_ts, end_ts, utc_offset, duration, int(bool(is_completed)), session_type, day)
+            )
+            # Özet tablo aynı işlem içinde güncellenir.
+            if counts_toward_totals(session_type, is_completed):
+                _apply_daily_total(cursor, day, duration, 1)
+        
+        self._write(op)
+    
+    @instrumentation.timed('db.delete_session')
+    def delete_session(self, session_id):
+        """Bir seansı sil ve günlük toplamları düzelt."""
+        def op(cursor):
+            cursor.execute(
+                'SELECT day, duration, is_completed, session_type FROM work_sessions WHERE id = ?',
+                (session_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            
+            cursor.execute('DELETE FROM work_sessions WHERE id = ?', (session_id,))
+            if counts_toward_totals(row['session_type'], row['is_completed']):
+                _apply_daily_total(cursor, row['day'], -row['duration'], -1)
+            return True
+        
+        return self._write(op, wait=True)
     
+    @instrumentation.timed('db.rebuild_daily_totals')
+    def rebuild_daily_totals(self):
+        """Günlük ve dönemsel toplamlar tablolarını ham seanslardan yeniden oluştur."""
+        def op(cursor):
+            cursor.execute('DELETE FROM daily_totals')
+            cursor.execute(_REBUILD_DAILY_TOTALS_SQL)
+            _rebuild_period_totals(cursor)
+            return cursor.execute('SELECT COUNT(*) FROM daily_totals').fetchone()[0]
+        
+        return self._write(op, wait=True)
+    
+    @instrumentation.timed('db.import_sessions')
+    def import_sessions(self, rows):
+        """Seansları tek işlemde toplu ekle; başlangıç zamanı var olanları atla.
+        
+        rows, (start_time, end_time, utc_offset, duration, is_completed,
+        session_type) demetleri üreten bir yinelenebilirdir; zamanlar epoch
+        saniyesidir. Eklenen ve atlanan seans sayılarını döndürür.
+        """
+        def op(cursor):
+            # Satırlar önce geçici tabloya executemany ile akıtılır; yinelenenler
+            # orada ayıklanır, toplamlar yalnızca eklenen seanslardan güncellenir.
+            cursor.execute('DROP TABLE IF EXISTS temp.import_sessions')
+            # start_time birincil anahtardır: dosya içindeki yinelenenlerden
+            # ilki kalır ve tablo başlangıç zamanına göre sıralı tutulur.
+            cursor.execute('''
+            CREATE TEMP TABLE import_sessions (
+                start_time INTEGER PRIMARY KEY,
+                end_time INTEGER,
+                utc_offset INTEGER NOT NULL,
+                duration INTEGER,
+                is_completed INTEGER,
+                session_type TEXT,
+                day INTEGER NOT NULL
+            )
+            ''')
+            
+            total = 0
+            
+            def staged():
+                nonlocal total
+                for start_ts, end_ts, utc_offset, duration, is_completed, session_type in rows:
+                    total += 1
+                    yield (start_ts, end_ts, utc_offset, duration, int(bool(is_completed)),
+                           session_type, local_day_key(start_ts, utc_offset))
+            
+            cursor.executemany('INSERT OR IGNORE INTO import_sessions VALUES (?, ?, ?, ?, ?, ?, ?)', staged())
+            
+            # Veritabanında zaten olan seanslar atlanır.
+            cursor.execute(
+                'DELETE FROM import_sessions WHERE EXISTS '
+                '(SELECT 1 FROM work_sessions WHERE work_sessions.start_time = import_sessions.start_time)'
+            )
+            
+            cursor.execute(
+                'INSERT INTO work_sessions (start_time, end_time, utc_offset, duration, '
+                'is_completed, session_type, day) '
+                'SELECT start_time, end_time, utc_offset, duration, is_completed, session_type, day '
+                'FROM import_sessions ORDER BY start_time'
+            )
+            inserted = cursor.rowcount
+            
+            daily = cursor.execute(
+                "SELECT day, SUM(duration), COUNT(*) FROM import_sessions "
+                "WHERE session_type = 'work' AND is_completed = 1 GROUP BY day"
+            ).fetchall()
+            _add_totals(cursor, daily)
+            
+            cursor.execute('DROP TABLE temp.import_sessions')
+            return inserted, total - inserted
+        
+        return self._write(op, wait=True)
+    
+    @instrumentation.timed('db.get_sessions_by_date')
     def get_sessions_by_date(self, date):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        date_str = date.strftime("%Y-%m-%d")
-        cursor.execute(
-            'SELECT * FROM work_sessions WHERE date(start_time) = ? ORDER BY start_time',
-            (date_str,)
+        return self._cached(
+            ('sessions_by_date', day_key(date)),
+            lambda: self._load_sessions_by_date(date)
         )
-        return cursor.fetchall()
     
-    def get_statistics(self, start_date, end_date):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            '''
-            SELECT date(start_time) as work_date, 
-                   SUM(duration) as total_duration,
-                   COUNT(*) as session_count
-            FROM work_sessions 
-            WHERE date(start_time) BETWEEN ? AND ?
-              AND session_type = 'work'
-              AND is_completed = 1
-            GROUP BY date(start_time)
-            ORDER BY work_date
-            ''',
-            (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+    @instrumentation.timed('db.load_sessions_by_date')
+    def _load_sessions_by_date(self, date):
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = session_record
+            cursor.execute(
+                f"SELECT {', '.join(SESSION_FIELDS)} FROM work_sessions WHERE day = ? ORDER BY start_time",
+                (day_key(date),)
+            )
+            return cursor.fetchall()
+    
+    @instrumentation.timed('db.iter_session_chunks')
+    def iter_session_chunks(self, start_date=None, end_date=None, *, session_type=None,
+                            chunk_size=SESSION_CHUNK_SIZE):
+        """iter_sessions gibi, ama seansları en fazla chunk_size'lık listeler halinde üret.
+        
+        Satırlar fetchmany ile okunur; bellek kullanımı aralığın uzunluğundan
+        bağımsızdır. Okuma bağlantısı üreteç tükenene ya da kapatılana kadar
+        ödünç alınmış kalır; üreteç onu başlatan iş parçacığında tüketilmelidir.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size en az 1 olmalıdır.")
+        
+        query = f"SELECT {', '.join(SESSION_FIELDS)} FROM work_sessions"
+        conditions = []
+        params = []
+        if start_date is not None:
+            conditions.append('day >= ?')
+            params.append(day_key(start_date))
+        if end_date is not None:
+            conditions.append('day <= ?')
+            params.append(day_key(end_date))
+        if session_type is not None:
+            conditions.append('session_type = ?')
+            params.append(session_type)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY start_time'
+        
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = session_record
+            cursor.arraysize = chunk_size
+            try:
+                cursor.execute(query, params)
+                while True:
+                    sessions = cursor.fetchmany()
+                    if not sessions:
+                        break
+                    yield sessions
+            finally:
+                cursor.close()
+    
+    @instrumentation.timed('db.get_statistics')
+    def get_statistics(self, start_date, end_date, granularity='day', columnar=False):
+        """Tamamlanan çalışma seanslarının kova başına toplamlarını döndür.
+        
+        work_date alanı kova anahtarıdır (bkz. core.periods). Aralığın
+        kenarındaki kısmi kovalar yalnızca aralık içindeki günleri içerir.
+        Sonuç StatRecord listesidir; columnar=True ise StatisticsColumns.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Bilinmeyen ayrıntı düzeyi: {granularity}")
+        
+        if granularity == 'day':
+            load = lambda: self._load_statistics(start_date, end_date, columnar)
+        else:
+            load = lambda: self._load_period_statistics(start_date, end_date, granularity, columnar)
+        
+        return self._cached(
+            ('statistics', day_key(start_date), day_key(end_date), granularity, columnar),
+            load
         )
+    
+    def _fetch_statistics(self, cursor, query, params, columnar):
+        """İstatistik sorgusunu çalıştır; kayıt listesi ya da sütunlar döndür."""
+        cursor.row_factory = None if columnar else stat_record
+        cursor.execute(query, params)
+        if columnar:
+            return StatisticsColumns.from_rows(cursor.fetchall())
         return cursor.fetchall()
     
+    @instrumentation.timed('db.load_period_statistics')
+    def _load_period_statistics(self, start_date, end_date, granularity, columnar=False):
+        """Tam kovaları period_totals'tan, kenar kovaları daily_totals'tan oku."""
+        if start_date > end_date:
+            return StatisticsColumns.from_rows([]) if columnar else []
+        
+        first = bucket_key(granularity, start_date)
+        last = bucket_key(granularity, end_date)
+        first_partial = bucket_start(granularity, first) < start_date
+        last_partial = bucket_end(granularity, last) > end_date
+        
+        inner_first = next_bucket_key(granularity, first) if first_partial else first
+        inner_last = last
+        if last_partial:
+            # Son kovadan bir önceki kova; kısmi kova hiç iç kova bırakmayabilir.
+            inner_last = bucket_key(granularity, bucket_start(granularity, last) - timedelta(days=1))
+        
+        parts = ['''
+            SELECT bucket AS work_date, total_duration, session_count
+            FROM period_totals
+            WHERE granularity = ? AND bucket BETWEEN ? AND ?
+        ''']
+        params = [granularity, inner_first, inner_last]
+        
+        edges = []
+        if first_partial:
+            edges.append((first, start_date, min(end_date, bucket_end(granularity, first))))
+        if last_partial and not (first_partial and last == first):
+            edges.append((last, max(start_date, bucket_start(granularity, last)), end_date))
+        
+        for key, edge_start, edge_end in edges:
+            # Sabit anahtara göre gruplanır: kenarda gün yoksa satır da dönmez.
+            # (GROUP BY olmadan HAVING, SQLite 3.39'dan eskisinde hata verir.)
+            parts.append('''
+            SELECT ? AS work_date, SUM(total_duration), SUM(session_count)
+            FROM daily_totals
+            WHERE day BETWEEN ? AND ?
+            GROUP BY work_date
+            ''')
+            params.extend([key, day_key(edge_start), day_key(edge_end)])
+        
+        query = '\nUNION ALL\n'.join(parts) + '\nORDER BY work_date'
+        
+        with self._reader() as conn:
+            return self._fetch_statistics(conn.cursor(), query, params, columnar)
+    
+    @instrumentation.timed('db.load_statistics')
+    def _load_statistics(self, start_date, end_date, columnar=False):
+        with self._reader() as conn:
+            return self._fetch_statistics(
+                conn.cursor(),
+                '''
+                SELECT day as work_date, 
+                       total_duration,
+                       session_count
+                FROM daily_totals 
+                WHERE day BETWEEN ? AND ?
+                ORDER BY work_date
+                ''',
+                (day_key(start_date), day_key(end_date)),
+                columnar
+            )
+    
+    @instrumentation.timed('db.get_settings')
     def get_settings(self):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM settings WHERE id = 1')
-        return dict(cursor.fetchone())
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM settings WHERE id = 1')
+            return dict(cursor.fetchone())
     
+    @instrumentation.timed('db.update_settings')
     def update_settings(self, settings_dict):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        
         query = 'UPDATE settings SET '
         updates = []
         values = []
@@ -108,10 +682,13 @@ class DatabaseManager:
         
         query += ", ".join(updates) + " WHERE id = 1"
         
-        cursor.execute(query, values)
-        conn.commit()
+        self._write(lambda cursor: cursor.execute(query, values))
         
     def close(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None 
\ No newline at end of file
+        # Kapanmadan önce kuyruktaki tüm yazmalar diske yazılır.
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        # Tüm bağlantılar kapatılır; sonraki kullanımda yenileri açılır.
+        self.connections.close()
+        self.connections = ConnectionManager(self.db_path, max_readers=self.max_readers) 
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""Sıcak yollar için isteğe bağlı süre ölçümü.
+
+POMODORO_PROFILE ortam değişkeni ayarlıysa ölçümler sabit boyutlu bir halka
+tamponda (son POMODORO_PROFILE_BUFFER kayıt, varsayılan 10000) tutulur ve ad
+başına çağrı sayısı, toplam ve en büyük süre saklanır. Uygulama kapanırken
+özet JSON olarak POMODORO_PROFILE_OUTPUT dosyasına (varsayılan
+data/diagnostics.json) yazılır.
+
+Değişken açılışta bir kez okunur. Kapalıyken timed() fonksiyonları olduğu gibi
+döndürür; ölçülen kodda hiçbir ek iş yapılmaz.
+"""
+import atexit
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+ENABLED = bool(os.environ.get("POMODORO_PROFILE"))
+BUFFER_SIZE = int(os.environ.get("POMODORO_PROFILE_BUFFER") or 10000)
+OUTPUT_PATH = os.environ.get("POMODORO_PROFILE_OUTPUT") or os.path.join("data", "diagnostics.json")
+
+PERCENTILES = (50, 90, 99)
+
+
+class Recorder:
+    """Ölçüm kayıtlarının halka tamponu ve ad başına sayaçlar.
+
+    Kayıtlar (ad, bitiş anı, süre_ms, değer) demetleridir; değer isteğe
+    bağlıdır (ör. zamanlayıcının gecikmesi). İş parçacıklarından çağrılabilir.
+    """
+
+    def __init__(self, size=BUFFER_SIZE):
+        self.started = datetime.now()
+        self._events = deque(maxlen=size)
+        self._totals = {}  # ad -> [sayı, toplam_ms, en_büyük_ms]
+        self._lock = threading.Lock()
+
+    def record(self, name, duration_ms, value=None):
+        with self._lock:
+            self._events.append((name, time.monotonic(), duration_ms, value))
+            totals = self._totals.get(name)
+            if totals is None:
+                self._totals[name] = [1, duration_ms, duration_ms]
+            else:
+                totals[0] += 1
+                totals[1] += duration_ms
+                if duration_ms > totals[2]:
+                    totals[2] = duration_ms
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._totals.clear()
+
+    def snapshot(self, recent=100):
+        """Ad başına özet ve son kayıtları sözlük olarak döndür.
+
+        Yüzdelikler yalnızca tampondaki son kayıtlardan hesaplanır; sayı,
+        toplam ve en büyük değer açılıştan beri tutulur.
+        """
+        with self._lock:
+            events = list(self._events)
+            totals = {name: list(values) for name, values in self._totals.items()}
+
+        durations = {}
+        values = {}
+        for name, _, duration_ms, value in events:
+            durations.setdefault(name, []).append(duration_ms)
+            if value is not None:
+                values.setdefault(name, []).append(value)
+
+        summary = {}
+        for name, (count, total_ms, max_ms) in sorted(totals.items()):
+            entry = {
+                'count': count,
+                'total_ms': total_ms,
+                'mean_ms': total_ms / count,
+                'max_ms': max_ms,
+            }
+            entry.update(_percentiles(durations.get(name, []), '_ms'))
+            if name in values:
+                entry['value'] = _percentiles(values[name], '')
+                entry['value']['max'] = max(values[name])
+            summary[name] = entry
+
+        now = time.monotonic()
+        return {
+            'started': self.started.isoformat(timespec='seconds'),
+            'buffer_size': self._events.maxlen,
+            'buffered': len(events),
+            'summary': summary,
+            'recent': [
+                {'name': name, 'age_s': round(now - at, 3), 'duration_ms': duration_ms, 'value': value}
+                for name, at, duration_ms, value in events[-recent:]
+            ],
+        }
+
+
+def _percentiles(samples, suffix):
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        f'p{p}{suffix}': ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1]
+        for p in PERCENTILES
+    }
+
+
+recorder = Recorder() if ENABLED else None
+
+
+def record(name, duration_ms, value=None):
+    """Bir ölçüm ekle; ölçüm kapalıysa bir şey yapmaz."""
+    if recorder is not None:
+        recorder.record(name, duration_ms, value)
+
+
+def timed(name):
+    """Fonksiyonun her çağrısının süresini name adıyla kaydeden süsleyici.
+
+    Üreteç fonksiyonlarında üretecin tükenmesine kadar geçen süre ölçülür.
+    Ölçüm kapalıysa fonksiyon değiştirilmeden döndürülür.
+    """
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    yield from fn(*args, **kwargs)
+                finally:
+                    recorder.record(name, (time.perf_counter() - started) * 1000.0)
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                recorder.record(name, (time.perf_counter() - started) * 1000.0)
+        return wrapper
+    return decorator
+
+
+def snapshot(recent=100):
+    """Ölçüm özetini döndür; ölçüm kapalıysa None."""
+    if recorder is None:
+        return None
+    return recorder.snapshot(recent)
+
+
+def dump(path=None):
+    """Ölçüm özetini JSON dosyasına yaz; yazılan yolu döndür."""
+    if recorder is None:
+        return None
+    path = path or OUTPUT_PATH
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(recorder.snapshot(recent=BUFFER_SIZE), f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"Tanılama verisi yazılırken hata: {e}")
+        return None
+    return path
+
+
+if ENABLED:
+    atexit.register(dump)
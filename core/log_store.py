@@ -0,0 +1,205 @@
+"""Yalnızca sona eklenen günlük dosyasıyla kalıcı hale getirilen seans deposu.
+
+Sorgular MemoryStore'un bellek içi indeksleriyle yanıtlanır; her yazma
+günlüğün sonuna tek satır olarak eklenir. Satırlar sekmeyle ayrılır:
+
+    S  id  başlangıç  bitiş  utc_farkı  süre  tamamlandı  tür   (seans)
+    D  id                                                       (silme)
+    C  {json}                                                   (ayar değişikliği)
+
+Boş alan None demektir; tür JSON dizgisi olarak yazılır. Açılışta günlük
+baştan okunarak indeksler yeniden kurulur. Yazmalar dosya tamponunda
+birikir; tampon boşaltılmadan kalan yazmalar en geç flush_interval saniye
+sonra arka plandaki bir zamanlayıcıyla işletim sistemine aktarılır. close()
+ayrıca fsync yapar. Silinen seanslar compact() ile günlükten atılır
+(``python manage.py --storage log compact``).
+"""
+import json
+import os
+import threading
+import time
+
+from core.database import local_day_key
+from core.memory_store import MemoryStore
+from core.records import SessionRecord
+from core.storage import DEFAULT_SETTINGS
+
+
+def _optional_int(value):
+    return int(value) if value else None
+
+
+def _optional_text(value):
+    return '' if value is None else str(value)
+
+
+class LogStore(MemoryStore):
+    """Günlük dosyalı bellek içi depo."""
+
+    def __init__(self, log_path=os.path.join("data", "pomodoro.log"), cache_size=64,
+                 flush_interval=0.05):
+        super().__init__(cache_size=cache_size)
+        directory = os.path.dirname(log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.log_path = log_path
+        self.flush_interval = flush_interval
+        self._file = None
+        self._file_lock = threading.Lock()
+        self._last_flush = 0.0
+        # Tampondaki yazmaları süre dolunca boşaltan zamanlayıcı (threading.Timer)
+        self._flush_timer = None
+        self._encoded_types = {}
+
+    def setup_database(self):
+        with self._lock:
+            self._close_file()
+            self._reset()
+            self._replay()
+            self._bump_version()
+
+    def _replay(self):
+        """Günlüğü baştan okuyup indeksleri kur."""
+        if not os.path.exists(self.log_path):
+            return
+
+        rows = {}  # id -> seans alanları
+        decoded_types = {}
+        last_id = 0
+        valid_bytes = 0
+        with open(self.log_path, 'rb') as log:
+            for line_number, raw in enumerate(log, 1):
+                if not raw.endswith(b'\n'):
+                    # Yazılırken kesilmiş son satır; sonraki eklemelerden önce atılır.
+                    print(f"Günlük dosyasının yarım kalan son satırı atlandı: {self.log_path}")
+                    break
+                fields = raw[:-1].decode('utf-8').split('\t')
+                try:
+                    kind = fields[0]
+                    if kind == 'S':
+                        session_id = int(fields[1])
+                        session_type = decoded_types.get(fields[7])
+                        if session_type is None:
+                            session_type = decoded_types[fields[7]] = json.loads(fields[7])
+                        rows[session_id] = (int(fields[2]), _optional_int(fields[3]), int(fields[4]),
+                                            _optional_int(fields[5]), int(fields[6]), session_type)
+                        last_id = max(last_id, session_id)
+                    elif kind == 'D':
+                        rows.pop(int(fields[1]), None)
+                    elif kind == 'C':
+                        self._settings.update(json.loads(fields[1]))
+                    elif kind:
+                        raise ValueError(f"bilinmeyen kayıt türü {kind!r}")
+                except (IndexError, ValueError) as e:
+                    raise ValueError(f"{self.log_path}:{line_number}: bozuk günlük satırı ({e})") from e
+                valid_bytes += len(raw)
+
+        if valid_bytes < os.path.getsize(self.log_path):
+            with open(self.log_path, 'r+b') as log:
+                log.truncate(valid_bytes)
+
+        sessions = [
+            SessionRecord(session_id, start_ts, end_ts, utc_offset, duration, is_completed,
+                          session_type, local_day_key(start_ts, utc_offset))
+            for session_id, (start_ts, end_ts, utc_offset, duration, is_completed, session_type)
+            in rows.items()
+        ]
+        sessions.sort(key=lambda session: (session.start_time, session.id))
+        self._sessions = sessions
+        self._starts = [session.start_time for session in sessions]
+        self._by_id = {session.id: session for session in sessions}
+        self._next_id = last_id + 1
+        self._rebuild_totals()
+
+    def _encode_type(self, session_type):
+        encoded = self._encoded_types.get(session_type)
+        if encoded is None:
+            encoded = self._encoded_types[session_type] = json.dumps(session_type)
+        return encoded
+
+    def _session_line(self, session):
+        return (f"S\t{session.id}\t{session.start_time}\t{_optional_text(session.end_time)}\t"
+                f"{session.utc_offset}\t{_optional_text(session.duration)}\t"
+                f"{session.is_completed}\t{self._encode_type(session.session_type)}\n")
+
+    def _append(self, text):
+        """Metni günlüğün sonuna ekle; gerekirse tamponu işletim sistemine aktar."""
+        with self._file_lock:
+            if self._file is None:
+                self._file = open(self.log_path, 'a', encoding='utf-8', newline='\n')
+            self._file.write(text)
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+            elif self._flush_timer is None:
+                # Ardından yazma gelmese de tampon flush_interval içinde boşaltılır.
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _persist_sessions(self, sessions):
+        if sessions:
+            self._append(''.join(self._session_line(session) for session in sessions))
+
+    def _persist_delete(self, session_id):
+        self._append(f"D\t{session_id}\n")
+
+    def _persist_settings(self, changes):
+        if changes:
+            self._append(f"C\t{json.dumps(changes, ensure_ascii=False)}\n")
+
+    def flush(self):
+        """Tampondaki yazmaları işletim sistemine aktar."""
+        with self._file_lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+
+    def close(self):
+        # Kapanmadan önce günlük diske yazılır; sonraki yazmada dosya yeniden açılır.
+        with self._lock:
+            self._close_file()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _close_file(self):
+        with self._file_lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def compact(self):
+        """Günlüğü yalnızca güncel seans ve ayarlarla yeniden yaz.
+
+        Yeni günlük geçici dosyaya yazılıp eskisinin yerine atomik olarak
+        taşınır. Yazılan satır sayısını döndürür.
+        """
+        with self._lock:
+            self._close_file()
+            lines = [self._session_line(session) for session in self._sessions]
+            changes = {key: value for key, value in self._settings.items()
+                       if DEFAULT_SETTINGS.get(key) != value}
+            if changes:
+                lines.insert(0, f"C\t{json.dumps(changes, ensure_ascii=False)}\n")
+
+            temp_path = self.log_path + ".tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8', newline='\n') as log:
+                    log.writelines(lines)
+                    log.flush()
+                    os.fsync(log.fileno())
+                os.replace(temp_path, self.log_path)
+            except OSError as e:
+                print(f"Günlük sıkıştırılırken hata: {e}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            return len(lines)
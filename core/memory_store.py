@@ -0,0 +1,274 @@
+"""Tamamen bellekte tutulan seans deposu.
+
+Seanslar başlangıç zamanına göre sıralı bir listede, günlük toplamlar gün
+anahtarına göre bir sözlükte tutulur. Hafta, ay ve yıl toplamları sorgu
+anında aralıktaki günlerden toplanır. Veriler kalıcı değildir; testler ve
+simülasyon için uygundur. LogStore aynı yapıları bir günlük dosyasıyla
+kalıcı hale getirir.
+"""
+import bisect
+import threading
+from operator import attrgetter
+
+from core import instrumentation
+from core.database import EPOCH_ORDINAL, counts_toward_totals, day_key, local_day_key, to_epoch
+from core.periods import GRANULARITIES, bucket_key_from_day
+from core.records import SessionRecord, StatisticsColumns, StatRecord
+from core.storage import DEFAULT_SETTINGS, SESSION_CHUNK_SIZE, SessionStore
+
+# Yerel gün ile UTC arasındaki en büyük fark (saniye); gün aralığına düşen
+# seansları başlangıç zamanı listesinde aramak için pencere payı.
+_MAX_UTC_OFFSET = 14 * 3600
+
+_start_time = attrgetter('start_time')
+
+
+class MemoryStore(SessionStore):
+    """Bellek içi depo; tüm metodlar iş parçacıkları arasında güvenlidir."""
+
+    def __init__(self, cache_size=64):
+        super().__init__(cache_size=cache_size)
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._sessions = []   # başlangıç zamanına göre sıralı SessionRecord listesi
+        self._starts = []     # _sessions ile paralel başlangıç zamanları
+        self._by_id = {}      # id -> SessionRecord
+        self._next_id = 1
+        self._days = {}       # gün anahtarı -> [toplam süre, seans sayısı]
+        self._day_keys = []   # _days anahtarlarının sıralı listesi
+        self._settings = dict(DEFAULT_SETTINGS)
+
+    def setup_database(self):
+        pass
+
+    def close(self):
+        pass
+
+    # Kalıcılık kancaları; LogStore bunları günlük dosyasına yazar.
+
+    def _persist_sessions(self, sessions):
+        pass
+
+    def _persist_delete(self, session_id):
+        pass
+
+    def _persist_settings(self, changes):
+        pass
+
+    @instrumentation.timed('db.save_session')
+    def save_session(self, start_time, end_time, duration, is_completed=True, session_type="work"):
+        start_ts, utc_offset = to_epoch(start_time)
+        end_ts = to_epoch(end_time)[0] if end_time is not None else None
+
+        with self._lock:
+            session = SessionRecord(self._next_id, start_ts, end_ts, utc_offset, duration,
+                                    int(bool(is_completed)), session_type,
+                                    local_day_key(start_ts, utc_offset))
+            self._next_id += 1
+            self._insert(session)
+            self._persist_sessions([session])
+            self._bump_version()
+
+    @instrumentation.timed('db.delete_session')
+    def delete_session(self, session_id):
+        with self._lock:
+            session = self._by_id.pop(session_id, None)
+            if session is None:
+                return False
+
+            index = bisect.bisect_left(self._starts, session.start_time)
+            while self._sessions[index].id != session_id:
+                index += 1
+            del self._sessions[index]
+            del self._starts[index]
+
+            if counts_toward_totals(session.session_type, session.is_completed):
+                self._add_day_total(session.day, -(session.duration or 0), -1)
+            self._persist_delete(session_id)
+            self._bump_version()
+            return True
+
+    @instrumentation.timed('db.rebuild_daily_totals')
+    def rebuild_daily_totals(self):
+        with self._lock:
+            self._rebuild_totals()
+            self._bump_version()
+            return len(self._days)
+
+    @instrumentation.timed('db.import_sessions')
+    def import_sessions(self, rows):
+        with self._lock:
+            # Girdi önce tümüyle okunur; hata olursa depo değişmez.
+            seen = set()
+            staged = []
+            total = 0
+            for start_ts, end_ts, utc_offset, duration, is_completed, session_type in rows:
+                total += 1
+                if start_ts in seen or self._has_start(start_ts):
+                    continue
+                seen.add(start_ts)
+                staged.append((start_ts, end_ts, utc_offset, duration, int(bool(is_completed)),
+                               session_type, local_day_key(start_ts, utc_offset)))
+
+            staged.sort()
+            sessions = []
+            for row in staged:
+                sessions.append(SessionRecord(self._next_id, *row))
+                self._next_id += 1
+            self._insert_many(sessions)
+            self._persist_sessions(sessions)
+            self._bump_version()
+            return len(sessions), total - len(sessions)
+
+    @instrumentation.timed('db.get_sessions_by_date')
+    def get_sessions_by_date(self, date):
+        key = day_key(date)
+        return self._cached(('sessions_by_date', key), lambda: self._sessions_between(key, key))
+
+    @instrumentation.timed('db.iter_session_chunks')
+    def iter_session_chunks(self, start_date=None, end_date=None, *, session_type=None,
+                            chunk_size=SESSION_CHUNK_SIZE):
+        """iter_sessions gibi, ama seansları en fazla chunk_size'lık listeler halinde üret.
+
+        Aralıktaki seansların listesi ilk parçadan önce alınır; sonraki
+        yazmalar üretilen seansları etkilemez.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size en az 1 olmalıdır.")
+
+        first = day_key(start_date) if start_date is not None else None
+        last = day_key(end_date) if end_date is not None else None
+        sessions = self._sessions_between(first, last)
+        if session_type is not None:
+            sessions = [session for session in sessions if session.session_type == session_type]
+        for index in range(0, len(sessions), chunk_size):
+            yield sessions[index:index + chunk_size]
+
+    @instrumentation.timed('db.get_statistics')
+    def get_statistics(self, start_date, end_date, granularity='day', columnar=False):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Bilinmeyen ayrıntı düzeyi: {granularity}")
+
+        def load():
+            rows = self._totals_between(day_key(start_date), day_key(end_date), granularity)
+            if columnar:
+                return StatisticsColumns.from_rows(rows)
+            return [StatRecord(*row) for row in rows]
+
+        return self._cached(
+            ('statistics', day_key(start_date), day_key(end_date), granularity, columnar),
+            load
+        )
+
+    @instrumentation.timed('db.get_settings')
+    def get_settings(self):
+        with self._lock:
+            return dict(self._settings)
+
+    @instrumentation.timed('db.update_settings')
+    def update_settings(self, settings_dict):
+        changes = {key: value for key, value in settings_dict.items() if key != 'id'}
+        with self._lock:
+            for key in changes:
+                if key not in self._settings:
+                    raise ValueError(f"Bilinmeyen ayar: {key}")
+            self._settings.update(changes)
+            self._persist_settings(changes)
+            self._bump_version()
+
+    def _insert(self, session):
+        """Seansı sıralı listeye ve toplamlara ekle."""
+        if not self._starts or session.start_time >= self._starts[-1]:
+            self._sessions.append(session)
+            self._starts.append(session.start_time)
+        else:
+            index = bisect.bisect_right(self._starts, session.start_time)
+            self._sessions.insert(index, session)
+            self._starts.insert(index, session.start_time)
+        self._by_id[session.id] = session
+        if counts_toward_totals(session.session_type, session.is_completed):
+            self._add_day_total(session.day, session.duration or 0, 1)
+
+    def _insert_many(self, sessions):
+        """Başlangıç sırasındaki seansları toplu ekle."""
+        if len(sessions) < 64:
+            for session in sessions:
+                self._insert(session)
+            return
+
+        if self._starts and sessions[0].start_time < self._starts[-1]:
+            # Kararlı sıralama eşit başlangıçlarda eski seansları önde tutar.
+            self._sessions.extend(sessions)
+            self._sessions.sort(key=_start_time)
+            self._starts = [session.start_time for session in self._sessions]
+        else:
+            self._sessions.extend(sessions)
+            self._starts.extend(session.start_time for session in sessions)
+
+        for session in sessions:
+            self._by_id[session.id] = session
+            if counts_toward_totals(session.session_type, session.is_completed):
+                self._add_day_total(session.day, session.duration or 0, 1)
+
+    def _has_start(self, start_ts):
+        index = bisect.bisect_left(self._starts, start_ts)
+        return index < len(self._starts) and self._starts[index] == start_ts
+
+    def _add_day_total(self, day, duration_delta, count_delta):
+        totals = self._days.get(day)
+        if totals is None:
+            self._days[day] = [duration_delta, count_delta]
+            bisect.insort(self._day_keys, day)
+            return
+        totals[0] += duration_delta
+        totals[1] += count_delta
+        if totals[1] <= 0:
+            del self._days[day]
+            del self._day_keys[bisect.bisect_left(self._day_keys, day)]
+
+    def _rebuild_totals(self):
+        self._days = {}
+        for session in self._sessions:
+            if counts_toward_totals(session.session_type, session.is_completed):
+                totals = self._days.setdefault(session.day, [0, 0])
+                totals[0] += session.duration or 0
+                totals[1] += 1
+        self._day_keys = sorted(self._days)
+
+    def _sessions_between(self, first_day=None, last_day=None):
+        """Gün aralığındaki seansları başlangıç sırasıyla döndür (sınırlar dahil)."""
+        with self._lock:
+            low = 0
+            high = len(self._starts)
+            if first_day is not None:
+                low = bisect.bisect_left(
+                    self._starts, (first_day - EPOCH_ORDINAL) * 86400 - _MAX_UTC_OFFSET)
+            if last_day is not None:
+                high = bisect.bisect_left(
+                    self._starts, (last_day + 1 - EPOCH_ORDINAL) * 86400 + _MAX_UTC_OFFSET)
+            window = self._sessions[low:high]
+
+        return [
+            session for session in window
+            if (first_day is None or session.day >= first_day)
+            and (last_day is None or session.day <= last_day)
+        ]
+
+    def _totals_between(self, first_day, last_day, granularity):
+        """Aralıktaki günlerin ya da kovaların (anahtar, süre, sayı) demetleri."""
+        with self._lock:
+            low = bisect.bisect_left(self._day_keys, first_day)
+            high = bisect.bisect_right(self._day_keys, last_day)
+            days = [(day,) + tuple(self._days[day]) for day in self._day_keys[low:high]]
+
+        if granularity == 'day':
+            return days
+
+        buckets = {}
+        for day, duration, count in days:
+            totals = buckets.setdefault(bucket_key_from_day(granularity, day), [0, 0])
+            totals[0] += duration
+            totals[1] += count
+        return [(bucket, duration, count) for bucket, (duration, count) in sorted(buckets.items())]
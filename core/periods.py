@@ -0,0 +1,97 @@
+"""Gün, hafta, ay ve yıl kovaları için anahtar hesapları.
+
+Kova anahtarları tamsayıdır ve zamanla artar:
+
+- day: tarih sıra numarası (date.toordinal())
+- week: haftanın pazartesi gününün sıra numarası
+- month: yıl * 100 + ay
+- year: yıl
+"""
+from datetime import date, timedelta
+
+GRANULARITIES = ('day', 'week', 'month', 'year')
+
+
+def bucket_key(granularity, value):
+    """Tarihin verilen ayrıntı düzeyindeki kova anahtarını döndür."""
+    if granularity == 'day':
+        return value.toordinal()
+    if granularity == 'week':
+        return value.toordinal() - value.weekday()
+    if granularity == 'month':
+        return value.year * 100 + value.month
+    if granularity == 'year':
+        return value.year
+    raise ValueError(f"Bilinmeyen ayrıntı düzeyi: {granularity}")
+
+
+def bucket_key_from_day(granularity, day):
+    """Gün anahtarından (sıra numarası) kova anahtarını hesapla."""
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        # 0001-01-01 pazartesidir; (day - 1) % 7 hafta günüdür.
+        return day - (day - 1) % 7
+    return bucket_key(granularity, date.fromordinal(day))
+
+
+def bucket_start(granularity, key):
+    """Kovanın ilk gününü döndür."""
+    if granularity in ('day', 'week'):
+        return date.fromordinal(key)
+    if granularity == 'month':
+        return date(key // 100, key % 100, 1)
+    if granularity == 'year':
+        return date(key, 1, 1)
+    raise ValueError(f"Bilinmeyen ayrıntı düzeyi: {granularity}")
+
+
+def bucket_end(granularity, key):
+    """Kovanın son gününü döndür."""
+    return bucket_start(granularity, next_bucket_key(granularity, key)) - timedelta(days=1)
+
+
+def next_bucket_key(granularity, key):
+    """Bir sonraki kovanın anahtarını döndür."""
+    if granularity == 'day':
+        return key + 1
+    if granularity == 'week':
+        return key + 7
+    if granularity == 'month':
+        year, month = divmod(key, 100)
+        return (year + 1) * 100 + 1 if month == 12 else key + 1
+    if granularity == 'year':
+        return key + 1
+    raise ValueError(f"Bilinmeyen ayrıntı düzeyi: {granularity}")
+
+
+def bucket_index(granularity, key):
+    """Ardışık kovalar için ardışık tamsayı döndür (grafik konumu için)."""
+    if granularity == 'week':
+        return (key - 1) // 7
+    if granularity == 'month':
+        return (key // 100) * 12 + key % 100 - 1
+    return key
+
+
+def bucket_keys(granularity, start_date, end_date):
+    """Aralığa değen tüm kova anahtarlarını sırayla döndür."""
+    keys = []
+    key = bucket_key(granularity, start_date)
+    last = bucket_key(granularity, end_date)
+    while key <= last:
+        keys.append(key)
+        key = next_bucket_key(granularity, key)
+    return keys
+
+
+def auto_granularity(start_date, end_date):
+    """Grafikte yaklaşık 100 çubuğu aşmayacak ayrıntı düzeyini seç."""
+    span = (end_date - start_date).days + 1
+    if span <= 92:
+        return 'day'
+    if span <= 731:
+        return 'week'
+    if span <= 3660:
+        return 'month'
+    return 'year'
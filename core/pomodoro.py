@@ -1,9 +1,8 @@
 from PyQt6.QtCore import QObject, pyqtSignal
 
 import os
-os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
-import pygame
 from core.timer import TimerCore
+from core.sound import AlarmPlayer
 
 class PomodoroManager(QObject):
     # Sinyaller
@@ -11,7 +10,7 @@ class PomodoroManager(QObject):
     session_completed = pyqtSignal(str)  # session_type
     all_completed = pyqtSignal()  # Tüm pomodoro döngüsü tamamlandığında
     
-    def __init__(self, timer_core, db_manager):
+    def __init__(self, timer_core, db_manager, alarm=None):
         super().__init__()
         self.timer = timer_core
         self.db_manager = db_manager
@@ -26,10 +25,10 @@ class PomodoroManager(QObject):
         self.current_session_type = "work"  # work, short_break, long_break
         self.completed_work_sessions = 0
         
-        # Pygame ses modülünü başlat
-        pygame.mixer.init()
-        # Alarm dosyası direkt proje kök dizininde 
+        # Alarm dosyası direkt proje kök dizininde. Ses altyapısı ilk
+        # seans başlarken arka planda hazırlanır.
         self.alarm_file = os.path.abspath("alarm.wav")
+        self.alarm = alarm or AlarmPlayer(self.alarm_file)
         
         
         
@@ -46,6 +45,10 @@ class PomodoroManager(QObject):
     
     def start_next_session(self):
         """Bir sonraki seansı başlat."""
+        # Alarm süre dolmadan önce hazır olsun.
+        if self.sound_enabled:
+            self.alarm.warm_up()
+        
         if self.current_session_type == "work":
             # Çalışma seansı başlat
             self.timer.start(self.work_duration)
@@ -65,12 +68,7 @@ class PomodoroManager(QObject):
         """Sayaç tamamlandığında çağrılır."""
         # Alarm çal.
         if self.sound_enabled:
-            try:
-                # Pygame ile ses çalma
-                pygame.mixer.music.load(self.alarm_file)
-                pygame.mixer.music.play()
-            except Exception as e:
-                print(f"Ses çalınırken hata: {e}")
+            self.alarm.play()
         
         # Mevcut seansın tipini kaydet.
         completed_session_type = self.current_session_type
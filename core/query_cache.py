@@ -0,0 +1,54 @@
+import threading
+from collections import OrderedDict
+
+
+class QueryCache:
+    """Boyutu sınırlı, iş parçacığı güvenli LRU sorgu önbelleği.
+
+    Anahtarlar çağıranın belirlediği demetlerdir; veri sürümü anahtara dahil
+    edildiğinde eski sürümlere ait girdiler hiç okunmaz ve zamanla dışarı itilir.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """(bulundu_mu, değer) çiftini döndür."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key, value):
+        """Değeri önbelleğe ekle; sınır aşılırsa en eski girdiyi at."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Tüm girdileri sil (sayaçlar korunur)."""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        """İsabet/ıska sayaçlarını ve doluluğu döndür."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
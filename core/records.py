@@ -0,0 +1,78 @@
+"""Sorgu sonuçları için hafif kayıt sınıfları.
+
+Kayıtlar __slots__'u boş demetlerdir: sqlite3.Row gibi sütun açıklamasına
+bağlı ayrı bir nesne taşımazlar, değiştirilemezler ve alanlara öznitelik
+olarak erişilir (session.duration). Satır fabrikaları imleçten gelen demeti
+kopyalamadan kayda çevirir.
+
+Uzun aralıklardaki toplu okumalar için StatisticsColumns, her sütunu ayrı bir
+64 bitlik tamsayı dizisi (array('q')) olarak tutar; NumPy bu dizileri
+kopyalamadan okuyabilir.
+"""
+from array import array
+from collections import namedtuple
+
+# work_sessions sütunları; sorgular bu sırayla seçer.
+SESSION_FIELDS = ('id', 'start_time', 'end_time', 'utc_offset', 'duration',
+                  'is_completed', 'session_type', 'day')
+STAT_FIELDS = ('work_date', 'total_duration', 'session_count')
+
+_new_tuple = tuple.__new__
+
+
+class SessionRecord(namedtuple('SessionRecord', SESSION_FIELDS)):
+    """Bir çalışma seansı.
+
+    id (int veya None), start_time/end_time (UTC epoch saniyesi; end_time
+    None olabilir), utc_offset (saniye), duration (saniye, None olabilir),
+    is_completed (0/1), session_type (str), day (yerel gün anahtarı).
+    """
+    __slots__ = ()
+
+
+class StatRecord(namedtuple('StatRecord', STAT_FIELDS)):
+    """Bir gün veya kovanın toplamı.
+
+    work_date (gün ya da kova anahtarı), total_duration (saniye),
+    session_count (seans sayısı); hepsi int.
+    """
+    __slots__ = ()
+
+
+def session_record(cursor, row):
+    """sqlite3 satır fabrikası: satırı SessionRecord'a çevir."""
+    return _new_tuple(SessionRecord, row)
+
+
+def stat_record(cursor, row):
+    """sqlite3 satır fabrikası: satırı StatRecord'a çevir."""
+    return _new_tuple(StatRecord, row)
+
+
+class StatisticsColumns:
+    """İstatistik satırlarının sütun dizileri (her biri array('q')).
+
+    Önbellekte paylaşılabildiği için diziler değiştirilmemelidir.
+    """
+    __slots__ = STAT_FIELDS
+
+    def __init__(self, work_date, total_duration, session_count):
+        self.work_date = work_date
+        self.total_duration = total_duration
+        self.session_count = session_count
+
+    @classmethod
+    def from_rows(cls, rows):
+        """(work_date, total_duration, session_count) demetlerinden sütunlar oluştur."""
+        if not rows:
+            return cls(array('q'), array('q'), array('q'))
+        work_date, total_duration, session_count = zip(*rows)
+        return cls(array('q', work_date), array('q', total_duration), array('q', session_count))
+
+    def __len__(self):
+        return len(self.work_date)
+
+    def __iter__(self):
+        """Satırları StatRecord olarak üret."""
+        for row in zip(self.work_date, self.total_duration, self.session_count):
+            yield _new_tuple(StatRecord, row)
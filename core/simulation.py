@@ -0,0 +1,215 @@
+"""PomodoroManager'ı sanal saatle ekransız ve sessiz çalıştıran simülasyon.
+
+Sayaç VirtualClock'a bağlanır ve ekran kapalı kipe alınır. Böylece her seans
+için yalnızca bitiş anında tek bir olay işlenir ve binlerce döngü saniyeler
+içinde tamamlanır. Araya duraklatma, devam ettirme, sıfırlama ve başlatma
+olayları eklenebilir. Çalışma seansları, ana penceredeki gibi veritabanına
+kaydedilir.
+"""
+import random
+import time
+from collections import Counter
+
+from core.clock import VirtualClock
+from core.pomodoro import PomodoroManager
+from core.timer import TimerCore
+
+SIMULATION_ACTIONS = ("pause", "resume", "reset", "start")
+
+
+class SilentAlarm:
+    """Ses çalmayan, yalnızca çalma isteklerini sayan alarm."""
+
+    def __init__(self):
+        self.plays = 0
+
+    def warm_up(self):
+        pass
+
+    def play(self):
+        self.plays += 1
+
+
+class PomodoroSimulation:
+    """Pomodoro durum makinesini sanal zamanda çalıştırır ve değişmezleri denetler.
+
+    Denetlenen değişmezler:
+    - uzun moladan önce tam sessions_before_long_break çalışma seansı tamamlanır,
+    - her çalışma seansında başlangıçtan bitişe sanal saatte geçen süre,
+      duraklatmalar çıkarıldığında ayarlanan çalışma süresine eşittir. Süre
+      sayacın kendi hesabından değil, durum değişikliklerinin sanal saat
+      anlarından bağımsız olarak hesaplanır.
+    """
+
+    def __init__(self, db_manager, clock=None, record_sessions=True):
+        self.db_manager = db_manager
+        self.clock = clock or VirtualClock()
+        self.record_sessions = record_sessions
+
+        self.timer = TimerCore(self.clock)
+        # Ekran yok; saniye uyanışlarına gerek yok.
+        self.timer.set_display_active(False)
+        self.alarm = SilentAlarm()
+        self.manager = PomodoroManager(self.timer, db_manager, alarm=self.alarm)
+        self.manager.session_completed.connect(self._on_session_completed)
+        self.timer.state_changed.connect(self._on_state_changed)
+
+        self.completed = Counter()
+        self.actions = Counter()
+        self.cycles = 0
+        self.recorded_sessions = 0
+        self.violations = []
+
+        # Son uzun moladan (veya sıfırlamadan) beri tamamlanan çalışma seansları
+        self._work_since_long_break = 0
+
+        # Sanal saatle seans süresi: başlangıç anı, toplam duraklatma ve son
+        # duruşta ölçülen, duraklatmalar hariç geçen süre.
+        self._state = self.timer.state
+        self._run_started_at = None
+        self._paused_at = None
+        self._paused_total = 0.0
+        self._last_run_seconds = None
+
+    def schedule(self, at, action):
+        """Sanal at anında (saniye) bir olay uygula."""
+        if action not in SIMULATION_ACTIONS:
+            raise ValueError(f"Bilinmeyen simülasyon olayı: {action}")
+        self.clock.call_at(at, lambda: self._apply(action))
+
+    def schedule_random_events(self, until, events_per_hour, seed=None):
+        """until anına kadar rastgele duraklatma/devam ve sıfırlama/başlatma ekle.
+
+        Olaylar çiftler halinde eklenir; her kesintiden sonra sayaç yeniden
+        çalışır durumdadır.
+        """
+        rng = random.Random(seed)
+        rate = events_per_hour / 3600.0
+        if rate <= 0:
+            return 0
+
+        count = 0
+        at = rng.expovariate(rate)
+        while at < until:
+            gap = rng.uniform(5, 15 * 60)
+            if rng.random() < 0.8:
+                self.schedule(at, "pause")
+                self.schedule(at + gap, "resume")
+            else:
+                self.schedule(at, "reset")
+                self.schedule(at + gap, "start")
+            count += 2
+            at += gap + rng.expovariate(rate)
+        return count
+
+    def run(self, cycles=None, until=None):
+        """cycles uzun mola tamamlanana ya da sanal until anına kadar çalıştır.
+
+        Çalışma raporunu döndürür.
+        """
+        if cycles is None and until is None:
+            raise ValueError("cycles veya until verilmelidir.")
+
+        started = time.perf_counter()
+        if self.timer.state == "stopped":
+            self.manager.start_next_session()
+
+        while cycles is None or self.cycles < cycles:
+            next_at = self.clock.next_event_time()
+            if next_at is None:
+                break
+            if until is not None and next_at > until:
+                self.clock.run_until(until)
+                break
+            self.clock.run_next()
+
+        if self.record_sessions:
+            self.db_manager.flush()
+        return self.report(time.perf_counter() - started)
+
+    def report(self, wall_seconds=None):
+        """Simülasyon sayaçlarını sözlük olarak döndür."""
+        report = {
+            'cycles': self.cycles,
+            'virtual_seconds': self.clock.monotonic(),
+            'completed': dict(self.completed),
+            'actions': dict(self.actions),
+            'alarms': self.alarm.plays,
+            'recorded_sessions': self.recorded_sessions,
+            'clock_events': self.clock.fired_events,
+            'violations': list(self.violations),
+        }
+        if wall_seconds is not None:
+            report['wall_seconds'] = wall_seconds
+            report['cycles_per_second'] = self.cycles / wall_seconds if wall_seconds > 0 else 0.0
+        return report
+
+    def _apply(self, action):
+        """Kullanıcı olayını uygula; o anki durumda anlamsızsa yok say."""
+        state = self.timer.state
+        if action == "pause" and state == "running":
+            self.timer.pause()
+        elif action == "resume" and state == "paused":
+            self.timer.resume()
+        elif action == "reset" and state != "stopped":
+            self.manager.reset()
+            self._work_since_long_break = 0
+        elif action == "start" and state == "stopped":
+            self.manager.start_next_session()
+        else:
+            return
+        self.actions[action] += 1
+
+    def _on_state_changed(self, state):
+        now = self.clock.monotonic()
+        if state == "running":
+            if self._state == "paused":
+                self._paused_total += now - self._paused_at
+            else:
+                self._run_started_at = now
+                self._paused_total = 0.0
+        elif state == "paused":
+            self._paused_at = now
+        elif state == "stopped" and self._run_started_at is not None:
+            paused = self._paused_total
+            if self._state == "paused":
+                paused += now - self._paused_at
+            self._last_run_seconds = now - self._run_started_at - paused
+            self._run_started_at = None
+        self._state = state
+
+    def _on_session_completed(self, session_type):
+        self.completed[session_type] += 1
+
+        if session_type == "work":
+            self._work_since_long_break += 1
+            self._record_work_session()
+        elif session_type == "long_break":
+            expected = self.manager.sessions_before_long_break
+            if self._work_since_long_break != expected:
+                self.violations.append(
+                    f"{self.clock.monotonic():.0f}. saniye: uzun moladan önce "
+                    f"{self._work_since_long_break} çalışma seansı (beklenen {expected})"
+                )
+            self._work_since_long_break = 0
+            self.cycles += 1
+
+    def _record_work_session(self):
+        duration = int(round(self.timer.current_elapsed()))
+        expected = self.manager.work_duration * 60
+        measured = self._last_run_seconds
+        if measured is None or abs(measured - expected) > 0.5:
+            self.violations.append(
+                f"{self.clock.monotonic():.0f}. saniye: çalışma seansı sanal saatle "
+                f"{measured if measured is None else round(measured, 3)} sn (beklenen {expected})"
+            )
+
+        if self.record_sessions:
+            self.db_manager.save_session(
+                start_time=self.timer.start_time,
+                end_time=self.clock.now(),
+                duration=duration,
+                is_completed=True,
+                session_type="work"
+            )
+            self.recorded_sessions += 1
@@ -0,0 +1,102 @@
+import os
+import threading
+
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+# Ekransız ortamlarda ses altyapısı hiç başlatılmaz.
+HEADLESS_PLATFORMS = ("offscreen", "minimal")
+
+
+class AlarmPlayer(QObject):
+    """Alarm sesini bir kez çözüp bellekte tutan, bloklamadan çalan oynatıcı.
+
+    Ses altyapısı ilk ihtiyaçta arka plan iş parçacığında başlatılır. Önce
+    pygame denenir; ses aygıtı yoksa Qt Multimedia'ya, o da yoksa sessiz
+    kipe düşülür. Çalma isteği altyapı hazır olmadan gelirse hazır olunca çalınır.
+    """
+
+    # Arka plandaki başlatma bitince arayüz iş parçacığına iletilir.
+    _backend_ready = pyqtSignal(str)
+
+    def __init__(self, sound_file):
+        super().__init__()
+        self.sound_file = sound_file
+
+        self.backend = None  # "pygame", "qt" veya "none"
+        self._sound = None
+        self._lock = threading.Lock()
+        self._init_started = False
+        self._play_pending = False
+
+        self._backend_ready.connect(self._on_backend_ready)
+
+    def warm_up(self):
+        """Ses altyapısını arka planda başlat (ikinci çağrıda bir şey yapmaz)."""
+        with self._lock:
+            if self._init_started:
+                return
+            self._init_started = True
+
+        if self._sound_disabled():
+            self._backend_ready.emit("none")
+            return
+
+        thread = threading.Thread(target=self._initialize, name="pomodoro-sound-init", daemon=True)
+        thread.start()
+
+    def play(self):
+        """Alarmı bloklamadan çal."""
+        if self.backend is None:
+            self._play_pending = True
+            self.warm_up()
+            return
+
+        try:
+            if self.backend in ("pygame", "qt"):
+                self._sound.play()
+        except Exception as e:
+            print(f"Ses çalınırken hata: {e}")
+
+    def _sound_disabled(self):
+        if os.environ.get("POMODORO_DISABLE_SOUND"):
+            return True
+        app = QGuiApplication.instance()
+        return app is not None and QGuiApplication.platformName() in HEADLESS_PLATFORMS
+
+    def _initialize(self):
+        """pygame mikserini başlat ve alarmı belleğe çöz (iş parçacığında)."""
+        try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "hide")
+            import pygame
+            pygame.mixer.init()
+            # Sound nesnesi dosyayı bir kez çözer; sonraki çalmalar bellekten yapılır.
+            self._sound = pygame.mixer.Sound(self.sound_file)
+            backend = "pygame"
+        except Exception as e:
+            print(f"pygame ses altyapısı kullanılamıyor: {e}")
+            backend = "qt"
+        self._backend_ready.emit(backend)
+
+    def _on_backend_ready(self, backend):
+        if backend == "qt":
+            backend = self._create_qt_sound()
+        self.backend = backend
+
+        if self._play_pending:
+            self._play_pending = False
+            self.play()
+
+    def _create_qt_sound(self):
+        """Qt Multimedia yedeğini kur; ses aygıtı yoksa "none" döndür."""
+        try:
+            from PyQt6.QtMultimedia import QMediaDevices, QSoundEffect
+        except ImportError:
+            return "none"
+
+        if not QMediaDevices.audioOutputs():
+            return "none"
+
+        self._sound = QSoundEffect(self)
+        self._sound.setSource(QUrl.fromLocalFile(self.sound_file))
+        return "qt"
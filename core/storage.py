@@ -0,0 +1,170 @@
+"""Seans deposu arayüzü ve yapılandırmaya göre depo seçimi.
+
+Arayüz ve veri katmanı yalnızca SessionStore metodlarını kullanır. Üç
+gerçekleme vardır:
+
+- sqlite: core.database.DatabaseManager; varsayılan, tek SQLite dosyası
+- memory: core.memory_store.MemoryStore; kalıcı olmayan, testler ve simülasyon için
+- log: core.log_store.LogStore; yalnızca sona eklenen günlük dosyası ve bellek
+  içi indeksler, çok yüksek yazma hızları için
+
+Hangi deponun kullanılacağı POMODORO_STORAGE ortam değişkeniyle seçilir:
+``sqlite``, ``memory`` veya ``log``; isteğe bağlı olarak ``:`` sonrasında dosya
+yolu verilebilir (ör. ``log:data/pomodoro.log``).
+"""
+import abc
+import os
+import threading
+
+from core.query_cache import QueryCache
+from core.records import StatisticsColumns
+
+STORAGE_BACKENDS = ('sqlite', 'memory', 'log')
+# iter_sessions'ın bir seferde okuduğu seans sayısı
+SESSION_CHUNK_SIZE = 5000
+DEFAULT_STORAGE = 'sqlite'
+DEFAULT_PATHS = {
+    'sqlite': os.path.join("data", "pomodoro.db"),
+    'log': os.path.join("data", "pomodoro.log"),
+}
+
+# Yeni bir deponun ayarları (SQLite şemasındaki varsayılanlarla aynı)
+DEFAULT_SETTINGS = {
+    'id': 1,
+    'work_duration': 25,
+    'short_break_duration': 5,
+    'long_break_duration': 15,
+    'sessions_before_long_break': 4,
+    'sound_enabled': 1,
+    'chart_renderer': 'matplotlib',
+}
+
+
+class SessionStore(abc.ABC):
+    """Seans depolarının ortak arayüzü.
+
+    Sürüm sayacı ve sorgu önbelleği burada tutulur: her yazma data_version'ı
+    artırır, önbellek anahtarları sürümü içerdiği için eski sonuçlar bir daha
+    okunmaz. Alt sınıflar soyut metodların hepsini gerçeklemelidir; eksik
+    metodu olan bir depo oluşturulamaz.
+    """
+
+    def __init__(self, cache_size=64):
+        self.data_version = 0
+        self._version_lock = threading.Lock()
+        self._cache = QueryCache(maxsize=cache_size)
+
+    @abc.abstractmethod
+    def setup_database(self):
+        """Depoyu kullanıma hazırla (şema, göçler, günlüğün yüklenmesi)."""
+
+    @abc.abstractmethod
+    def close(self):
+        """Bekleyen yazmaları kalıcı hale getir ve depoyu kapat."""
+
+    def flush(self):
+        """Bekleyen yazmaları kalıcı hale getir."""
+
+    @abc.abstractmethod
+    def save_session(self, start_time, end_time, duration, is_completed=True, session_type="work"):
+        """Seansı kaydet; zamanlar yerel ya da saat dilimli datetime değerleridir."""
+
+    @abc.abstractmethod
+    def delete_session(self, session_id):
+        """Seansı sil ve toplamları düzelt; seans bulunduysa True döndür."""
+
+    @abc.abstractmethod
+    def rebuild_daily_totals(self):
+        """Toplamları ham seanslardan yeniden oluştur; gün sayısını döndür."""
+
+    @abc.abstractmethod
+    def import_sessions(self, rows):
+        """Epoch değerli seans demetlerini toplu ekle; (eklenen, atlanan) döndür.
+
+        Başlangıç zamanı depoda ya da girdide daha önce bulunan seanslar
+        atlanır. Girdi okunurken hata olursa hiçbir seans eklenmez.
+        """
+
+    @abc.abstractmethod
+    def get_sessions_by_date(self, date):
+        """Günün seanslarını başlangıç sırasıyla SessionRecord listesi olarak döndür."""
+
+    def iter_sessions(self, start_date=None, end_date=None, *, session_type=None,
+                      chunk_size=SESSION_CHUNK_SIZE):
+        """Aralıktaki seansları başlangıç sırasıyla tek tek üret (SessionRecord).
+
+        Sınırlar dahildir, None verilen sınır uygulanmaz. Seanslar
+        chunk_size'lık parçalar halinde okunur; sonuçlar önbelleğe alınmaz.
+        """
+        for sessions in self.iter_session_chunks(start_date, end_date, session_type=session_type,
+                                                 chunk_size=chunk_size):
+            yield from sessions
+
+    @abc.abstractmethod
+    def iter_session_chunks(self, start_date=None, end_date=None, *, session_type=None,
+                            chunk_size=SESSION_CHUNK_SIZE):
+        """iter_sessions gibi, ama en fazla chunk_size'lık listeler halinde üret."""
+
+    @abc.abstractmethod
+    def get_statistics(self, start_date, end_date, granularity='day', columnar=False):
+        """Tamamlanan çalışma seanslarının kova başına toplamlarını döndür."""
+
+    @abc.abstractmethod
+    def get_settings(self):
+        """Ayarları sözlük olarak döndür."""
+
+    @abc.abstractmethod
+    def update_settings(self, settings_dict):
+        """Verilen ayarları güncelle ('id' yok sayılır)."""
+
+    def _bump_version(self):
+        with self._version_lock:
+            self.data_version += 1
+
+    def _cached(self, key, load):
+        """Sonucu sürüm anahtarlı önbellekten döndür, yoksa load() ile yükle."""
+        key = key + (self.data_version,)
+        found, rows = self._cache.get(key)
+        if not found:
+            rows = load()
+            self._cache.put(key, rows)
+        # Önbellekteki liste paylaşılmasın diye kopyası döndürülür; sütunlu
+        # sonuçlar kopyalanmadan paylaşılır.
+        if isinstance(rows, StatisticsColumns):
+            return rows
+        return list(rows)
+
+    def cache_info(self):
+        """Sorgu önbelleğinin isabet/ıska sayaçlarını döndür."""
+        info = self._cache.info()
+        info['data_version'] = self.data_version
+        return info
+
+
+def parse_storage_spec(spec):
+    """'arka_uç[:yol]' değerini (arka uç, yol) çiftine çevir."""
+    backend, _, path = (spec or DEFAULT_STORAGE).partition(':')
+    backend = backend.strip().lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Bilinmeyen depo: {backend} (seçenekler: {', '.join(STORAGE_BACKENDS)})")
+    return backend, path or DEFAULT_PATHS.get(backend)
+
+
+def open_store(spec=None, path=None, write_behind=False, cache_size=64):
+    """Yapılandırılan depoyu oluştur (setup_database çağrılmamış olarak).
+
+    spec verilmezse POMODORO_STORAGE kullanılır; path verilirse spec'teki
+    yolun yerine geçer. write_behind yalnızca SQLite deposu içindir.
+    """
+    backend, default_path = parse_storage_spec(spec or os.environ.get("POMODORO_STORAGE"))
+    path = path or default_path
+
+    if backend == 'memory':
+        from core.memory_store import MemoryStore
+        return MemoryStore(cache_size=cache_size)
+    if backend == 'log':
+        from core.log_store import LogStore
+        return LogStore(path, cache_size=cache_size)
+
+    from core.database import DatabaseManager
+    return DatabaseManager(path, write_behind=write_behind, cache_size=cache_size)
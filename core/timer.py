@@ -1,5 +1,19 @@
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
-from datetime import datetime, timedelta
+from PyQt6.QtCore import QObject, pyqtSignal
+from collections import deque
+from datetime import timedelta
+import math
+import time
+
+from core import instrumentation
+from core.clock import SystemClock
+
+# Bu süreden kısa beklemelerde ve bitiş anında hassas zamanlayıcı kullanılır.
+PRECISE_THRESHOLD_MS = 100
+# Kaba zamanlayıcı bir saniyelik beklemede en fazla bu kadar erken uyanabilir
+# (Qt: aralığın %5'i); saniye sınırına bu kadar yakın uyanış zamanında sayılır.
+COARSE_EARLY_TOLERANCE_MS = 50
+# Uyanış sayacının baktığı pencere (saniye)
+WAKEUP_WINDOW = 3600
 
 class TimerCore(QObject):
 
@@ -7,60 +21,131 @@ class TimerCore(QObject):
     completed = pyqtSignal() # Süre tamamlandığında
     state_changed = pyqtSignal(str) # Durum değiştiğinde
 
-    def __init__(self):
+    def __init__(self, clock=None):
         super().__init__()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._on_tick)
-        self.timer.setInterval(1000)
-
+        # Zaman kaynağı; simülasyonda sanal saat verilir.
+        self.clock = clock or SystemClock()
+
+        # Her uyanış bir sonraki saniye sınırına ya da bitiş anına tek atımlık kurulur.
+        # Ölçüm açıksa uyanışlar süre ve gecikmeleriyle kaydedilir.
+        on_tick = self._on_tick_instrumented if instrumentation.ENABLED else self._on_tick
+        self.timer = self.clock.create_timer(on_tick, self)
+
+        # Geçen süre monotonik saatle ölçülür; duvar saati atlamaları etkilemez.
+        self._clock = self.clock.monotonic
+        self._run_started = None  # Çalışan bölümün başladığı monotonik an
+        self._accumulated = 0.0   # Önceki (duraklatmadan önceki) bölümlerin toplamı
+        self._wake_target = None  # Zamanlayıcının uyanması gereken monotonik an
+        self._wake_is_deadline = False
+
+        # Sayaç ekranı görünmüyorken yalnızca bitiş anı için uyanılır.
+        self.display_active = True
+        self._wakeups = deque()  # Son bir saatteki uyanışların monotonik anları
+
+        # Kayıt için duvar saati başlangıcı (duraklatmalar kadar ileri kaydırılır)
         self.start_time = None
-        self.pause_time = None
         self.elapsed_seconds = 0
         self.duration = 0 # Hedef süre(saniye)
-        self.state = "stopped" 
-    
+        self.state = "stopped"
+
+        self.reset_lateness_stats()
+
     def start(self, duration_minutes=25):
 
         self.duration = duration_minutes * 60
 
         if self.state == "paused":
             # Duraklatılmış ise kaldığı yerden devam et.
-            self.elapsed_seconds = (datetime.now() - self.start_time).total_seconds() - self.pause_time.total_seconds()
-        else:
+            self.resume()
+            return
 
-            self.start_time = datetime.now()
-            self.elapsed_seconds = 0
+        self.start_time = self.clock.now()
+        self._accumulated = 0.0
+        self.elapsed_seconds = 0
+        self._run_started = self._clock()
 
         self.state = "running"
-        self.timer.start()
+        self._schedule()
         self.state_changed.emit(self.state)
 
     def pause(self):
-        
+
         if self.state == "running":
             self.timer.stop()
-            self.pause_time = datetime.now() - self.start_time
+            self._accumulated = self.current_elapsed()
+            self._run_started = None
+            self.elapsed_seconds = self._accumulated
             self.state = "paused"
             self.state_changed.emit(self.state)
 
     def resume(self):
 
         if self.state == "paused":
-            self.start_time = datetime.now() - self.pause_time
+            self._run_started = self._clock()
+            self.start_time = self.clock.now() - timedelta(seconds=self._accumulated)
             self.state = "running"
-            self.timer.start()
+            self._schedule()
             self.state_changed.emit(self.state)
 
     def reset(self):
 
         self.timer.stop()
         self.elapsed_seconds = 0
+        self._accumulated = 0.0
+        self._run_started = None
+        self._wake_target = None
         self.start_time = None
-        self.pause_time = None
         self.state = "stopped"
         self.state_changed.emit(self.state)
         self.tick.emit(0)
 
+    def current_elapsed(self):
+        """Şu ana kadar geçen tam süre (saniye, kesirli); duraklatmalar hariç."""
+        if self._run_started is None:
+            return self._accumulated
+        return min(self.duration, self._accumulated + self._clock() - self._run_started)
+
+    def set_display_active(self, active):
+        """Sayaç ekranı görünür mü? Görünmüyorsa saniye uyanışları atlanır."""
+        if active == self.display_active:
+            return
+        self.display_active = active
+        if self.state != "running":
+            return
+        if active:
+            # Ekran yeniden görünür olunca hemen güncel süreyi bildir.
+            self.elapsed_seconds = self.current_elapsed()
+            self.tick.emit(int(self.elapsed_seconds))
+        self._schedule()
+
+    def wakeups_per_hour(self):
+        """Son bir saatteki zamanlayıcı uyanışı sayısı."""
+        self._trim_wakeups(self._clock())
+        return len(self._wakeups)
+
+    def _trim_wakeups(self, now):
+        while self._wakeups and self._wakeups[0] <= now - WAKEUP_WINDOW:
+            self._wakeups.popleft()
+
+    def lateness_stats(self):
+        """Zamanlayıcı uyanışlarının hedefe göre gecikme istatistikleri (ms)."""
+        count = self._late_count
+        return {
+            'wakeups': count,
+            'early_wakeups': self._early_count,
+            'mean_ms': self._late_total_ms / count if count else 0.0,
+            'max_ms': self._late_max_ms,
+            'deadline_max_ms': self._deadline_late_max_ms,
+        }
+
+    def reset_lateness_stats(self):
+        """Gecikme istatistiklerini sıfırla."""
+        self._late_count = 0
+        self._early_count = 0
+        self._late_total_ms = 0.0
+        self._late_max_ms = 0.0
+        self._deadline_late_max_ms = 0.0
+
     def get_elapsed_time(self):
 
         hours, remainder = divmod(self.elapsed_seconds, 3600)
@@ -69,19 +154,84 @@ class TimerCore(QObject):
 
     def get_remaining_time(self):
 
-        remaining = max(0, self.duration - self.elapsed_seconds)
+        # Kalan süre yukarı yuvarlanır; 00:00:00 yalnızca bitişte görünür.
+        remaining = max(0, math.ceil(self.duration - self.elapsed_seconds))
         hours, remainder = divmod(remaining, 3600)
         minutes, seconds = divmod(remainder, 60)
         return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
 
-    def _on_tick(self):
+    def _schedule(self, not_before=None):
+        """Bir sonraki saniye sınırına veya bitiş anına tek atımlık uyanış kur.
+
+        not_before verilirse sınır o andan sonra aranır (erken kabul edilen uyanış).
+        """
+        now = self._clock()
+        reference = now if not_before is None else max(now, not_before)
+        elapsed = self._accumulated + reference - self._run_started
+        deadline = self._run_started + self.duration - self._accumulated
+        boundary = self._run_started + math.floor(elapsed) + 1 - self._accumulated
+
+        # Ekran görünmüyorsa saniye sınırları atlanır.
+        self._wake_is_deadline = not self.display_active or deadline <= boundary
+        self._wake_target = deadline if self._wake_is_deadline else boundary
+
+        delay_ms = max(0, math.ceil((self._wake_target - now) * 1000))
+        # Kaba zamanlayıcı aralığın %5'i kadar kayabilir; bitişte ve kısa
+        # beklemelerde hassas zamanlayıcı kullanılır.
+        precise = self._wake_is_deadline or delay_ms < PRECISE_THRESHOLD_MS
+        self.timer.start(delay_ms, precise=precise)
+
+    def _record_lateness(self, now):
+        late_ms = (now - self._wake_target) * 1000
+        if late_ms < 0:
+            self._early_count += 1
+            return
+        self._late_count += 1
+        self._late_total_ms += late_ms
+        self._late_max_ms = max(self._late_max_ms, late_ms)
+        if self._wake_is_deadline:
+            self._deadline_late_max_ms = max(self._deadline_late_max_ms, late_ms)
+
+    def _on_tick_instrumented(self):
+        """_on_tick'i çalıştır; süresini ve hedefe göre gecikmesini (ms) kaydet."""
+        started = time.perf_counter()
+        late_ms = None
+        if self._wake_target is not None:
+            late_ms = (self._clock() - self._wake_target) * 1000
+        self._on_tick()
+        instrumentation.record('timer.tick', (time.perf_counter() - started) * 1000.0, late_ms)
 
-        self.elapsed_seconds = (datetime.now() - self.start_time).total_seconds()
-        self.tick.emit(int(self.elapsed_seconds))
+    def _on_tick(self):
 
-        # Süre doldu mu?
-        if self.elapsed_seconds >= self.duration:
-            self.timer.stop()
+        if self.state != "running":
+            return
+
+        now = self._clock()
+        self._wakeups.append(now)
+        self._trim_wakeups(now)
+        self._record_lateness(now)
+
+        early_ms = (self._wake_target - now) * 1000
+        if early_ms > 0 and (self._wake_is_deadline or early_ms > COARSE_EARLY_TOLERANCE_MS):
+            # Fazla erken uyanış: kalan kısa süre için yeniden kur.
+            self._schedule()
+            return
+
+        # Saniye sınırına tolerans içinde erken uyanıldıysa sınır anı esas alınır.
+        target = max(now, self._wake_target)
+        self.elapsed_seconds = min(self.duration, self._accumulated + target - self._run_started)
+
+        # Süre doldu mu? Bitiş anına kurulan uyanış, kayan nokta yuvarlamasından
+        # bağımsız olarak bitiş sayılır.
+        if self._wake_is_deadline or self.elapsed_seconds >= self.duration:
+            self.elapsed_seconds = self.duration
+            self._accumulated = self.duration
+            self._run_started = None
+            self.tick.emit(int(self.duration))
             self.state = "stopped"
             self.state_changed.emit(self.state)
-            self.completed.emit()   
\ No newline at end of file
+            self.completed.emit()
+            return
+
+        self.tick.emit(int(self.elapsed_seconds))
+        self._schedule(not_before=target)
@@ -0,0 +1,132 @@
+"""Çalışma seanslarının CSV ve JSON Lines olarak dışa/içe aktarımı.
+
+Dışa aktarım seansları DatabaseManager.iter_session_chunks ile parça parça
+okuyup dosyaya akıtır; bellek kullanımı seans sayısından bağımsızdır. İçe
+aktarım dosyayı satır satır okuyup DatabaseManager.import_sessions'a üreteç
+olarak verir; tüm satırlar tek işlemde executemany ile eklenir.
+
+Zamanlar kayıpsız taşınsın diye veritabanındaki gibi UTC epoch saniyesi ve
+UTC farkı (saniye) olarak yazılır.
+"""
+import csv
+import json
+from operator import itemgetter
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_COLUMNS = ('start_time', 'end_time', 'utc_offset', 'duration', 'is_completed', 'session_type')
+EXPORT_CHUNK_SIZE = 5000
+
+# SessionRecord'dan dışa aktarılan alanlar (EXPORT_COLUMNS sırasıyla)
+_export_values = itemgetter(1, 2, 3, 4, 5, 6)
+
+
+def format_from_path(path, default='csv'):
+    """Dosya uzantısından biçimi tahmin et."""
+    if path.endswith('.jsonl') or path.endswith('.ndjson'):
+        return 'jsonl'
+    if path.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def export_sessions(db_manager, output, fmt='csv', start_date=None, end_date=None,
+                    chunk_size=EXPORT_CHUNK_SIZE):
+    """Seansları açık metin dosyasına yaz; yazılan satır sayısını döndür."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+
+    count = 0
+    chunks = db_manager.iter_session_chunks(start_date, end_date, chunk_size=chunk_size)
+    if fmt == 'csv':
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(EXPORT_COLUMNS)
+        for sessions in chunks:
+            writer.writerows(map(_export_values, sessions))
+            count += len(sessions)
+    else:
+        for sessions in chunks:
+            output.writelines(_jsonl_line(session) for session in sessions)
+            count += len(sessions)
+    return count
+
+
+# Satır başına json.dumps yerine hazır şablon; yalnızca metin alanı kodlanır.
+_JSONL_TEMPLATE = ('{{"start_time": {}, "end_time": {}, "utc_offset": {}, "duration": {}, '
+                   '"is_completed": {}, "session_type": {}}}\n')
+
+
+def _json_number(value):
+    return 'null' if value is None else int(value)
+
+
+def _jsonl_line(session):
+    start_time, end_time, utc_offset, duration, is_completed, session_type = _export_values(session)
+    return _JSONL_TEMPLATE.format(
+        start_time, _json_number(end_time), utc_offset, _json_number(duration),
+        _json_number(is_completed), json.dumps(session_type, ensure_ascii=False)
+    )
+
+
+def _optional_int(value):
+    return None if value in (None, '') else int(value)
+
+
+def _parse_values(start_time, end_time, utc_offset, duration, is_completed, session_type):
+    """Alan değerlerini import_sessions demetine çevir."""
+    return (
+        int(start_time),
+        _optional_int(end_time),
+        int(utc_offset or 0),
+        _optional_int(duration),
+        int(is_completed or 0),
+        session_type or 'work',
+    )
+
+
+def _read_csv(source):
+    reader = csv.reader(source)
+    header = next(reader, None)
+    if header is None or 'start_time' not in header:
+        raise ValueError("CSV başlığında start_time sütunu yok.")
+    
+    # Eksik sütunlar boş değer sayılır.
+    positions = [header.index(column) if column in header else None for column in EXPORT_COLUMNS]
+    if positions == list(range(len(EXPORT_COLUMNS))):
+        positions = None  # Dışa aktarımın kendi sütun sırası; doğrudan açılır.
+    
+    for line_number, values in enumerate(reader, start=2):
+        # Boş satırlar (ör. dosya sonundaki) atlanır.
+        if not values or not any(value.strip() for value in values):
+            continue
+        try:
+            if positions is None:
+                yield _parse_values(*values)
+            else:
+                yield _parse_values(*[values[i] if i is not None else None for i in positions])
+        except (IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"{line_number}. satır okunamadı: {e}") from e
+
+
+def _read_jsonl(source):
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+            yield _parse_values(*[values.get(column) for column in EXPORT_COLUMNS])
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"{line_number}. satır okunamadı: {e}") from e
+
+
+def read_sessions(source, fmt='csv'):
+    """Açık metin dosyasından seans demetlerini satır satır üret."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+    if fmt == 'csv':
+        return _read_csv(source)
+    return _read_jsonl(source)
+
+
+def import_sessions(db_manager, source, fmt='csv'):
+    """Dosyadaki seansları içe aktar; (eklenen, atlanan) döndür."""
+    return db_manager.import_sessions(read_sessions(source, fmt))
@@ -0,0 +1,172 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, wait
+
+from core import instrumentation
+
+# Okuyucunun beklediğini yazıcıya bildiren işaret: bekleme penceresi kısaltılır.
+_FLUSH = object()
+
+
+class WriteBehindWriter:
+    """Yazma işlemlerini arka plan iş parçacığında toplu olarak işleyen yazıcı.
+
+    Kuyruğa eklenen her işlem ``op(cursor)`` biçiminde bir çağrılabilirdir.
+    Kısa bir bekleme penceresinde biriken işlemler tek bir işlemde (transaction)
+    çalıştırılır ve tek commit ile diske yazılır. flush() bekleyen işlem yoksa
+    hemen döner; varsa pencerenin dolmasını beklemeden commit ettirir.
+    """
+
+    def __init__(self, writer, batch_delay=0.05, max_batch=256):
+        # writer: yazıcı bağlantısını kilit altında veren bağlam yöneticisi fabrikası.
+        self._writer = writer
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stopped = False
+        # İş parçacığını sonlandıran beklenmeyen hata; sonraki çağrılar bunu bildirir.
+        self._error = None
+        # Son eklenen işlemin Future'ı; partiler sırayla yazıldığından bu
+        # tamamlandıysa kuyrukta bekleyen işlem yoktur.
+        self._last_future = None
+        self._lock = threading.Lock()
+
+        # Gözlem için sayaçlar
+        self.committed_batches = 0
+        self.committed_operations = 0
+
+    def start(self):
+        """Yazıcı iş parçacığını başlat."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="pomodoro-db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, op):
+        """İşlemi kuyruğa ekle ve sonucu taşıyan Future döndür."""
+        with self._lock:
+            self._check_running()
+            if self._stopped:
+                raise RuntimeError("Yazıcı kapatıldı.")
+            future = Future()
+            self._queue.put((op, future))
+            self._last_future = future
+        return future
+
+    def flush(self):
+        """Kuyruktaki tüm işlemler diske yazılana kadar bekle."""
+        with self._lock:
+            self._check_running()
+            future = self._last_future
+            if future is None or future.done():
+                return
+            self._queue.put(_FLUSH)
+        # İş parçacığı ölürse bekleyen Future'lar hatayla tamamlanır.
+        wait([future])
+        self._check_running()
+
+    def _check_running(self):
+        if self._error is not None:
+            raise RuntimeError(f"Yazıcı iş parçacığı durdu: {self._error}")
+
+    def stop(self):
+        """Bekleyen işlemleri yaz ve iş parçacığını durdur."""
+        if self._thread is None or self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            try:
+                running = self._collect_batch(batch)
+                operations = [item for item in batch if item is not None and item is not _FLUSH]
+                if operations:
+                    with self._writer() as conn:
+                        self._commit_batch(conn, operations)
+            except Exception as e:
+                print(f"Veritabanı yazıcısı durdu: {e}")
+                self._fail(batch, e)
+                running = False
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _fail(self, batch, error):
+        """Partideki ve kuyrukta kalan işlemleri hatayla sonlandır."""
+        with self._lock:
+            self._error = error
+            pending = list(batch)
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+                batch.append(None)  # task_done sayısı için
+        for item in pending:
+            if item is not None and item is not _FLUSH:
+                future = item[1]
+                if not future.done():
+                    future.set_exception(error)
+
+    def _collect_batch(self, batch):
+        """Bekleme penceresi içinde gelen işlemleri partiye ekle.
+
+        Durdurma işareti görülürse False döner; flush işareti pencereyi kapatır.
+        """
+        if batch[0] is None:
+            return False
+        if batch[0] is _FLUSH:
+            return True
+        while len(batch) < self.max_batch:
+            try:
+                item = self._queue.get(timeout=self.batch_delay)
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is None:
+                return False
+            if item is _FLUSH:
+                break
+        return True
+
+    @instrumentation.timed('db.commit_batch')
+    def _commit_batch(self, conn, batch):
+        """Partiyi tek işlemde çalıştır; hatalı işlem yalnızca kendini geri alır."""
+        cursor = conn.cursor()
+        results = []
+        try:
+            cursor.execute('BEGIN')
+            for op, future in batch:
+                cursor.execute('SAVEPOINT write_behind_op')
+                try:
+                    results.append((future, op(cursor), None))
+                    cursor.execute('RELEASE write_behind_op')
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO write_behind_op')
+                    cursor.execute('RELEASE write_behind_op')
+                    results.append((future, None, e))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            for op, future in batch:
+                future.set_exception(e)
+            print(f"Veritabanına yazılırken hata: {e}")
+            return
+
+        self.committed_batches += 1
+        self.committed_operations += len(batch)
+
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+                print(f"Veritabanına yazılırken hata: {error}")
+            else:
+                future.set_result(result)
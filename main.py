@@ -2,22 +2,35 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
-from core.database import DatabaseManager
+from core.storage import open_store
+
+def main(on_stage=None):
+    """Uygulamayı başlat.
+
+    on_stage(aşama, nesne) verilirse açılış aşamaları tamamlandıkça çağrılır:
+    "qapplication", "database" ve pencere gösterilmeden önce "main_window".
+    Açılış kıyaslaması (benchmarks/startup.py) bunu kullanır.
+    """
+    stage = on_stage or (lambda name, value: None)
 
-def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Pomodoro Takip")
+    stage("qapplication", app)
 
     # Gerekli dizinleri oluştur.
     os.makedirs("data", exist_ok=True)
     os.makedirs("resources/sounds", exist_ok=True)
 
-    # Veritabanı bağlantısını oluştur.
-    db_manager = DatabaseManager()
+    # Seans deposunu oluştur (POMODORO_STORAGE ile seçilir, varsayılan SQLite).
+    # SQLite yazmaları arayüzü dondurmamak için arka plandaki yazıcıda toplu
+    # olarak diske yazılır.
+    db_manager = open_store(write_behind=True)
     db_manager.setup_database()
+    stage("database", db_manager)
 
     # Ana pencereyi oluştur ve göster.
     window = MainWindow(db_manager)
+    stage("main_window", window)
     window.show()
 
     sys.exit(app.exec())
@@ -0,0 +1,156 @@
+import argparse
+import os
+import sys
+from datetime import date
+
+from core.memory_store import MemoryStore
+from core.storage import STORAGE_BACKENDS, open_store
+from core.transfer import EXPORT_FORMATS, export_sessions, format_from_path, import_sessions
+
+
+def _rebuild_totals(db_manager, args):
+    """Günlük toplamlar tablosunu yeniden oluştur."""
+    day_count = db_manager.rebuild_daily_totals()
+    print(f"Günlük toplamlar yeniden oluşturuldu: {day_count} gün")
+    return 0
+
+
+def _compact(db_manager, args):
+    """Günlük deposunu yalnızca güncel kayıtlarla yeniden yaz."""
+    if not hasattr(db_manager, 'compact'):
+        print("compact yalnızca günlük deposu (--storage log) için kullanılabilir.", file=sys.stderr)
+        return 1
+    before = os.path.getsize(db_manager.log_path) if os.path.exists(db_manager.log_path) else 0
+    lines = db_manager.compact()
+    after = os.path.getsize(db_manager.log_path)
+    print(f"Günlük sıkıştırıldı: {lines} satır, {before} -> {after} bayt")
+    return 0
+
+
+def _export(db_manager, args):
+    """Seansları CSV veya JSON Lines olarak dışa aktar."""
+    fmt = args.format or format_from_path(args.output)
+    if args.output == "-":
+        count = export_sessions(db_manager, sys.stdout, fmt, args.start, args.end)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            count = export_sessions(db_manager, output, fmt, args.start, args.end)
+    print(f"{count} seans dışa aktarıldı.", file=sys.stderr)
+    return 0
+
+
+def _import(db_manager, args):
+    """CSV veya JSON Lines dosyasındaki seansları içe aktar."""
+    fmt = args.format or format_from_path(args.input)
+    try:
+        if args.input == "-":
+            inserted, skipped = import_sessions(db_manager, sys.stdin, fmt)
+        else:
+            with open(args.input, encoding="utf-8", newline="") as source:
+                inserted, skipped = import_sessions(db_manager, source, fmt)
+    except ValueError as e:
+        print(f"İçe aktarılırken hata: {e}", file=sys.stderr)
+        return 1
+    print(f"{inserted} seans eklendi, {skipped} yinelenen seans atlandı.")
+    return 0
+
+
+def _simulate(db_manager, args):
+    """Pomodoro döngülerini sanal saatle çalıştır ve değişmezleri denetle."""
+    from core.simulation import PomodoroSimulation
+    
+    # Simülasyon seansları gerçek depoya değil bellek içi bir depoya yazılır;
+    # ayarlar gerçek depodan alınır.
+    settings = db_manager.get_settings()
+    sim_db = MemoryStore()
+    sim_db.setup_database()
+    sim_db.update_settings(settings)
+    try:
+        simulation = PomodoroSimulation(sim_db, record_sessions=not args.no_record)
+        # Bir döngünün sanal süresi kabaca hesaplanır; olaylar bu süreye yayılır.
+        cycle_seconds = (settings['sessions_before_long_break'] *
+                         (settings['work_duration'] + settings['short_break_duration']) +
+                         settings['long_break_duration']) * 60
+        simulation.schedule_random_events(
+            until=args.cycles * cycle_seconds * 2,
+            events_per_hour=args.events_per_hour,
+            seed=args.seed
+        )
+        report = simulation.run(cycles=args.cycles)
+    finally:
+        sim_db.close()
+    
+    print(f"Döngü: {report['cycles']} ({report['cycles_per_second']:.0f} döngü/sn)")
+    print(f"Sanal süre: {report['virtual_seconds'] / 3600:.1f} saat, "
+          f"gerçek süre: {report['wall_seconds']:.2f} sn")
+    print(f"Tamamlanan seanslar: {report['completed']}")
+    print(f"Olaylar: {report['actions']}")
+    print(f"Kaydedilen seans: {report['recorded_sessions']}")
+    
+    for violation in report['violations']:
+        print(f"İhlal: {violation}")
+    return 1 if report['violations'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pomodoro Takip bakım komutları")
+    parser.add_argument("--storage", help=f"Depo ({', '.join(STORAGE_BACKENDS)}; "
+                        "varsayılan: POMODORO_STORAGE, yoksa sqlite)")
+    parser.add_argument("--db", help="Depo dosyası (varsayılan: data/pomodoro.db veya data/pomodoro.log)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-totals", help="Günlük toplamları ham seanslardan onar"
+    )
+    rebuild_parser.set_defaults(handler=_rebuild_totals)
+    
+    compact_parser = subparsers.add_parser(
+        "compact", help="Günlük deposundan silinen seansları ve eski ayarları at"
+    )
+    compact_parser.set_defaults(handler=_compact)
+    
+    export_parser = subparsers.add_parser(
+        "export", help="Seansları CSV veya JSON Lines olarak dışa aktar"
+    )
+    export_parser.add_argument("output", help="Çıktı dosyası ('-' standart çıktı)")
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS,
+                               help="Biçim (varsayılan: dosya uzantısından, yoksa csv)")
+    export_parser.add_argument("--start", type=date.fromisoformat, help="İlk gün (YYYY-AA-GG)")
+    export_parser.add_argument("--end", type=date.fromisoformat, help="Son gün (YYYY-AA-GG)")
+    export_parser.set_defaults(handler=_export)
+    
+    import_parser = subparsers.add_parser(
+        "import", help="CSV veya JSON Lines dosyasından seans içe aktar"
+    )
+    import_parser.add_argument("input", help="Girdi dosyası ('-' standart girdi)")
+    import_parser.add_argument("--format", choices=EXPORT_FORMATS,
+                               help="Biçim (varsayılan: dosya uzantısından, yoksa csv)")
+    import_parser.set_defaults(handler=_import)
+    
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="Pomodoro döngülerini sanal saatle ekransız çalıştır"
+    )
+    simulate_parser.add_argument("--cycles", type=int, default=1000, help="Uzun molaya kadar döngü sayısı")
+    simulate_parser.add_argument("--events-per-hour", type=float, default=1.0,
+                                 help="Saatte ortalama duraklatma/sıfırlama olayı")
+    simulate_parser.add_argument("--seed", type=int, default=None, help="Rastgele olay tohumu")
+    simulate_parser.add_argument("--no-record", action="store_true",
+                                 help="Seansları (bellek içi) depoya yazma")
+    simulate_parser.set_defaults(handler=_simulate)
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        db_manager = open_store(args.storage, args.db)
+    except ValueError as e:
+        print(f"Depo açılırken hata: {e}", file=sys.stderr)
+        return 2
+    db_manager.setup_database()
+    try:
+        return args.handler(db_manager, args)
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _TaskSignals(QObject):
+    # (anahtar, istek_no, sonuç) - iş parçacığından arayüz iş parçacığına kuyrukla iletilir
+    finished = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str, int, str)
+
+
+class _Task(QRunnable):
+    def __init__(self, key, request_id, fn, signals):
+        super().__init__()
+        self.key = key
+        self.request_id = request_id
+        self.fn = fn
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(self.key, self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.key, self.request_id, result)
+
+
+class BackgroundLoader(QObject):
+    """Yükleme işlerini QThreadPool üzerinde çalıştıran yardımcı.
+
+    Her anahtar için yalnızca en son isteğin sonucu geri çağrıya iletilir;
+    kullanıcı başka bir aya veya döneme geçtiyse eski sonuçlar atılır.
+    Geri çağrılar her zaman arayüz iş parçacığında çalışır. İş hata verirse
+    varsa hata geri çağrısına hata iletisi iletilir.
+    """
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._signals = _TaskSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+        self._next_id = 0
+        self._latest = {}    # anahtar -> en son istek numarası
+        self._pending = {}   # anahtar -> (görev, geri çağrı, hata geri çağrısı)
+        # Çalışan görevler bitene kadar Python tarafında canlı tutulur.
+        self._tasks = {}     # istek numarası -> görev
+
+    def submit(self, key, fn, callback, error_callback=None):
+        """fn'i arka planda çalıştır, sonucu callback(sonuç) ile ilet.
+
+        fn hata verirse error_callback(ileti) çağrılır.
+        """
+        self._next_id += 1
+        request_id = self._next_id
+
+        self._take_pending(key)
+
+        task = _Task(key, request_id, fn, self._signals)
+        task.setAutoDelete(False)
+        self._tasks[request_id] = task
+        self._latest[key] = request_id
+        self._pending[key] = (task, callback, error_callback)
+        self._pool.start(task)
+        return request_id
+
+    def cancel(self, key):
+        """Anahtarın bekleyen isteğini iptal et; sonucu gelirse atılır."""
+        self._take_pending(key)
+        self._pending.pop(key, None)
+        self._latest.pop(key, None)
+
+    def _take_pending(self, key):
+        """Henüz başlamamış eski isteği havuzdan çıkar."""
+        previous = self._pending.get(key)
+        if previous is not None and self._pool.tryTake(previous[0]):
+            self._tasks.pop(previous[0].request_id, None)
+
+    def is_pending(self, key):
+        """Anahtar için sonucu beklenen bir istek var mı?"""
+        return key in self._pending
+
+    def _on_finished(self, key, request_id, result):
+        self._tasks.pop(request_id, None)
+        if self._latest.get(key) != request_id:
+            return  # Eski istek, sonucu artık geçersiz.
+        _, callback, _ = self._pending.pop(key)
+        del self._latest[key]
+        callback(result)
+
+    def _on_failed(self, key, request_id, message):
+        self._tasks.pop(request_id, None)
+        if self._latest.get(key) != request_id:
+            return
+        _, _, error_callback = self._pending.pop(key)
+        del self._latest[key]
+        print(f"Arka planda yüklenirken hata: {message}")
+        if error_callback is not None:
+            error_callback(message)
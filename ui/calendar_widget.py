@@ -1,14 +1,60 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QCalendarWidget,
-                           QLabel, QListWidget, QFrame, QListWidgetItem)
+                           QLabel, QListWidget, QFrame, QListWidgetItem, QCheckBox)
 from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QColor, QTextCharFormat
 from datetime import datetime, date
 
+from core import instrumentation
+from core.database import session_start, session_end, day_from_key, counts_toward_totals
+from ui.background import BackgroundLoader
+
+# Isı haritası basamakları: (en az çalışma süresi saniye, arka plan, yazı rengi)
+HEATMAP_LEVELS = [
+    (4 * 3600, "#1f5fa8", "#ffffff"),
+    (2 * 3600, "#4f8fd6", "#ffffff"),
+    (3600, "#9cc3ee", "#000000"),
+    (1, "#dceaf9", "#000000"),
+]
+
+
+def _previous_month(year, month):
+    return (year - 1, 12) if month == 1 else (year, month - 1)
+
+
+def _next_month(year, month):
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _session_item_text(start_time, end_time, duration, is_completed):
+    """Seans listesi öğesinin metni"""
+    hours, remainder = divmod(duration, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    item_text = f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')} | {hours}s {minutes}dk"
+    
+    if is_completed:
+        item_text += " | Tamamlandı"
+    else:
+        item_text += " | Yarım kaldı"
+    return item_text
+
+
 class CalendarWidget(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, daily_totals):
         super().__init__()
         
         self.db_manager = db_manager
+        self.daily_totals = daily_totals
+        
+        # Sorgular arka planda çalışır; yalnızca en son isteğin sonucu gösterilir.
+        self._loader = BackgroundLoader(self)
+        
+        # Ay özetleri önbelleği: (yıl, ay) -> (data_version, {gün: süre}, toplam)
+        self._month_cache = {}
+        
+        # Listesi gösterilen gün ve o günün toplamı
+        self._shown_day = None
+        self._shown_day_total = 0
         
         self._setup_ui()
         self._connect_signals()
@@ -34,6 +80,11 @@ class CalendarWidget(QWidget):
         self.month_summary_label.setStyleSheet("color: #0066cc;")  # Mavi renk
         calendar_layout.addWidget(self.month_summary_label)
         
+        # Günleri çalışma süresine göre renklendir
+        self.heatmap_check = QCheckBox("Isı haritası")
+        self.heatmap_check.setChecked(True)
+        calendar_layout.addWidget(self.heatmap_check)
+        
         main_layout.addLayout(calendar_layout, 2)  # 2/3 oranında alan kapla
         
         # Sağ taraf: Seçili günün çalışma seansları
@@ -61,6 +112,11 @@ class CalendarWidget(QWidget):
     def _connect_signals(self):
         """Sinyalleri bağla"""
         self.calendar.selectionChanged.connect(self._on_date_selected)
+        self.calendar.currentPageChanged.connect(self._on_page_changed)
+        self.heatmap_check.toggled.connect(self._on_heatmap_toggled)
+        
+        # Tamamlanan seanslar sorgu yapılmadan takvime işlenir.
+        self.daily_totals.session_recorded.connect(self._on_session_recorded)
     
     def _on_date_selected(self):
         """Takvimde bir gün seçildiğinde"""
@@ -72,63 +128,204 @@ class CalendarWidget(QWidget):
         self._load_sessions_for_date(selected_date_py)
     
     def _load_sessions_for_date(self, date):
-        """Belirli bir günün çalışma seanslarını yükle"""
-        self.sessions_list.clear()
+        """Belirli bir günün çalışma seanslarını arka planda yükle"""
+        self.total_label.setText("Toplam Çalışma: Yükleniyor...")
         
-        # Veritabanından seansları al
+        self._loader.submit(
+            "day",
+            lambda: self._collect_day_sessions(date),
+            self._show_day_sessions,
+            self._on_day_failed
+        )
+    
+    def _collect_day_sessions(self, date):
+        """Seansları veritabanından al ve liste metinlerini hazırla (iş parçacığında)"""
         sessions = self.db_manager.get_sessions_by_date(date)
         
+        item_texts = []
         total_duration = 0
         
         for session in sessions:
-            if session['session_type'] == 'work':
-                # Başlangıç ve bitiş zamanları
-                start_time = datetime.fromisoformat(session['start_time'])
-                end_time = datetime.fromisoformat(session['end_time'])
-                
+            if session.session_type == 'work':
                 # Süreyi formatlayarak göster
-                duration = session['duration']
+                duration = session.duration
                 total_duration += duration
                 
-                hours, remainder = divmod(duration, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                
-                # Liste öğesi oluştur
-                item_text = f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')} | {hours}s {minutes}dk"
-                
-                if session['is_completed']:
-                    item_text += " | Tamamlandı"
-                else:
-                    item_text += " | Yarım kaldı"
-                
-                item = QListWidgetItem(item_text)
-                self.sessions_list.addItem(item)
+                # Liste öğesi metni
+                item_texts.append(_session_item_text(
+                    session_start(session), session_end(session), duration, session.is_completed))
+        
+        return date, item_texts, total_duration
+    
+    def _show_day_sessions(self, result):
+        """Hazırlanan seans listesini göster"""
+        self._shown_day, item_texts, self._shown_day_total = result
         
-        # Toplam süreyi göster
-        hours, remainder = divmod(total_duration, 3600)
+        self.sessions_list.clear()
+        for item_text in item_texts:
+            self.sessions_list.addItem(QListWidgetItem(item_text))
+        
+        self._show_day_total()
+    
+    def _on_day_failed(self, message):
+        """Gün yüklenemediyse listeyi boşalt ve hatayı göster"""
+        self._shown_day = None
+        self._shown_day_total = 0
+        self.sessions_list.clear()
+        self.total_label.setText("Toplam Çalışma: yüklenemedi")
+    
+    def _show_day_total(self):
+        """Seçili günün toplam süresini göster"""
+        hours, remainder = divmod(self._shown_day_total, 3600)
         minutes, seconds = divmod(remainder, 60)
         self.total_label.setText(f"Toplam Çalışma: {hours}s {minutes}dk")
     
+    def _on_session_recorded(self, session, previous_version, version):
+        """Kaydedilen seansı ay özetlerine ve gün listesine bellekte ekle"""
+        session_date = day_from_key(session.day)
+        
+        # Özetler yalnızca bu yazmadan hemen önce güncelse yamalanabilir;
+        # araya başka yazma girdiyse bir sonraki gösterimde yeniden yüklenir.
+        if version == previous_version + 1:
+            counts = counts_toward_totals(session.session_type, session.is_completed)
+            for month_key, (cached_version, day_totals, total) in list(self._month_cache.items()):
+                if cached_version != previous_version:
+                    continue
+                if counts and month_key == (session_date.year, session_date.month):
+                    day_totals = dict(day_totals)
+                    day_totals[session.day] = day_totals.get(session.day, 0) + session.duration
+                    total += session.duration
+                self._month_cache[month_key] = (version, day_totals, total)
+        
+        self._show_month(self.calendar.yearShown(), self.calendar.monthShown())
+        
+        if session.session_type != 'work' or session_date != self._shown_day:
+            return
+        if self._loader.is_pending("day"):
+            # Yüklenmekte olan liste seansı içermeyebilir; yeniden yükle.
+            self._load_sessions_for_date(session_date)
+            return
+        
+        self.sessions_list.addItem(QListWidgetItem(_session_item_text(
+            session_start(session), session_end(session), session.duration, session.is_completed)))
+        self._shown_day_total += session.duration
+        self._show_day_total()
+    
+    @instrumentation.timed('calendar.update_calendar')
     def update_calendar(self):
         """Takvimi güncelle - Çalışılan günleri işaretle"""
-        # Mevcut ayın 1. günü ve son günü
-        current_year_month = self.calendar.yearShown(), self.calendar.monthShown()
-        first_day = QDate(current_year_month[0], current_year_month[1], 1)
-        last_day = first_day.addMonths(1).addDays(-1)
+        self._show_month(self.calendar.yearShown(), self.calendar.monthShown())
         
-        # Veritabanından bu aralıktaki çalışma günlerini çek
-        start_date = date(first_day.year(), first_day.month(), first_day.day())
-        end_date = date(last_day.year(), last_day.month(), last_day.day())
+        # Seçili günün seanslarını göster
+        selected_date = self.calendar.selectedDate()
+        selected_date_py = date(selected_date.year(), selected_date.month(), selected_date.day())
+        self._load_sessions_for_date(selected_date_py)
+    
+    def _on_page_changed(self, year, month):
+        """Takvimde başka bir aya geçildiğinde"""
+        self._show_month(year, month)
+    
+    def _on_heatmap_toggled(self, checked):
+        """Isı haritası açılıp kapatıldığında"""
+        self._show_month(self.calendar.yearShown(), self.calendar.monthShown())
+    
+    def _show_month(self, year, month):
+        """Ay özetini önbellekten göster, yoksa arka planda yükle; komşu ayları önceden yükle"""
+        cached = self._cached_month(year, month)
+        if cached is not None:
+            self._loader.cancel("month")
+            self._show_month_statistics(cached)
+        else:
+            self.month_summary_label.setText("Bu ay toplam: Yükleniyor...")
+            self._loader.submit(
+                "month",
+                lambda: self._collect_month(year, month),
+                self._on_month_loaded,
+                self._on_month_failed
+            )
         
-        statistics = self.db_manager.get_statistics(start_date, end_date)
+        for neighbour in (_previous_month(year, month), _next_month(year, month)):
+            self._prefetch_month(*neighbour)
+    
+    def _prefetch_month(self, year, month):
+        """Ayı henüz önbellekte yoksa arka planda yükle"""
+        key = f"prefetch-{year}-{month}"
+        if self._cached_month(year, month) is not None or self._loader.is_pending(key):
+            return
+        self._loader.submit(
+            key,
+            lambda: self._collect_month(year, month),
+            self._store_month
+        )
+    
+    def _cached_month(self, year, month):
+        """Güncel veri sürümüne ait ay özetini döndür; yoksa None"""
+        cached = self._month_cache.get((year, month))
+        if cached is None or cached[0] != self.db_manager.data_version:
+            return None
+        return cached
+    
+    def _collect_month(self, year, month):
+        """Ayın günlük toplamlarını çek (iş parçacığında)"""
+        # Sürüm sorgudan önce okunur; sorgu sırasında yazma olursa özet
+        # eski sayılır ve bir sonraki gösterimde yeniden yüklenir.
+        version = self.db_manager.data_version
+        
+        start_date = date(year, month, 1)
+        end_year, end_month = _next_month(year, month)
+        end_date = date.fromordinal(date(end_year, end_month, 1).toordinal() - 1)
+        columns = self.db_manager.get_statistics(start_date, end_date, columnar=True)
         
-        # Ay toplamını hesapla
-        total_monthly_duration = sum(stat['total_duration'] for stat in statistics)
+        day_totals = dict(zip(columns.work_date, columns.total_duration))
+        return (year, month), (version, day_totals, sum(day_totals.values()))
+    
+    def _store_month(self, result):
+        """Yüklenen ay özetini önbelleğe koy"""
+        month_key, summary = result
+        # Eski sürüme ait özetler bir daha kullanılmaz.
+        version = self.db_manager.data_version
+        for key in [key for key, cached in self._month_cache.items() if cached[0] != version]:
+            del self._month_cache[key]
+        self._month_cache[month_key] = summary
+        return month_key, summary
+    
+    def _on_month_loaded(self, result):
+        """Gösterilen ayın özeti yüklendiğinde"""
+        month_key, summary = self._store_month(result)
+        if month_key == (self.calendar.yearShown(), self.calendar.monthShown()):
+            self._show_month_statistics(summary)
+    
+    def _on_month_failed(self, message):
+        """Ay özeti yüklenemediyse bekleme yazısını kaldır"""
+        self.month_summary_label.setText("Bu ay toplam: yüklenemedi")
+    
+    @instrumentation.timed('calendar.show_month')
+    def _show_month_statistics(self, summary):
+        """Ay özetini ve ısı haritasını göster"""
+        version, day_totals, total_monthly_duration = summary
+        
+        # Ay toplamını göster
         hours, remainder = divmod(total_monthly_duration, 3600)
         minutes, seconds = divmod(remainder, 60)
         self.month_summary_label.setText(f"Bu ay toplam: {hours}s {minutes}dk")
         
-        # Seçili günün seanslarını göster
-        selected_date = self.calendar.selectedDate()
-        selected_date_py = date(selected_date.year(), selected_date.month(), selected_date.day())
-        self._load_sessions_for_date(selected_date_py) 
\ No newline at end of file
+        # Önceki işaretleri temizle ve çalışılan günleri renklendir
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+        if not self.heatmap_check.isChecked():
+            return
+        for day, duration in day_totals.items():
+            level = self._heatmap_format(duration)
+            if level is not None:
+                work_date = day_from_key(day)
+                self.calendar.setDateTextFormat(
+                    QDate(work_date.year, work_date.month, work_date.day), level)
+    
+    def _heatmap_format(self, duration):
+        """Çalışma süresine karşılık gelen gün hücresi biçimi"""
+        for threshold, background, foreground in HEATMAP_LEVELS:
+            if duration >= threshold:
+                text_format = QTextCharFormat()
+                text_format.setBackground(QColor(background))
+                text_format.setForeground(QColor(foreground))
+                return text_format
+        return None
@@ -0,0 +1,79 @@
+"""İstatistik grafiği için çizici arayüzü ve seçimi.
+
+Çiziciler QWidget'tır ve BarChartRenderer metodlarını uygular. StatisticsWidget
+yalnızca bu arayüzü kullanır; hangi çizicinin kullanılacağı ayarlardaki
+``chart_renderer`` değeriyle belirlenir.
+"""
+import abc
+
+from PyQt6.QtWidgets import QWidget
+
+BAR_COLOR = '#0066cc'
+BAR_WIDTH = 0.6
+
+# Ayarlarda saklanan ad -> ayarlar penceresinde gösterilen ad
+CHART_RENDERERS = {
+    'matplotlib': "Matplotlib (ayrıntılı)",
+    'painter': "Qt (hızlı)",
+}
+DEFAULT_CHART_RENDERER = 'matplotlib'
+
+
+def value_range(values):
+    """Y ekseni sınırları; etiketlere yer kalması için %20 genişletilir."""
+    y_max = max(values, default=0)
+    y_min = min(values, default=0)
+    y_max = y_max * 1.2 if y_max > 0 else 0
+    y_min = y_min * 1.2 if y_min < 0 else 0
+    if y_max == y_min:
+        y_max = 1
+    return y_min, y_max
+
+
+def x_range(positions, slot_count=None):
+    """X ekseni sınırları: her çubuk yuvasının tamamı görünür.
+    
+    slot_count verilmezse yuva sayısı konumlardan çıkarılır; seyrek konumlarda
+    sondaki boş yuvaların da görünmesi için slot_count verilmelidir.
+    """
+    if slot_count is None:
+        slot_count = max(len(positions), max(positions, default=-1) + 1)
+    return -0.5, max(slot_count, 1) - 0.5
+
+
+class _RendererMeta(type(QWidget), abc.ABCMeta):
+    """Qt sınıflarıyla birlikte soyut metodlara izin veren metasınıf."""
+
+
+class BarChartRenderer(metaclass=_RendererMeta):
+    """Çubuk grafik çizicilerinin ortak arayüzü.
+    
+    Metodlardan biri eksik olan çizici oluşturulamaz.
+    """
+    
+    @abc.abstractmethod
+    def set_bars(self, positions, values, tick_positions, tick_labels, title,
+                 value_suffix=' saat', x_label='Tarih', slot_count=None):
+        """Çubukları x konumları ve değerleriyle çiz; tikleri ve başlığı ayarla.
+        
+        Değerler negatif olabilir (örneğin haftalık değişim); çubuklar sıfırdan çizilir.
+        slot_count x eksenindeki yuva sayısıdır (bkz. x_range).
+        """
+    
+    @abc.abstractmethod
+    def show_message(self, text):
+        """Çubukları gizle ve ortada bir mesaj göster."""
+
+
+def create_chart(name, parent=None):
+    """Adı verilen çiziciyi oluştur; matplotlib yoksa Qt çiziciye düş."""
+    if name == 'matplotlib':
+        try:
+            from ui.matplotlib_chart import MatplotlibCanvas
+        except ImportError as e:
+            print(f"Matplotlib kullanılamıyor, Qt grafiğine geçiliyor: {e}")
+        else:
+            return MatplotlibCanvas(parent, width=10, height=5, dpi=100)
+    
+    from ui.painter_chart import PainterBarChart
+    return PainterBarChart(parent)
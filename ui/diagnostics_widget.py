@@ -0,0 +1,126 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                           QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt
+
+from core import instrumentation
+
+# Tablo sütunları: (başlık, özet alanı)
+COLUMNS = [
+    ("Ölçüm", None),
+    ("Sayı", 'count'),
+    ("Ortalama (ms)", 'mean_ms'),
+    ("p50 (ms)", 'p50_ms'),
+    ("p90 (ms)", 'p90_ms'),
+    ("p99 (ms)", 'p99_ms'),
+    ("En büyük (ms)", 'max_ms'),
+    ("Değer p90", 'value'),
+]
+
+
+class DiagnosticsWidget(QWidget):
+    """Ölçüm özetlerini gösteren gizli tanılama sekmesi.
+
+    Yalnızca POMODORO_PROFILE ayarlıyken Ctrl+Shift+D ile açılır. Tablo
+    sekme her gösterildiğinde ve Yenile ile güncellenir.
+    """
+
+    def __init__(self, db_manager, timer_core):
+        super().__init__()
+
+        self.db_manager = db_manager
+        self.timer_core = timer_core
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Tanılama arayüzünü oluştur"""
+        main_layout = QVBoxLayout(self)
+
+        # Önbellek ve sayaç durumu
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        main_layout.addWidget(self.status_label)
+
+        # Ölçüm tablosu
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        main_layout.addWidget(self.table)
+
+        # Butonlar
+        button_layout = QHBoxLayout()
+
+        self.refresh_button = QPushButton("Yenile")
+        self.refresh_button.clicked.connect(self.refresh)
+        button_layout.addWidget(self.refresh_button)
+
+        self.clear_button = QPushButton("Sıfırla")
+        self.clear_button.clicked.connect(self._clear)
+        button_layout.addWidget(self.clear_button)
+
+        self.dump_button = QPushButton("JSON Kaydet")
+        self.dump_button.clicked.connect(self._dump)
+        button_layout.addWidget(self.dump_button)
+
+        main_layout.addLayout(button_layout)
+
+        self.dump_label = QLabel("")
+        self.dump_label.setStyleSheet("color: gray;")
+        main_layout.addWidget(self.dump_label)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        """Ölçüm özetlerini tabloya yükle"""
+        snapshot = instrumentation.snapshot(recent=0)
+        summary = snapshot['summary'] if snapshot else {}
+
+        self.table.setRowCount(len(summary))
+        for row, (name, entry) in enumerate(summary.items()):
+            for column, (_, field) in enumerate(COLUMNS):
+                if field is None:
+                    text = name
+                elif field == 'value':
+                    text = self._format(entry.get('value', {}).get('p90'))
+                else:
+                    text = self._format(entry.get(field))
+                item = QTableWidgetItem(text)
+                if field is not None:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        cache = self.db_manager.cache_info()
+        lateness = self.timer_core.lateness_stats()
+        buffered = f"{snapshot['buffered']}/{snapshot['buffer_size']}" if snapshot else "-"
+        self.status_label.setText(
+            f"Tampon: {buffered} kayıt | "
+            f"Sorgu önbelleği: {cache['hits']} isabet, {cache['misses']} ıska "
+            f"(veri sürümü {cache['data_version']}) | "
+            f"Sayaç: saatte {self.timer_core.wakeups_per_hour()} uyanış, "
+            f"en büyük gecikme {lateness['max_ms']:.1f} ms"
+        )
+
+    def _format(self, value):
+        if value is None:
+            return "-"
+        if isinstance(value, int):
+            return str(value)
+        return f"{value:.2f}"
+
+    def _clear(self):
+        """Ölçümleri sıfırla"""
+        if instrumentation.recorder is not None:
+            instrumentation.recorder.clear()
+        self.refresh()
+
+    def _dump(self):
+        """Ölçümleri JSON dosyasına yaz"""
+        path = instrumentation.dump()
+        if path is None:
+            self.dump_label.setText("Tanılama verisi yazılamadı.")
+        else:
+            self.dump_label.setText(f"Kaydedildi: {path}")
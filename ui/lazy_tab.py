@@ -0,0 +1,49 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+
+class LazyTab(QWidget):
+    """Asıl içeriği ilk gösterildiğinde oluşturan hafif sekme.
+
+    Ağır bağımlılıkları olan widget'lar (örneğin matplotlib) açılışı
+    yavaşlatmasın diye fabrika fonksiyonu sekme ilk kez görünür olduğunda
+    çağrılır. Yer tutucu önce çizilir, widget bir sonraki olay döngüsünde kurulur.
+    """
+
+    loaded = pyqtSignal(QWidget)
+
+    def __init__(self, factory, placeholder_text="Yükleniyor..."):
+        super().__init__()
+
+        self._factory = factory
+        self.widget = None
+        self._load_scheduled = False
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        self._placeholder = QLabel(placeholder_text)
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._placeholder.setStyleSheet("color: gray;")
+        self._layout.addWidget(self._placeholder)
+
+    def is_loaded(self):
+        """Asıl widget oluşturuldu mu?"""
+        return self.widget is not None
+
+    def ensure_loaded(self):
+        """Widget'ı henüz oluşturulmadıysa şimdi oluştur ve döndür."""
+        if self.widget is None:
+            self.widget = self._factory()
+            self._layout.removeWidget(self._placeholder)
+            self._placeholder.deleteLater()
+            self._placeholder = None
+            self._layout.addWidget(self.widget)
+            self.loaded.emit(self.widget)
+        return self.widget
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.widget is None and not self._load_scheduled:
+            self._load_scheduled = True
+            QTimer.singleShot(0, self.ensure_loaded)
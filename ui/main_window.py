@@ -1,19 +1,20 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QPushButton, QLabel, QTabWidget, QMessageBox)
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import Qt, QSize, QThreadPool
+from PyQt6.QtGui import QIcon, QFont, QKeySequence, QShortcut
 
 from ui.timer_widget import TimerWidget
 from ui.calendar_widget import CalendarWidget
-from ui.statistics_widget import StatisticsWidget
+from ui.lazy_tab import LazyTab
 from ui.settings_dialog import SettingsDialog
 
+from core import instrumentation
 from core.timer import TimerCore
 from core.pomodoro import PomodoroManager
+from core.daily_totals import DailyTotals
 
 import os
 import sys
-from datetime import datetime
 
 class MainWindow(QMainWindow):
     def __init__(self, db_manager):
@@ -28,6 +29,7 @@ class MainWindow(QMainWindow):
         # Çekirdek bileşenleri oluştur.
         self.timer_core = TimerCore()
         self.pomodoro_manager = PomodoroManager(self.timer_core, self.db_manager)
+        self.daily_totals = DailyTotals(self.db_manager)
         
         # Arayüz kurulumu.
         self._setup_ui()
@@ -46,16 +48,16 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.tab_widget)
         
         # Sayaç sekmesi
-        self.timer_widget = TimerWidget(self.timer_core, self.pomodoro_manager)
+        self.timer_widget = TimerWidget(self.timer_core, self.pomodoro_manager, self.daily_totals)
         self.tab_widget.addTab(self.timer_widget, "Sayaç")
         
         # Takvim sekmesi
-        self.calendar_widget = CalendarWidget(self.db_manager)
+        self.calendar_widget = CalendarWidget(self.db_manager, self.daily_totals)
         self.tab_widget.addTab(self.calendar_widget, "Takvim")
         
-        # İstatistik sekmesi
-        self.statistics_widget = StatisticsWidget(self.db_manager)
-        self.tab_widget.addTab(self.statistics_widget, "İstatistikler")
+        # İstatistik sekmesi - matplotlib ilk açılışta yüklenir
+        self.statistics_tab = LazyTab(self._create_statistics_widget)
+        self.tab_widget.addTab(self.statistics_tab, "İstatistikler")
         
         # Alt menü butonları
         button_layout = QHBoxLayout()
@@ -73,6 +75,22 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(button_layout)
         
         self.setCentralWidget(central_widget)
+        
+        # Gizli tanılama sekmesi - yalnızca ölçüm açıkken Ctrl+Shift+D ile
+        self.diagnostics_widget = None
+        if instrumentation.ENABLED:
+            self.diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+            self.diagnostics_shortcut.activated.connect(self._toggle_diagnostics)
+    
+    def _create_statistics_widget(self):
+        """İstatistik widget'ını oluştur (sekme ilk seçildiğinde çağrılır)"""
+        from ui.statistics_widget import StatisticsWidget
+        return StatisticsWidget(self.db_manager)
+    
+    @property
+    def statistics_widget(self):
+        """İstatistik widget'ı; sekme henüz açılmadıysa None"""
+        return self.statistics_tab.widget
     
     def _connect_signals(self):
         """Sinyalleri bağla"""
@@ -87,10 +105,12 @@ class MainWindow(QMainWindow):
         # Sadece çalışma seanslarını veritabanına kaydet.
         if session_type == "work":
             start_time = self.timer_core.start_time
-            end_time = datetime.now()
-            duration = int((end_time - start_time).total_seconds())
+            end_time = self.timer_core.clock.now()
+            # Süre monotonik saatten alınır; duvar saati atlamalarından etkilenmez.
+            duration = int(round(self.timer_core.current_elapsed()))
             
-            self.db_manager.save_session(
+            # Bugünkü toplam ve takvim bellekte güncellenir.
+            self.daily_totals.record_session(
                 start_time=start_time,
                 end_time=end_time,
                 duration=duration,
@@ -101,16 +121,29 @@ class MainWindow(QMainWindow):
             
             
             
-            if self.tab_widget.currentIndex() == 1:  # Takvim sekmesi
-                self.calendar_widget.update_calendar()
-            elif self.tab_widget.currentIndex() == 2:  # İstatistik sekmesi
+            if self.tab_widget.currentIndex() == 2 and self.statistics_tab.is_loaded():  # İstatistik sekmesi
                 self.statistics_widget.update_statistics()
     
+    def _toggle_diagnostics(self):
+        """Tanılama sekmesini göster ya da gizle"""
+        if self.diagnostics_widget is None:
+            from ui.diagnostics_widget import DiagnosticsWidget
+            self.diagnostics_widget = DiagnosticsWidget(self.db_manager, self.timer_core)
+        
+        index = self.tab_widget.indexOf(self.diagnostics_widget)
+        if index == -1:
+            index = self.tab_widget.addTab(self.diagnostics_widget, "Tanılama")
+            self.tab_widget.setCurrentIndex(index)
+        else:
+            self.tab_widget.removeTab(index)
+    
+    @instrumentation.timed('main_window.tab_changed')
     def _on_tab_changed(self, index):
         """Sekme değiştiğinde"""
         if index == 1:  # Takvim sekmesi
             self.calendar_widget.update_calendar()
-        elif index == 2:  # İstatistik sekmesi
+        elif index == 2 and self.statistics_tab.is_loaded():  # İstatistik sekmesi
+            # İlk açılışta widget kendini kurarken istatistikleri zaten yükler.
             self.statistics_widget.update_statistics()
     
     def _open_settings(self):
@@ -119,6 +152,8 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             # Ayarlar değiştiyse, pomodoro yöneticisini güncelle
             self.pomodoro_manager._load_settings()
+            if self.statistics_tab.is_loaded():
+                self.statistics_widget.apply_settings()
     
     def closeEvent(self, event):
         """Uygulama kapatılırken"""
@@ -135,8 +170,8 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 # Mevcut seansı kaydet
                 start_time = self.timer_core.start_time
-                end_time = datetime.now()
-                duration = int((end_time - start_time).total_seconds())
+                end_time = self.timer_core.clock.now()
+                duration = int(round(self.timer_core.current_elapsed()))
                 
                 self.db_manager.save_session(
                     start_time=start_time,
@@ -147,11 +182,21 @@ class MainWindow(QMainWindow):
                 )
                 
                 # Veritabanı bağlantısını kapat
-                self.db_manager.close()
+                self._shutdown_database()
                 event.accept()
             else:
                 event.ignore()
         else:
             # Veritabanı bağlantısını kapat
-            self.db_manager.close()
-            event.accept() 
\ No newline at end of file
+            self._shutdown_database()
+            event.accept()
+    
+    def _shutdown_database(self):
+        """Bekleyen yazmaları diske yaz ve veritabanını kapat"""
+        # Arka plandaki yükleme işlerinin bitmesini bekle.
+        pool = QThreadPool.globalInstance()
+        pool.clear()
+        pool.waitForDone()
+        
+        self.db_manager.flush()
+        self.db_manager.close()
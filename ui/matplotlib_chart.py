@@ -0,0 +1,110 @@
+# Matplotlib importları
+import matplotlib
+matplotlib.use('QtAgg')
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+from ui.charts import BAR_COLOR, BAR_WIDTH, BarChartRenderer, value_range, x_range
+
+
+class MatplotlibCanvas(FigureCanvas, BarChartRenderer):
+    """Çubuk ve etiket nesnelerini yeniden kullanan kalıcı grafik.
+    
+    Her güncellemede eksen temizlenmez; mevcut çubukların yükseklik ve
+    konumları yerinde değiştirilir, eksik nesneler eklenir, fazlaları gizlenir.
+    Yerleşim (tight_layout) yalnızca x ekseni, tik etiketleri veya başlıklar
+    değiştiğinde yeniden hesaplanır; y sınırları doğrudan ayarlanır ve çizim draw_idle ile birleştirilir.
+    """
+    
+    def __init__(self, parent=None, width=5, height=4, dpi=100):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = self.fig.add_subplot(111)
+        
+        FigureCanvas.__init__(self, self.fig)
+        self.setParent(parent)
+        
+        # Sabit eksen ayarları yalnızca bir kez yapılır.
+        self.axes.set_autoscale_on(False)
+        self.axes.set_ylabel('Çalışma Süresi (Saat)', fontsize=11, fontweight='bold')
+        self.axes.set_xlabel('Tarih', fontsize=11, fontweight='bold')
+        self.axes.grid(axis='y', linestyle='--', alpha=0.4, color='gray')
+        self.axes.set_axisbelow(True)
+        
+        self._bars = []
+        self._labels = []
+        self._message = self.axes.text(0.5, 0.5, "", transform=self.axes.transAxes,
+                                       ha='center', va='center', fontsize=12, visible=False)
+        self._ticks = None
+        self._layout_key = None
+    
+    def _ensure_artists(self, count):
+        """En az count adet çubuk ve etiket nesnesi olmasını sağla."""
+        while len(self._bars) < count:
+            bar = Rectangle((0, 0), BAR_WIDTH, 0, color=BAR_COLOR, alpha=0.8)
+            self.axes.add_patch(bar)
+            self._bars.append(bar)
+            
+            label = self.axes.text(0, 0, "", ha='center', va='bottom', fontsize=9,
+                                   color=BAR_COLOR, fontweight='bold')
+            self._labels.append(label)
+    
+    def set_bars(self, positions, values, tick_positions, tick_labels, title,
+                 value_suffix=' saat', x_label='Tarih', slot_count=None):
+        """Çubukları verilen konum ve değerlerle güncelle."""
+        self._message.set_visible(False)
+        self._ensure_artists(len(values))
+        
+        for index, (bar, label) in enumerate(zip(self._bars, self._labels)):
+            if index < len(values):
+                position, value = positions[index], values[index]
+                bar.set_x(position - BAR_WIDTH / 2)
+                bar.set_height(value)
+                bar.set_visible(True)
+                
+                # Sadece süresi olan çubuklarda etiket göster; negatifler altta
+                if value >= 0:
+                    label.set_position((position, value + 0.1))
+                    label.set_verticalalignment('bottom')
+                else:
+                    label.set_position((position, value - 0.1))
+                    label.set_verticalalignment('top')
+                label.set_text(f'{value:.1f}{value_suffix}' if value != 0 else "")
+                label.set_visible(value != 0)
+            else:
+                bar.set_visible(False)
+                label.set_visible(False)
+        
+        # Tik etiketleri yalnızca değiştiğinde yeniden oluşturulur.
+        ticks = (tuple(tick_positions), tuple(tick_labels))
+        if ticks != self._ticks:
+            self.axes.set_xticks(list(tick_positions), list(tick_labels), rotation=45, ha='right')
+            self._ticks = ticks
+        
+        if self.axes.get_title() != title:
+            self.axes.set_title(title, fontsize=12, fontweight='bold')
+        if self.axes.get_xlabel() != x_label:
+            self.axes.set_xlabel(x_label, fontsize=11, fontweight='bold')
+        
+        xlim = x_range(positions, slot_count)
+        self.axes.set_xlim(*xlim)
+        # Y ekseni sınırlarını hafif genişlet (etiketler için)
+        self.axes.set_ylim(*value_range(values))
+        
+        self._refresh((xlim, ticks, title, x_label))
+    
+    def show_message(self, text):
+        """Çubukları gizle ve ortada bir mesaj göster."""
+        for bar, label in zip(self._bars, self._labels):
+            bar.set_visible(False)
+            label.set_visible(False)
+        self._message.set_text(text)
+        self._message.set_visible(True)
+        self._refresh(self._layout_key)
+    
+    def _refresh(self, layout_key):
+        """Yerleşim değiştiyse yeniden hesapla ve çizimi sıraya al."""
+        if layout_key != self._layout_key:
+            self.fig.tight_layout()
+            self._layout_key = layout_key
+        self.draw_idle()
@@ -0,0 +1,179 @@
+import math
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QFontMetrics
+
+from ui.charts import BAR_COLOR, BAR_WIDTH, BarChartRenderer, value_range, x_range
+
+
+def _nice_step(y_span, target_ticks=6):
+    """Y ekseni için 1-2-5 dizisinden okunaklı bir tik aralığı seç."""
+    raw = y_span / target_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 2.5, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+class PainterBarChart(QWidget, BarChartRenderer):
+    """QPainter ile çizilen hafif çubuk grafik.
+    
+    matplotlib gerektirmez; yalnızca veriyi saklar ve paintEvent içinde
+    eksenleri, çubukları ve etiketleri doğrudan çizer.
+    """
+    
+    MARGIN_LEFT = 60
+    MARGIN_RIGHT = 20
+    MARGIN_TOP = 36
+    MARGIN_BOTTOM = 70
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(300)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        
+        self._positions = []
+        self._slot_count = None
+        self._values = []
+        self._tick_positions = []
+        self._tick_labels = []
+        self._title = ""
+        self._value_suffix = " saat"
+        self._x_label = "Tarih"
+        self._message = None
+        
+        self._bar_color = QColor(BAR_COLOR)
+        self._bar_color.setAlphaF(0.8)
+    
+    def set_bars(self, positions, values, tick_positions, tick_labels, title,
+                 value_suffix=' saat', x_label='Tarih', slot_count=None):
+        self._positions = list(positions)
+        self._slot_count = slot_count
+        self._values = list(values)
+        self._tick_positions = list(tick_positions)
+        self._tick_labels = list(tick_labels)
+        self._title = title
+        self._value_suffix = value_suffix
+        self._x_label = x_label
+        self._message = None
+        self.update()
+    
+    def show_message(self, text):
+        self._message = text
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), Qt.GlobalColor.white)
+        
+        if self._message is not None:
+            painter.setFont(QFont("Arial", 12))
+            painter.drawText(QRectF(self.rect()), Qt.AlignmentFlag.AlignCenter, self._message)
+            return
+        
+        plot = QRectF(
+            self.MARGIN_LEFT, self.MARGIN_TOP,
+            max(1, self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT),
+            max(1, self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM)
+        )
+        
+        # Y ekseni sınırlarını hafif genişlet (etiketler için)
+        y_min, y_max = value_range(self._values)
+        x_min, x_max = x_range(self._positions, self._slot_count)
+        x_span = x_max - x_min
+        
+        def to_x(position):
+            return plot.left() + (position - x_min) / x_span * plot.width()
+        
+        def to_y(value):
+            return plot.bottom() - (value - y_min) / (y_max - y_min) * plot.height()
+        
+        self._draw_title(painter)
+        self._draw_y_axis(painter, plot, y_min, y_max, to_y)
+        self._draw_bars(painter, plot, x_span, to_x, to_y)
+        self._draw_x_axis(painter, plot, to_x)
+        
+        painter.setPen(QPen(Qt.GlobalColor.black, 1))
+        painter.drawRect(plot)
+    
+    def _draw_title(self, painter):
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        painter.drawText(QRectF(0, 4, self.width(), self.MARGIN_TOP - 8),
+                         Qt.AlignmentFlag.AlignCenter, self._title)
+    
+    def _draw_y_axis(self, painter, plot, y_min, y_max, to_y):
+        """Y ekseni tiklerini ve kesikli ızgara çizgilerini çiz."""
+        painter.setFont(QFont("Arial", 9))
+        grid_pen = QPen(QColor(128, 128, 128, 100), 1, Qt.PenStyle.DashLine)
+        step = _nice_step(y_max - y_min)
+        
+        value = math.ceil(y_min / step) * step
+        while value <= y_max + 1e-9:
+            y = to_y(value)
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(Qt.GlobalColor.black)
+            painter.drawText(QRectF(0, y - 8, plot.left() - 6, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             f"{round(value, 6) + 0.0:g}")
+            value += step
+        
+        # Eksen başlığı
+        painter.save()
+        painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        painter.translate(14, plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-plot.height() / 2, -10, plot.height(), 20),
+                         Qt.AlignmentFlag.AlignCenter, "Çalışma Süresi (Saat)")
+        painter.restore()
+    
+    def _draw_bars(self, painter, plot, x_span, to_x, to_y):
+        """Çubukları ve yeterince yer varsa değer etiketlerini çiz."""
+        bar_width = BAR_WIDTH / x_span * plot.width()
+        label_font = QFont("Arial", 8, QFont.Weight.Bold)
+        metrics = QFontMetrics(label_font)
+        painter.setFont(label_font)
+        
+        zero_y = to_y(0)
+        
+        for position, value in zip(self._positions, self._values):
+            if value == 0:
+                continue
+            left = to_x(position) - bar_width / 2
+            value_y = to_y(value)
+            top, bottom = min(value_y, zero_y), max(value_y, zero_y)
+            painter.fillRect(QRectF(left, top, bar_width, bottom - top), self._bar_color)
+            
+            # Sadece sığan etiketleri göster; negatif çubukların etiketi altta
+            text = f"{value:.1f}{self._value_suffix}"
+            if metrics.horizontalAdvance(text) <= bar_width * 1.6:
+                painter.setPen(self._bar_color)
+                if value > 0:
+                    painter.drawText(QRectF(left - bar_width, top - 18, bar_width * 3, 16),
+                                     Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom, text)
+                else:
+                    painter.drawText(QRectF(left - bar_width, bottom + 2, bar_width * 3, 16),
+                                     Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, text)
+    
+    def _draw_x_axis(self, painter, plot, to_x):
+        """X ekseni tiklerini 45 derece döndürülmüş etiketlerle çiz."""
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(QFont("Arial", 9))
+        
+        for position, label in zip(self._tick_positions, self._tick_labels):
+            x = to_x(position)
+            painter.drawLine(QPointF(x, plot.bottom()), QPointF(x, plot.bottom() + 4))
+            painter.save()
+            painter.translate(x, plot.bottom() + 8)
+            painter.rotate(-45)
+            painter.drawText(QRectF(-80, -8, 80, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+            painter.restore()
+        
+        painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        painter.drawText(QRectF(plot.left(), self.height() - 20, plot.width(), 18),
+                         Qt.AlignmentFlag.AlignCenter, self._x_label)
@@ -1,7 +1,10 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QSpinBox, QCheckBox, QPushButton, QGroupBox, QFormLayout)
+                           QSpinBox, QCheckBox, QPushButton, QGroupBox, QFormLayout,
+                           QComboBox)
 from PyQt6.QtCore import Qt
 
+from ui.charts import CHART_RENDERERS, DEFAULT_CHART_RENDERER
+
 class SettingsDialog(QDialog):
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
@@ -53,6 +56,17 @@ class SettingsDialog(QDialog):
         
         main_layout.addWidget(notification_group)
         
+        # Görünüm ayarları grubu
+        appearance_group = QGroupBox("Görünüm Ayarları")
+        appearance_layout = QFormLayout(appearance_group)
+        
+        self.chart_renderer_combo = QComboBox()
+        for name, title in CHART_RENDERERS.items():
+            self.chart_renderer_combo.addItem(title, name)
+        appearance_layout.addRow("İstatistik Grafiği:", self.chart_renderer_combo)
+        
+        main_layout.addWidget(appearance_group)
+        
         # Butonlar
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -77,6 +91,11 @@ class SettingsDialog(QDialog):
         self.long_break_spinbox.setValue(settings['long_break_duration'])
         self.sessions_spinbox.setValue(settings['sessions_before_long_break'])
         self.sound_checkbox.setChecked(bool(settings['sound_enabled']))
+        
+        renderer_index = self.chart_renderer_combo.findData(
+            settings.get('chart_renderer') or DEFAULT_CHART_RENDERER
+        )
+        self.chart_renderer_combo.setCurrentIndex(max(0, renderer_index))
     
     def _save_settings(self):
         """Ayarları veritabanına kaydet"""
@@ -85,7 +104,8 @@ class SettingsDialog(QDialog):
             'short_break_duration': self.short_break_spinbox.value(),
             'long_break_duration': self.long_break_spinbox.value(),
             'sessions_before_long_break': self.sessions_spinbox.value(),
-            'sound_enabled': 1 if self.sound_checkbox.isChecked() else 0
+            'sound_enabled': 1 if self.sound_checkbox.isChecked() else 0,
+            'chart_renderer': self.chart_renderer_combo.currentData()
         }
         
         self.db_manager.update_settings(settings)
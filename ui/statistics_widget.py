@@ -3,21 +3,31 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 
-# Matplotlib importları
-import matplotlib
-matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
 from datetime import datetime, timedelta, date
 
-class MatplotlibCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = self.fig.add_subplot(111)
-        
-        FigureCanvas.__init__(self, self.fig)
-        self.setParent(parent)
+import numpy as np
+
+from core import instrumentation
+from core.analytics import (DailySeries, WEEKDAY_NAMES, rolling_mean, week_over_week,
+                            weekday_means, percentiles)
+from core.periods import auto_granularity, bucket_end, bucket_index, bucket_keys, bucket_start
+from ui.background import BackgroundLoader
+from ui.charts import create_chart, DEFAULT_CHART_RENDERER
+
+# Grafik görünümleri (görünüm kombo kutusu sırasıyla)
+VIEW_DAILY, VIEW_ROLLING_7, VIEW_ROLLING_30, VIEW_WEEK_OVER_WEEK, VIEW_WEEKDAY = range(5)
+VIEW_TITLES = ["Günlük Toplam", "7 Günlük Ortalama", "30 Günlük Ortalama",
+               "Haftalık Değişim", "Hafta Günü Ortalaması"]
+
+# Kayan ortalamaların aralığın başında da tam pencereyle hesaplanması için
+# aralıktan önce yüklenen gün sayısı.
+HISTORY_DAYS = 29
+
+# Ayrıntı düzeyine göre tarih etiketi biçimi, eksen ve başlık metinleri
+TICK_FORMATS = {'day': '%d %b', 'week': '%d %b', 'month': '%b %Y', 'year': '%Y'}
+AXIS_LABELS = {'day': "Tarih", 'week': "Hafta", 'month': "Ay", 'year': "Yıl"}
+GRANULARITY_TITLES = {'day': "Günlük", 'week': "Haftalık", 'month': "Aylık", 'year': "Yıllık"}
+
 
 class StatisticsWidget(QWidget):
     def __init__(self, db_manager):
@@ -25,6 +35,9 @@ class StatisticsWidget(QWidget):
         
         self.db_manager = db_manager
         
+        # Sorgu ve hesaplamalar arka planda çalışır.
+        self._loader = BackgroundLoader(self)
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -49,6 +62,14 @@ class StatisticsWidget(QWidget):
         
         filter_layout.addSpacing(20)
         
+        filter_layout.addWidget(QLabel("Görünüm:"))
+        
+        self.view_combo = QComboBox()
+        self.view_combo.addItems(VIEW_TITLES)
+        filter_layout.addWidget(self.view_combo)
+        
+        filter_layout.addSpacing(20)
+        
         # Özel tarih aralığı için
         self.start_date_label = QLabel("Başlangıç:")
         filter_layout.addWidget(self.start_date_label)
@@ -74,6 +95,12 @@ class StatisticsWidget(QWidget):
         
         filter_layout.addStretch()
         
+        # Yükleme göstergesi
+        self.loading_label = QLabel("Yükleniyor...")
+        self.loading_label.setStyleSheet("color: gray;")
+        self.loading_label.setVisible(False)
+        filter_layout.addWidget(self.loading_label)
+        
         main_layout.addLayout(filter_layout)
         
         # Özet bilgiler
@@ -122,18 +149,53 @@ class StatisticsWidget(QWidget):
         
         summary_layout.addLayout(session_layout)
         
+        # Çalışılan günlerin medyan ve %90 yüzdelik süresi
+        percentile_layout = QVBoxLayout()
+        percentile_label = QLabel("Medyan / %90 Gün")
+        percentile_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        percentile_layout.addWidget(percentile_label)
+        
+        self.percentile_label = QLabel("0s 0dk / 0s 0dk")
+        self.percentile_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.percentile_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        percentile_layout.addWidget(self.percentile_label)
+        
+        summary_layout.addLayout(percentile_layout)
+        
         main_layout.addWidget(summary_frame)
         
-        # Grafik alanı
-        self.canvas = MatplotlibCanvas(self, width=10, height=5, dpi=100)
+        # Grafik alanı - çizici ayarlardan seçilir
+        self.main_layout = main_layout
+        self.renderer_name = self._configured_renderer()
+        self.canvas = create_chart(self.renderer_name, self)
         main_layout.addWidget(self.canvas)
         
         # İstatistikleri güncelle
         self.update_statistics()
     
+    def _configured_renderer(self):
+        """Ayarlarda seçili grafik çizicisinin adını döndür"""
+        return self.db_manager.get_settings().get('chart_renderer') or DEFAULT_CHART_RENDERER
+    
+    def apply_settings(self):
+        """Grafik çizicisi ayarı değiştiyse grafiği yeni çiziciyle değiştir"""
+        renderer_name = self._configured_renderer()
+        if renderer_name == self.renderer_name:
+            return
+        
+        new_canvas = create_chart(renderer_name, self)
+        self.main_layout.replaceWidget(self.canvas, new_canvas)
+        self.canvas.deleteLater()
+        self.canvas = new_canvas
+        self.renderer_name = renderer_name
+        
+        # Sonuç önbellekten gelir; yeni çizici hemen doldurulur
+        self.update_statistics()
+    
     def _connect_signals(self):
         """Sinyalleri bağla"""
         self.period_combo.currentIndexChanged.connect(self._on_period_changed)
+        self.view_combo.currentIndexChanged.connect(self.update_statistics)
         self.start_date_edit.dateChanged.connect(self.update_statistics)
         self.end_date_edit.dateChanged.connect(self.update_statistics)
     
@@ -170,33 +232,138 @@ class StatisticsWidget(QWidget):
             date_edit = self.end_date_edit.date()
             end_date = date(date_edit.year(), date_edit.month(), date_edit.day())
         
-        # Veritabanından istatistikleri çek
-        statistics = self.db_manager.get_statistics(start_date, end_date)
+        # Sorgu ve toplama arka planda yapılır.
+        view = self.view_combo.currentIndex()
+        self.loading_label.setVisible(True)
+        self._loader.submit(
+            "statistics",
+            lambda: self._collect_statistics(start_date, end_date, view),
+            self._show_statistics,
+            self._on_statistics_failed
+        )
+    
+    def _collect_statistics(self, start_date, end_date, view):
+        """İstatistikleri çek, özetleri ve grafik verilerini hazırla (iş parçacığında)"""
+        history_start = start_date - timedelta(days=HISTORY_DAYS)
+        columns = self.db_manager.get_statistics(history_start, end_date, columnar=True)
         
-        # Hiç veri yoksa boş grafik göster
-        if not statistics:
-            self._clear_graph()
-            self._update_summary(0, 0, 0)
-            return
+        history = DailySeries.from_columns(columns, history_start, end_date)
+        series = history.slice_from(HISTORY_DAYS)
         
-        # Grafik verilerini oluştur
-        dates = [datetime.fromisoformat(stat['work_date']) for stat in statistics]
-        durations = [stat['total_duration'] / 3600.0 for stat in statistics]  # Saate çevir
+        # Hiç veri yoksa boş sonuç döndür
+        if not series.durations.any():
+            return None
         
         # Toplam süre ve seans sayısı
-        total_duration = sum(stat['total_duration'] for stat in statistics)
-        total_sessions = sum(stat['session_count'] for stat in statistics)
+        total_duration = float(series.durations.sum())
+        total_sessions = int(series.counts.sum())
         
         # Ortalama günlük süre (çalışılan günler üzerinden)
-        avg_duration = total_duration / len(statistics)
+        worked_days = int(np.count_nonzero(series.durations))
+        avg_duration = total_duration / worked_days
+        
+        day_percentiles = percentiles(series.durations, (50, 90))
+        
+        summary = (total_duration, avg_duration, total_sessions,
+                   day_percentiles[50], day_percentiles[90])
+        
+        # Uzun aralıklarda çubuk sayısı sınırlı kalsın diye kovalara geçilir.
+        granularity = auto_granularity(start_date, end_date)
+        if view == VIEW_DAILY and granularity != 'day':
+            buckets = self.db_manager.get_statistics(start_date, end_date, granularity, columnar=True)
+            chart = self._build_bucket_chart(buckets, start_date, end_date, granularity)
+        else:
+            chart = self._build_chart(history, series, view, granularity)
+        return summary, chart + (granularity,)
+    
+    def _build_chart(self, history, series, view, granularity='day'):
+        """Seçili görünüm için çubuk konumları, değerleri ve tikleri hazırla"""
+        if view == VIEW_WEEKDAY:
+            values = weekday_means(series.durations, series.weekdays()) / 3600.0
+            positions = list(range(7))
+            return positions, values.tolist(), positions, WEEKDAY_NAMES, "Hafta Günü", 7
+        
+        if view == VIEW_ROLLING_7:
+            values = rolling_mean(history.durations, 7)[HISTORY_DAYS:]
+            positions = np.arange(len(series))
+        elif view == VIEW_ROLLING_30:
+            values = rolling_mean(history.durations, 30)[HISTORY_DAYS:]
+            positions = np.arange(len(series))
+        elif view == VIEW_WEEK_OVER_WEEK:
+            values = np.nan_to_num(week_over_week(history.durations)[HISTORY_DAYS:])
+            positions = np.arange(len(series))
+        else:
+            # Günlük toplamda yalnızca çalışılan günler çizilir; boş günler boşluk kalır.
+            positions = np.flatnonzero(series.durations)
+            values = series.durations[positions]
+        
+        if granularity != 'day':
+            # Kayan seriler her kovanın son günündeki değeriyle seyreltilir.
+            last_date = series.date_at(len(series) - 1)
+            keys = bucket_keys(granularity, series.start_date, last_date)
+            offsets = [(min(bucket_end(granularity, key), last_date) - series.start_date).days
+                       for key in keys]
+            values = values[offsets]
+            positions = np.arange(len(keys))
+            tick_positions, tick_labels = self._bucket_ticks(granularity, keys)
+            return (positions.tolist(), (values / 3600.0).tolist(), tick_positions, tick_labels,
+                    AXIS_LABELS[granularity], len(keys))
+        
+        # Yaklaşık 7 tarih etiketi göster
+        span = len(series)
+        step = max(1, span // 7)
+        tick_positions = list(range(0, span, step))
+        tick_labels = [series.date_at(offset).strftime('%d %b') for offset in tick_positions]
+        
+        return (positions.tolist(), (values / 3600.0).tolist(), tick_positions, tick_labels,
+                "Tarih", span)
+    
+    def _build_bucket_chart(self, buckets, start_date, end_date, granularity):
+        """Hafta, ay veya yıl toplamlarından (sütunlu sonuç) çubukları hazırla"""
+        keys = bucket_keys(granularity, start_date, end_date)
+        first_index = bucket_index(granularity, keys[0])
+        
+        # bucket_index yalnızca aritmetik kullandığı için tüm sütuna birden uygulanır.
+        work_dates = np.asarray(buckets.work_date, dtype=np.int64)
+        positions = (bucket_index(granularity, work_dates) - first_index).tolist()
+        values = (np.asarray(buckets.total_duration, dtype=np.int64) / 3600.0).tolist()
+        tick_positions, tick_labels = self._bucket_ticks(granularity, keys)
+        
+        return positions, values, tick_positions, tick_labels, AXIS_LABELS[granularity], len(keys)
+    
+    def _bucket_ticks(self, granularity, keys):
+        """Kova anahtarları için yaklaşık 7 etiket konumu ve metni"""
+        step = max(1, len(keys) // 7)
+        tick_positions = list(range(0, len(keys), step))
+        tick_format = TICK_FORMATS[granularity]
+        tick_labels = [bucket_start(granularity, keys[offset]).strftime(tick_format)
+                       for offset in tick_positions]
+        return tick_positions, tick_labels
+    
+    def _show_statistics(self, result):
+        """Hazırlanan istatistikleri göster"""
+        self.loading_label.setVisible(False)
+        
+        # Hiç veri yoksa boş grafik göster
+        if result is None:
+            self._clear_graph()
+            self._update_summary(0, 0, 0, 0, 0)
+            return
+        
+        summary, chart = result
         
         # Özet bilgileri güncelle
-        self._update_summary(total_duration, avg_duration, total_sessions)
+        self._update_summary(*summary)
         
         # Grafiği çiz
-        self._plot_graph(dates, durations)
+        self._plot_graph(chart)
+    
+    def _on_statistics_failed(self, message):
+        """Yükleme hatasını grafikte göster; özetler önceki haliyle kalır"""
+        self.loading_label.setVisible(False)
+        self.canvas.show_message(f"İstatistikler yüklenemedi: {message}")
     
-    def _update_summary(self, total_duration, avg_duration, total_sessions):
+    def _update_summary(self, total_duration, avg_duration, total_sessions, median_duration, p90_duration):
         """Özet bilgileri güncelle"""
         # Toplam süre
         hours, remainder = divmod(total_duration, 3600)
@@ -210,55 +377,30 @@ class StatisticsWidget(QWidget):
         
         # Toplam seans
         self.session_count_label.setText(str(total_sessions))
-    
-    def _plot_graph(self, dates, durations):
-        """Grafiği çiz"""
-        # Önceki grafiği temizle
-        self.canvas.axes.clear()
-        
-        # Grafiği daha anlaşılır hale getir - sadece çubuk grafik kullan
-        bars = self.canvas.axes.bar(dates, durations, width=0.6, color='#0066cc', alpha=0.8)
-        
-        # Çubukların üzerine süreleri yaz
-        for bar, duration in zip(bars, durations):
-            height = bar.get_height()
-            if height > 0:  # Sadece süresi olan günlerde göster
-                self.canvas.axes.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                     f'{height:.1f} saat', ha='center', va='bottom', 
-                                     fontsize=9, color='#0066cc', fontweight='bold')
-        
-        # Eksenleri ayarla
-        self.canvas.axes.set_ylabel('Çalışma Süresi (Saat)', fontsize=11, fontweight='bold')
-        self.canvas.axes.set_xlabel('Tarih', fontsize=11, fontweight='bold')
-        
-        # Tarih formatını ayarla - daha anlaşılır olması için
-        self.canvas.axes.xaxis.set_major_formatter(mdates.DateFormatter('%d %b'))
-        self.canvas.axes.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates) // 7)))
-        
-        # Izgara çizgilerini ekle - daha belirgin ve anlaşılır olması için
-        self.canvas.axes.grid(axis='y', linestyle='--', alpha=0.4, color='gray')
-        
-        # X ekseni etiketlerini döndür
-        for label in self.canvas.axes.get_xticklabels():
-            label.set_rotation(45)
-            label.set_ha('right')
-        
-        # Grafik başlığı ekle
-        period_text = self.period_combo.currentText()
-        self.canvas.axes.set_title(f"{period_text} Çalışma Süreleri", fontsize=12, fontweight='bold')
         
-        # Y ekseni maksimum değerini hafif yükselt (etiketler için)
-        if durations:
-            y_max = max(durations) * 1.2
-            self.canvas.axes.set_ylim(0, y_max)
+        # Medyan ve %90 yüzdelik
+        parts = []
+        for value in (median_duration, p90_duration):
+            hours, remainder = divmod(value, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            parts.append(f"{int(hours)}s {int(minutes)}dk")
+        self.percentile_label.setText(" / ".join(parts))
+    
+    @instrumentation.timed('statistics.plot_graph')
+    def _plot_graph(self, chart):
+        """Grafiği güncelle"""
+        positions, values, tick_positions, tick_labels, x_label, slot_count, granularity = chart
         
-        self.canvas.fig.tight_layout()
-        self.canvas.draw()
+        period_text = self.period_combo.currentText()
+        if self.view_combo.currentIndex() == VIEW_DAILY:
+            title = f"{period_text} Çalışma Süreleri"
+            if granularity != 'day':
+                title = f"{title} ({GRANULARITY_TITLES[granularity]} Toplam)"
+        else:
+            title = f"{period_text} - {self.view_combo.currentText()}"
+        self.canvas.set_bars(positions, values, tick_positions, tick_labels, title, x_label=x_label,
+                             slot_count=slot_count)
     
     def _clear_graph(self):
         """Grafiği temizle"""
-        self.canvas.axes.clear()
-        self.canvas.axes.text(0.5, 0.5, "Bu tarih aralığında veri bulunamadı.", 
-                             ha='center', va='center', fontsize=12)
-        self.canvas.fig.tight_layout()
-        self.canvas.draw() 
\ No newline at end of file
+        self.canvas.show_message("Bu tarih aralığında veri bulunamadı.")
@@ -1,16 +1,19 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                            QLabel, QFrame, QProgressBar, QComboBox)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QEvent
 from PyQt6.QtGui import QFont, QIcon
 import os
-from datetime import datetime, date, timedelta
 
 class TimerWidget(QWidget):
-    def __init__(self, timer_core, pomodoro_manager):
+    def __init__(self, timer_core, pomodoro_manager, daily_totals):
         super().__init__()
         
         self.timer_core = timer_core
         self.pomodoro_manager = pomodoro_manager
+        self.daily_totals = daily_totals
+        
+        # Pencere küçültme olaylarını izlemek için filtre kurulan pencere
+        self._watched_window = None
         
         self._setup_ui()
         self._connect_signals()
@@ -18,8 +21,8 @@ class TimerWidget(QWidget):
         # Başlangıç süresini ayarla (çalışma süresi)
         self._update_initial_time()
         
-        # Günlük çalışma süresini güncelle.
-        self._update_daily_stats()
+        # Günlük çalışma süresini göster.
+        self._show_daily_total(self.daily_totals.today_total())
     
     def _setup_ui(self):
         """Sayaç arayüzünü oluştur"""
@@ -132,7 +135,36 @@ class TimerWidget(QWidget):
         
         # Pomodoro sinyalleri
         self.pomodoro_manager.session_changed.connect(self._on_session_changed)
-        self.pomodoro_manager.session_completed.connect(self._on_session_completed)
+        
+        # Bugünkü toplam bellekte güncellenir; tamamlanan seans sorgu gerektirmez.
+        self.daily_totals.changed.connect(self._show_daily_total)
+    
+    def showEvent(self, event):
+        """Sekme veya pencere görünür olduğunda sayacı yeniden eşitle"""
+        super().showEvent(event)
+        window = self.window()
+        if window is not self._watched_window:
+            if self._watched_window is not None:
+                self._watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self._watched_window = window
+        self._update_display_active()
+    
+    def hideEvent(self, event):
+        """Sekme değiştiğinde veya pencere gizlendiğinde saniye güncellemelerini durdur"""
+        super().hideEvent(event)
+        self._update_display_active()
+    
+    def eventFilter(self, watched, event):
+        # Küçültülen pencerede sayaç görünmez; her platform gizleme olayı göndermez.
+        if watched is self._watched_window and event.type() == QEvent.Type.WindowStateChange:
+            self._update_display_active()
+        return super().eventFilter(watched, event)
+    
+    def _update_display_active(self):
+        """Sayaç ekranı görünüyorsa saniyelik güncellemeleri aç, değilse kapat"""
+        active = self.isVisible() and not self.window().isMinimized()
+        self.timer_core.set_display_active(active)
     
     def _on_start_clicked(self):
         """Başlat butonu tıklandığında"""
@@ -154,14 +186,16 @@ class TimerWidget(QWidget):
     
     def _on_timer_tick(self, elapsed_seconds):
         """Sayaç her saniye çalıştığında"""
-        # Kalan süreyi göster
+        # Kalan süreyi göster; metin değişmediyse yeniden çizim yapılmaz.
         remaining_time = self.timer_core.get_remaining_time()
-        self.time_display.setText(remaining_time)
+        if remaining_time != self.time_display.text():
+            self.time_display.setText(remaining_time)
         
         # İlerleme çubuğunu güncelle
         if self.timer_core.duration > 0:
-            progress = min(100, (elapsed_seconds / self.timer_core.duration) * 100)
-            self.progress_bar.setValue(int(progress))
+            progress = int(min(100, (elapsed_seconds / self.timer_core.duration) * 100))
+            if progress != self.progress_bar.value():
+                self.progress_bar.setValue(progress)
     
     def _on_timer_state_changed(self, state):
         """Sayaç durumu değiştiğinde"""
@@ -227,12 +261,6 @@ class TimerWidget(QWidget):
         minutes, seconds = divmod(remainder, 60)
         self.time_display.setText(f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}")
     
-    def _on_session_completed(self, session_type):
-        """Bir seans tamamlandığında"""
-        if session_type == "work":
-            # Çalışma seansı tamamlandığında günlük istatistikleri güncelle
-            self._update_daily_stats()
-    
     def _update_initial_time(self):
         """Açılışta ayarlardaki çalışma süresini göster"""
         # Varsayılan olarak çalışma süresini göster
@@ -241,29 +269,11 @@ class TimerWidget(QWidget):
         minutes, seconds = divmod(remainder, 60)
         self.time_display.setText(f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}")
     
-    def _update_daily_stats(self):
-        """Bugünkü toplam çalışma süresini hesapla ve göster"""
-        # Bugünün başlangıcı (00:00)
-        today = date.today()
-        today_start = datetime.combine(today, datetime.min.time())
-        
-        # Bugünün sonu (23:59:59)
-        today_end = datetime.combine(today, datetime.max.time())
+    def _show_daily_total(self, total_seconds):
+        """Bugünkü toplam çalışma süresini göster"""
+        # Saatlere ve dakikalara dönüştür
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
         
-        try:
-            # Veritabanından bugünkü çalışma seanslarını al
-            sessions = self.pomodoro_manager.db_manager.get_sessions_by_date(today)
-            
-            # Toplam süreyi hesapla (sadece tamamlanan çalışma seansları)
-            total_seconds = sum(session['duration'] for session in sessions 
-                               if session['is_completed'] and session['session_type'] == 'work')
-            
-            # Saatlere ve dakikalara dönüştür
-            hours, remainder = divmod(total_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            
-            # Etiketi güncelle
-            self.today_total_label.setText(f"Bugün toplam: {int(hours)} saat {int(minutes)} dakika")
-        except Exception as e:
-            # Hata durumunda varsayılan mesajı göster
-            self.today_total_label.setText("Bugün toplam: 0 saat 0 dakika") 
\ No newline at end of file
+        # Etiketi güncelle
+        self.today_total_label.setText(f"Bugün toplam: {int(hours)} saat {int(minutes)} dakika")